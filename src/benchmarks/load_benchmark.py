@@ -0,0 +1,670 @@
+"""
+Нагрузочный тест приложения целиком: запросы проходят через ASGI-приложение со всеми
+middleware, сервисами, Postgres и Redis, но без сети и HTTP-сервера.
+
+Postgres берется из переменных окружения PG_* так же, как в приложении. SQLite не
+подходит на его роль: схема использует массивы, ANY и полнотекстовый поиск.
+Тест записывает данные, поэтому лучше указать отдельную БД с примененными миграциями
+(alembic upgrade head).
+Redis по умолчанию заменяется на fakeredis в памяти процесса (dev-зависимость,
+poetry install --with dev), с --redis real используются серверы из переменных
+окружения REDIS_*.
+
+Запуск из директории src:
+    python -m benchmarks.load_benchmark --mode rest --concurrency 1 8 32
+    python -m benchmarks.load_benchmark --mode graphql --duration 5 --output out.json
+
+Результат - JSON со списком замеров: сценарий, уровень конкурентности, количество
+запросов и ошибок, пропускная способность и задержки p50/p95/p99 в миллисекундах
+"""
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from typing import Awaitable, Callable
+
+HTTP_SUCCESS_STATUSES = range(200, 400)
+SCENARIOS = ("sign_up", "sign_in", "create", "retrieve", "update", "delete", "popular")
+BENCHMARK_PASSWORD = "Benchmark1"
+
+
+class ASGIClient:
+    """
+    Клиент, вызывающий ASGI-приложение напрямую, без сети
+    """
+
+    def __init__(self, app: Callable) -> None:
+        """
+        Инициализировать переменные
+        :param app: ASGI-приложение
+        """
+
+        self.app = app
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: dict | list | None = None,
+        query: str = "",
+        token: str | None = None,
+    ) -> tuple[int, bytes]:
+        """
+        Выполнить запрос
+        :param method: HTTP-метод
+        :param path: путь
+        :param body: тело запроса, сериализуемое в JSON
+        :param query: строка запроса
+        :param token: access-токен
+        :return: код и тело ответа
+        """
+
+        content = json.dumps(body).encode("utf-8") if body is not None else b""
+        headers = [
+            (b"host", b"benchmark"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(content)).encode("latin-1")),
+        ]
+
+        if token is not None:
+            headers.append((b"authorization", f"Bearer {token}".encode("latin-1")))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode("utf-8"),
+            "query_string": query.encode("utf-8"),
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("benchmark", 80),
+            "state": {},
+        }
+        is_body_sent = False
+        status = 0
+        chunks = []
+
+        async def receive() -> dict:
+            nonlocal is_body_sent
+
+            if is_body_sent:
+                await asyncio.Event().wait()
+
+            is_body_sent = True
+
+            return {"type": "http.request", "body": content, "more_body": False}
+
+        async def send(message: dict) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+
+        return status, b"".join(chunks)
+
+
+class Api:
+    """
+    Вызовы эндпоинтов приложения в режимах REST и GraphQL
+    """
+
+    def __init__(self, client: ASGIClient, is_rest: bool) -> None:
+        """
+        Инициализировать переменные
+        :param client: ASGI-клиент
+        :param is_rest: флаг о том, что приложение работает в режиме REST
+        """
+
+        self.client = client
+        self.is_rest = is_rest
+
+    async def __graphql(
+        self, path: str, query: str, token: str | None = None
+    ) -> tuple[int, dict | None]:
+        """
+        Выполнить GraphQL-запрос. Ошибки GraphQL считаются неуспешным ответом
+        :param path: путь GraphQL-роутера
+        :param query: текст запроса
+        :param token: access-токен
+        :return: код ответа и данные
+        """
+
+        status, body = await self.client.request(
+            "POST", path, {"query": query}, token=token
+        )
+        result = json.loads(body) if body else {}
+
+        if result.get("errors"):
+            return 500, None
+
+        return status, result.get("data")
+
+    async def sign_up(self, name: str) -> tuple[int, str | None]:
+        """
+        Зарегистрировать пользователя
+        :param name: имя пользователя
+        :return: код ответа и access-токен
+        """
+
+        if self.is_rest:
+            status, body = await self.client.request(
+                "POST",
+                "/auth/sign-up",
+                {"name": name, "password": BENCHMARK_PASSWORD},
+            )
+
+            return status, json.loads(body)["access_token"] if status == 200 else None
+
+        status, data = await self.__graphql(
+            "/auth-graphql",
+            'mutation { signUp(userInitData: {name: "%s", password: "%s"}) '
+            "{ accessToken } }" % (name, BENCHMARK_PASSWORD),
+        )
+
+        return status, data["signUp"]["accessToken"] if data else None
+
+    async def sign_in(self, name: str) -> int:
+        """
+        Войти в приложение
+        :param name: имя пользователя
+        :return: код ответа
+        """
+
+        if self.is_rest:
+            status, _ = await self.client.request(
+                "POST",
+                "/auth/sign-in",
+                {"name": name, "password": BENCHMARK_PASSWORD},
+            )
+
+            return status
+
+        status, _ = await self.__graphql(
+            "/auth-graphql",
+            '{ signIn(userInitData: {name: "%s", password: "%s"}) { accessToken } }'
+            % (name, BENCHMARK_PASSWORD),
+        )
+
+        return status
+
+    async def create_articles(
+        self, token: str, topic_id: str, texts: list[str]
+    ) -> list[str]:
+        """
+        Создать статьи пакетом
+        :param token: access-токен
+        :param topic_id: идентификатор темы статей
+        :param texts: тексты статей
+        :return: идентификаторы созданных статей
+        """
+
+        if self.is_rest:
+            status, body = await self.client.request(
+                "POST",
+                "/articles/bulk",
+                [{"topic_id": topic_id, "text": text} for text in texts],
+                token=token,
+            )
+            results = json.loads(body) if status == 200 else []
+        else:
+            articles_info = ", ".join(
+                '{topicId: "%s", text: %s}' % (topic_id, json.dumps(text))
+                for text in texts
+            )
+            _, data = await self.__graphql(
+                "/articles-graphql",
+                "mutation { createArticles(articlesInfo: [%s]) { article { id } } }"
+                % articles_info,
+                token,
+            )
+            results = data["createArticles"] if data else []
+
+        return [result["article"]["id"] for result in results if result["article"]]
+
+    async def create(self, token: str, topic_id: str, text: str) -> int:
+        """
+        Создать статью
+        :param token: access-токен
+        :param topic_id: идентификатор темы статьи
+        :param text: текст статьи
+        :return: код ответа
+        """
+
+        if self.is_rest:
+            status, _ = await self.client.request(
+                "POST",
+                "/articles/create",
+                {"topic_id": topic_id, "text": text},
+                token=token,
+            )
+
+            return status
+
+        status, _ = await self.__graphql(
+            "/articles-graphql",
+            'mutation { createArticle(articleInfo: {topicId: "%s", text: %s}) { id } }'
+            % (topic_id, json.dumps(text)),
+            token,
+        )
+
+        return status
+
+    async def retrieve(self, article_id: str) -> int:
+        """
+        Получить статью
+        :param article_id: идентификатор статьи
+        :return: код ответа
+        """
+
+        if self.is_rest:
+            status, _ = await self.client.request("GET", f"/articles/{article_id}")
+
+            return status
+
+        status, _ = await self.__graphql(
+            "/articles-graphql",
+            '{ getArticleById(articleId: "%s") { id text views user { name } '
+            "topic { name } } }" % article_id,
+        )
+
+        return status
+
+    async def update(self, token: str, article_id: str, text: str) -> int:
+        """
+        Обновить статью
+        :param token: access-токен автора статьи
+        :param article_id: идентификатор статьи
+        :param text: новый текст статьи
+        :return: код ответа
+        """
+
+        if self.is_rest:
+            status, _ = await self.client.request(
+                "PATCH",
+                "/articles/update",
+                {"id": article_id, "text": text},
+                token=token,
+            )
+
+            return status
+
+        status, _ = await self.__graphql(
+            "/articles-graphql",
+            'mutation { updateArticle(articleInfo: {id: "%s", text: %s}) { id } }'
+            % (article_id, json.dumps(text)),
+            token,
+        )
+
+        return status
+
+    async def delete(self, token: str, article_id: str) -> int:
+        """
+        Удалить статью. В режиме GraphQL удаления нет
+        :param token: access-токен автора статьи
+        :param article_id: идентификатор статьи
+        :return: код ответа
+        """
+
+        status, _ = await self.client.request(
+            "DELETE", "/articles/delete", query=f"id={article_id}", token=token
+        )
+
+        return status
+
+    async def popular(self) -> int:
+        """
+        Получить популярные статьи
+        :return: код ответа
+        """
+
+        if self.is_rest:
+            status, _ = await self.client.request("GET", "/articles/popular")
+
+            return status
+
+        status, _ = await self.__graphql(
+            "/articles-graphql", "{ getPopularArticles { id text views } }"
+        )
+
+        return status
+
+
+def get_percentile(sorted_latencies: list[float], percentile: float) -> float:
+    """
+    Получить перцентиль задержки методом ближайшего ранга
+    :param sorted_latencies: отсортированные задержки
+    :param percentile: перцентиль от 0 до 100
+    :return: значение перцентиля
+    """
+
+    rank = int(len(sorted_latencies) * percentile / 100 + 0.5)
+
+    return sorted_latencies[max(0, min(len(sorted_latencies), rank) - 1)]
+
+
+async def run_scenario(
+    operation: Callable[[int], Awaitable[int | None]],
+    concurrency: int,
+    duration_in_sec: float,
+) -> dict:
+    """
+    Выполнять операцию с заданной конкурентностью в течение заданного времени
+    :param operation: операция, принимающая номер вызова и возвращающая код ответа.
+    None означает, что данные для операции закончились
+    :param concurrency: количество одновременно работающих клиентов
+    :param duration_in_sec: длительность замера в секундах
+    :return: результаты замера
+    """
+
+    latencies = []
+    errors = 0
+    counter = itertools.count()
+    deadline = time.perf_counter() + duration_in_sec
+
+    async def worker() -> None:
+        nonlocal errors
+
+        while time.perf_counter() < deadline:
+            started_at = time.perf_counter()
+
+            try:
+                status = await operation(next(counter))
+            except Exception:
+                status = 500
+
+            if status is None:
+                return
+
+            latencies.append(time.perf_counter() - started_at)
+
+            if status not in HTTP_SUCCESS_STATUSES:
+                errors += 1
+
+    started_at = time.perf_counter()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    elapsed = time.perf_counter() - started_at
+    latencies.sort()
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "duration_in_sec": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            name: round(value * 1000, 3)
+            for name, value in (
+                ("mean", statistics.fmean(latencies) if latencies else 0.0),
+                ("p50", get_percentile(latencies, 50) if latencies else 0.0),
+                ("p95", get_percentile(latencies, 95) if latencies else 0.0),
+                ("p99", get_percentile(latencies, 99) if latencies else 0.0),
+            )
+        },
+    }
+
+
+async def run_benchmark(arguments: argparse.Namespace) -> dict:
+    """
+    Подготовить приложение и данные и выполнить все сценарии
+    :param arguments: аргументы командной строки
+    :return: результаты замеров
+    """
+
+    import main
+    from services import article_service
+    from tools import consts, enums
+
+    if arguments.redis == "fake":
+        from dependency_injector import providers
+
+        from tests import fake_redis
+
+        main.session_container.redis_article_session_factory.override(
+            providers.Singleton(fake_redis.FakeRedisSessionFactory)
+        )
+        main.session_container.redis_token_session_factory.override(
+            providers.Singleton(fake_redis.FakeRedisSessionFactory)
+        )
+
+    modules = [
+        "services.article_service",
+        "services.auth_service",
+        "services.user_service",
+        "services.topic_service",
+    ]
+
+    for container in (
+        main.session_container,
+        main.repository_container,
+        main.uow_container,
+        main.cache_container,
+    ):
+        container.wire(modules=modules)
+
+    api = Api(ASGIClient(main.app), arguments.mode == "rest")
+    # Имена пользователей ограничены по длине, поэтому идентификатор запуска короткий
+    run_id = uuid.uuid4().hex[:6]
+    topic_ids = [str(topic.id) for topic in enums.ArticleTopic]
+    results = []
+
+    async with main.app.router.lifespan_context(main.app):
+        users = {}
+
+        for index in range(arguments.users):
+            name = f"u{run_id}_{index}"
+            status, users[name] = await api.sign_up(name)
+
+            if users[name] is None:
+                raise RuntimeError(
+                    f"Не удалось зарегистрировать пользователя, код ответа {status}"
+                )
+
+        article_owners = {}
+        user_tokens = list(users.values())
+
+        for index in range(0, arguments.articles, arguments.batch_size):
+            token = user_tokens[index // arguments.batch_size % len(user_tokens)]
+            texts = [
+                f"Статья {run_id} {number}: " + "текст " * random.randint(50, 500)
+                for number in range(
+                    index, min(index + arguments.batch_size, arguments.articles)
+                )
+            ]
+
+            for article_id in await api.create_articles(
+                token, random.choice(topic_ids), texts
+            ):
+                article_owners[article_id] = token
+
+        for article_id in random.sample(
+            list(article_owners), min(len(article_owners), 100)
+        ):
+            for _ in range(random.randint(1, 20)):
+                await api.retrieve(article_id)
+
+        await article_service.ArticleService.flush_article_views()
+        # Все статьи теста свежие, поэтому популярные выбираются за последние сутки
+        await article_service.ArticleService.update_popular_articles(
+            datetime.datetime.now() - datetime.timedelta(days=1),
+            consts.Articles.POPULAR_ARTICLES_COUNT,
+        )
+
+        article_ids = list(article_owners)
+        user_names = list(users)
+        delete_pool = []
+
+        new_user_numbers = itertools.count()
+
+        async def sign_up(number: int) -> int:
+            status, _ = await api.sign_up(f"n{run_id}_{next(new_user_numbers)}")
+
+            return status
+
+        async def sign_in(number: int) -> int:
+            return await api.sign_in(user_names[number % len(user_names)])
+
+        async def create(number: int) -> int:
+            return await api.create(
+                user_tokens[number % len(user_tokens)],
+                random.choice(topic_ids),
+                f"Новая статья {number} " + "текст " * 100,
+            )
+
+        async def retrieve(number: int) -> int:
+            return await api.retrieve(random.choice(article_ids))
+
+        async def update(number: int) -> int:
+            article_id = random.choice(article_ids)
+
+            return await api.update(
+                article_owners[article_id], article_id, f"Обновление {number}"
+            )
+
+        async def delete(number: int) -> int | None:
+            if not delete_pool:
+                return
+
+            return await api.delete(user_tokens[0], delete_pool.pop())
+
+        async def popular(number: int) -> int:
+            return await api.popular()
+
+        operations = {
+            "sign_up": sign_up,
+            "sign_in": sign_in,
+            "create": create,
+            "retrieve": retrieve,
+            "update": update,
+            "delete": delete,
+            "popular": popular,
+        }
+
+        for scenario in arguments.scenarios:
+            for concurrency in arguments.concurrency:
+                if scenario == "delete":
+                    if not api.is_rest:
+                        results.append(
+                            {
+                                "scenario": scenario,
+                                "concurrency": concurrency,
+                                "skipped": "В режиме GraphQL нет удаления статей",
+                            }
+                        )
+
+                        continue
+
+                    delete_pool.clear()
+
+                    for index in range(0, arguments.delete_pool, arguments.batch_size):
+                        batch_size = min(
+                            arguments.batch_size, arguments.delete_pool - index
+                        )
+                        delete_pool.extend(
+                            await api.create_articles(
+                                user_tokens[0],
+                                topic_ids[0],
+                                ["Статья для удаления"] * batch_size,
+                            )
+                        )
+
+                result = await run_scenario(
+                    operations[scenario], concurrency, arguments.duration
+                )
+                results.append({"scenario": scenario, **result})
+
+                print(
+                    f"{scenario} x{concurrency}: {result['throughput_rps']} rps, "
+                    f"p50 {result['latency_ms']['p50']} мс, "
+                    f"p99 {result['latency_ms']['p99']} мс, "
+                    f"ошибок {result['errors']}",
+                    file=sys.stderr,
+                )
+
+    return {
+        "mode": arguments.mode,
+        "redis": arguments.redis,
+        "users": arguments.users,
+        "articles": len(article_owners),
+        "duration_in_sec": arguments.duration,
+        "results": results,
+    }
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Разобрать аргументы командной строки
+    :return: аргументы командной строки
+    """
+
+    parser = argparse.ArgumentParser(description="Нагрузочный тест приложения")
+    parser.add_argument("--mode", choices=("rest", "graphql"), default="rest")
+    parser.add_argument("--redis", choices=("fake", "real"), default="fake")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32],
+        help="уровни конкурентности",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10, help="длительность замера в секундах"
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument(
+        "--users", type=int, default=20, help="количество пользователей"
+    )
+    parser.add_argument(
+        "--articles", type=int, default=2000, help="количество статей"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="размер пакета статей"
+    )
+    parser.add_argument(
+        "--delete-pool",
+        type=int,
+        default=2000,
+        help="количество статей, создаваемых для сценария удаления",
+    )
+    parser.add_argument("--output", help="файл для результатов, по умолчанию stdout")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    # Режим работы читается из окружения при импорте приложения
+    os.environ["IS_REST"] = str(arguments.mode == "rest")
+
+    # Логи приложения пишутся в stdout и не должны смешиваться с результатами
+    with contextlib.redirect_stdout(sys.stderr):
+        results = asyncio.run(run_benchmark(arguments))
+
+    report = json.dumps(results, ensure_ascii=False, indent=2)
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            file.write(report)
+    else:
+        print(report)
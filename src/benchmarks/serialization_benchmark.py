@@ -0,0 +1,85 @@
+"""
+Сравнение стоимости сериализации ответа /articles/popular:
+прежний путь через модели ответа FastAPI и прямая сериализация DTO в JSON-байты.
+
+Запуск из директории src: python -m benchmarks.serialization_benchmark
+"""
+
+import datetime
+import json
+import timeit
+import uuid
+
+from pydantic import TypeAdapter
+
+from dto import article_dto
+from tools import consts
+from web.fast_api.models.articles import article_model
+
+ITERATIONS = 2_000
+
+articles = [
+    article_dto.ArticleDTO(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        user_name=f"user_{index}",
+        creation_date=datetime.datetime.now(),
+        topic_id=uuid.uuid4(),
+        topic_name="Техническая",
+        text="x" * consts.Articles.MAX_ARTICLE_LENGTH,
+        views=index * 100,
+    )
+    for index in range(consts.Articles.POPULAR_ARTICLES_COUNT)
+]
+
+response_adapter = TypeAdapter(list[article_model.ArticleResultModel])
+dto_adapter = TypeAdapter(list[article_dto.ArticleDTO])
+
+
+def serialize_with_response_models() -> bytes:
+    """
+    Сериализовать статьи так, как это делали эндпоинты до перехода на DTOResponse:
+    копия в модель ответа, валидация response_model, приведение к dict и json.dumps
+    :return: JSON-байты
+    """
+
+    models = [
+        article_model.ArticleResultModel(
+            id=article.id,
+            user_id=article.user_id,
+            user_name=article.user_name,
+            creation_date=article.creation_date,
+            topic_id=article.topic_id,
+            topic_name=article.topic_name,
+            text=article.text,
+            views=article.views,
+        )
+        for article in articles
+    ]
+    content = response_adapter.dump_python(
+        response_adapter.validate_python(models), mode="json"
+    )
+
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def serialize_dto() -> bytes:
+    """
+    Сериализовать DTO сразу в JSON-байты средствами pydantic-core
+    :return: JSON-байты
+    """
+
+    return dto_adapter.dump_json(articles)
+
+
+if __name__ == "__main__":
+    assert json.loads(serialize_with_response_models()) == json.loads(serialize_dto())
+
+    for name, func in (
+        ("Модели ответа FastAPI", serialize_with_response_models),
+        ("DTOResponse", serialize_dto),
+    ):
+        elapsed = min(timeit.repeat(func, number=ITERATIONS, repeat=5))
+        print(f"{name}: {elapsed / ITERATIONS * 1_000_000:.1f} мкс на ответ")
@@ -15,16 +15,19 @@ class ArticleDTO(base_dto.PydanticBase):
 
     id: uuid.UUID = Field(description="Идентификатор статьи", default=uuid.uuid4())
     user_id: uuid.UUID = Field(description="Идентификатор пользователя")
-    user_name: str = Field(description="Имя пользователя")
+    user_name: str | None = Field(description="Имя пользователя", default=None)
     creation_date: datetime.datetime | None = Field(
         description="Дата написания статьи", default=datetime.datetime.now()
     )
-    topic_name: str = Field(description="Название темы статьи")
+    topic_name: str | None = Field(description="Название темы статьи", default=None)
     topic_id: uuid.UUID = Field(description="Идентификатор темы статьи")
     text: str = Field(
         description="Текст статьи", max_length=consts.Articles.MAX_ARTICLE_LENGTH
     )
     views: int | None = Field(description="Количество просмотров", default=0)
+    version: int | None = Field(
+        description="Версия статьи", default=None, exclude=True
+    )
 
 
 class ArticleCreateDTO(base_dto.PydanticBase):
@@ -40,6 +43,19 @@ class ArticleCreateDTO(base_dto.PydanticBase):
     )
 
 
+class ArticleBulkCreateResultDTO(base_dto.PydanticBase):
+    """
+    DTO, содержащий результат создания одной статьи из пакета
+    """
+
+    article: ArticleDTO | None = Field(
+        description="Созданная статья", default=None
+    )
+    error: str | None = Field(
+        description="Причина, по которой статья не была создана", default=None
+    )
+
+
 class ArticleUpdateDTO(base_dto.PydanticBase):
     """
     DTO, содержащий данные для обновления статьи
@@ -70,3 +86,56 @@ class ArticleRetrieveDTO(base_dto.PydanticBase):
         description="Текст статьи", max_length=consts.Articles.MAX_ARTICLE_LENGTH
     )
     views: int | None = Field(description="Количество просмотров")
+
+
+class ArticlePartialDTO(base_dto.PydanticBase):
+    """
+    DTO, содержащий только запрошенные поля статьи
+    """
+
+    id: uuid.UUID = Field(description="Идентификатор статьи")
+    user_id: uuid.UUID | None = Field(
+        description="Идентификатор пользователя", default=None
+    )
+    user_name: str | None = Field(description="Имя пользователя", default=None)
+    creation_date: datetime.datetime | None = Field(
+        description="Дата написания статьи", default=None
+    )
+    topic_id: uuid.UUID | None = Field(
+        description="Идентификатор темы статьи", default=None
+    )
+    topic_name: str | None = Field(description="Название темы статьи", default=None)
+    text: str | None = Field(description="Текст статьи", default=None)
+    views: int | None = Field(description="Количество просмотров", default=None)
+
+
+class ArticleFilterDTO(base_dto.PydanticBase):
+    """
+    DTO, содержащий условия отбора статей для постраничного списка
+    """
+
+    topic_id: uuid.UUID | None = Field(
+        description="Идентификатор темы статьи", default=None
+    )
+    user_id: uuid.UUID | None = Field(
+        description="Идентификатор автора статьи", default=None
+    )
+    created_after: datetime.datetime | None = Field(
+        description="Нижняя граница даты написания статьи", default=None
+    )
+    created_before: datetime.datetime | None = Field(
+        description="Верхняя граница даты написания статьи", default=None
+    )
+
+
+class ArticlePageDTO(base_dto.PydanticBase):
+    """
+    DTO, содержащий страницу списка статей
+    """
+
+    articles: list[ArticleDTO | ArticlePartialDTO] = Field(
+        description="Статьи страницы"
+    )
+    next_cursor: str | None = Field(
+        description="Курсор следующей страницы", default=None
+    )
@@ -0,0 +1,40 @@
+from pydantic import computed_field, Field
+
+from abstracts import base_dto
+
+
+class CacheStatsDTO(base_dto.PydanticBase):
+    """
+    DTO, содержащий статистику работы кэша
+    """
+
+    hits: int = Field(description="Количество попаданий в кэш")
+    misses: int = Field(description="Количество промахов кэша")
+    evictions: int = Field(description="Количество вытесненных записей")
+    items: int = Field(description="Количество записей в кэше")
+    size: int = Field(description="Суммарный размер записей в кэше")
+    max_size: int = Field(description="Максимальный суммарный размер записей в кэше")
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        """
+        Рассчитать долю попаданий в кэш
+        """
+
+        requests = self.hits + self.misses
+
+        return self.hits / requests if requests else 0.0
+
+
+class SWRCacheStatsDTO(base_dto.PydanticBase):
+    """
+    DTO, содержащий статистику работы кэша stale-while-revalidate
+    """
+
+    hits: int = Field(description="Количество попаданий в актуальные записи")
+    stale_hits: int = Field(description="Количество попаданий в устаревшие записи")
+    misses: int = Field(description="Количество промахов кэша")
+    refreshes: int = Field(description="Количество обновлений записей")
+    refresh_errors: int = Field(description="Количество неудачных обновлений записей")
+    items: int = Field(description="Количество записей в кэше")
@@ -0,0 +1,16 @@
+from pydantic import Field
+
+from abstracts import base_dto
+
+
+class PasswordHasherStatsDTO(base_dto.PydanticBase):
+    """
+    DTO, содержащий статистику работы пула хеширования паролей
+    """
+
+    waiting: int = Field(description="Количество операций в очереди")
+    in_progress: int = Field(description="Количество выполняющихся операций")
+    completed: int = Field(description="Количество завершенных операций")
+    max_concurrency: int = Field(
+        description="Максимальное количество одновременно выполняющихся операций"
+    )
@@ -0,0 +1,13 @@
+from pydantic import Field
+
+from abstracts import base_dto
+
+
+class PoolStatsDTO(base_dto.PydanticBase):
+    """
+    DTO, содержащий статистику пула соединений
+    """
+
+    max_size: int = Field(description="Максимальное количество соединений")
+    opened: int = Field(description="Количество открытых соединений")
+    in_use: int = Field(description="Количество занятых соединений")
@@ -24,3 +24,11 @@ class UserDTO(UserInfoDTO):
 
     password: str = Field(description="Пароль")
     registration_date: datetime.datetime = Field(description="Дата регистрации")
+
+
+class PrincipalDTO(UserInfoDTO):
+    """
+    DTO, содержащий данные аутентифицированного пользователя из access-токена
+    """
+
+    registration_date: datetime.datetime = Field(description="Дата регистрации")
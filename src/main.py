@@ -5,11 +5,22 @@ from fastapi import FastAPI
 import uvicorn
 
 from scheduler import scheduler_jobs
-from tools import app_config, consts, di_container
-from web.tools import router_registrator
+from tools import (
+    app_config,
+    consts,
+    di_container,
+    metrics_helper,
+    password_helper,
+)
+from web.tools import auth_middleware, metrics_middleware, router_registrator
 
 config = app_config.config
 
+session_container = di_container.SessionContainer()
+repository_container = di_container.RepositoryContainer()
+uow_container = di_container.UOWContainer()
+cache_container = di_container.CacheContainer()
+
 
 @contextlib.asynccontextmanager
 async def lifespan(fast_api_app: FastAPI) -> None:  # no qa
@@ -18,6 +29,12 @@ async def lifespan(fast_api_app: FastAPI) -> None:  # no qa
     :param fast_api_app: приложение FastAPI
     """
 
+    alchemy_session_factory = session_container.alchemy_session_factory()
+    alchemy_session_factory.connect()
+    metrics_helper.register_collectors(session_container, cache_container)
+
+    await scheduler_jobs.refresh_topics()
+
     scheduler = asyncio.AsyncIOScheduler()
     scheduler.add_job(
         scheduler_jobs.update_popular_articles,
@@ -28,6 +45,17 @@ async def lifespan(fast_api_app: FastAPI) -> None:  # no qa
             consts.Articles.POPULAR_ARTICLES_COUNT,
         ],
     )
+    scheduler.add_job(
+        scheduler_jobs.flush_article_views,
+        trigger="interval",
+        seconds=consts.Articles.VIEWS_FLUSH_INTERVAL_IN_SEC,
+    )
+    scheduler.add_job(
+        scheduler_jobs.refresh_topics,
+        trigger="interval",
+        seconds=consts.Topics.CATALOG_REFRESH_INTERVAL_IN_SEC,
+    )
+    scheduler.add_job(scheduler_jobs.reindex_popular_articles)
 
     try:
         scheduler.start()
@@ -37,6 +65,10 @@ async def lifespan(fast_api_app: FastAPI) -> None:  # no qa
     yield
 
     scheduler.shutdown()
+    await alchemy_session_factory.dispose()
+    await session_container.redis_article_session_factory().dispose()
+    await session_container.redis_token_session_factory().dispose()
+    password_helper.PasswordHelper.shutdown()
 
 
 app = FastAPI(
@@ -45,23 +77,23 @@ app = FastAPI(
     version=config.app_version,
     lifespan=lifespan,
 )
+app.add_middleware(auth_middleware.AuthMiddleware)
+app.add_middleware(metrics_middleware.MetricsMiddleware)
 router_registrator.register_routers(app, config.app_mode)
 
 
 if __name__ == "__main__":
-    session_container = di_container.SessionContainer()
-    repository_container = di_container.RepositoryContainer()
-    uow_container = di_container.UOWContainer()
-
     modules = [
         "services.article_service",
         "services.auth_service",
         "services.user_service",
+        "services.topic_service",
     ]
 
     session_container.wire(modules=modules)
     repository_container.wire(modules=modules)
     uow_container.wire(modules=modules)
+    cache_container.wire(modules=modules)
 
     print(f"Приложение запущено в режиме {config.app_mode.value}")
 
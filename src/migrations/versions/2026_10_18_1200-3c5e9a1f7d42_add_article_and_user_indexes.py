@@ -0,0 +1,80 @@
+"""add_article_and_user_indexes
+
+Revision ID: 3c5e9a1f7d42
+Revises: f96927a48d66
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c5e9a1f7d42"
+down_revision: Union[str, None] = "f96927a48d66"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_article_creation_date_id",
+            "article",
+            ["creation_date", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_article_user_id_creation_date_id",
+            "article",
+            ["user_id", "creation_date", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_article_topic_id_creation_date_id",
+            "article",
+            ["topic_id", "creation_date", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_user_name",
+            "user",
+            ["name"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_name",
+            table_name="user",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_article_topic_id_creation_date_id",
+            table_name="article",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_article_user_id_creation_date_id",
+            table_name="article",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_article_creation_date_id",
+            table_name="article",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
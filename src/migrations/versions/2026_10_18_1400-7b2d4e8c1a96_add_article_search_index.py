@@ -0,0 +1,46 @@
+"""add_article_search_index
+
+Revision ID: 7b2d4e8c1a96
+Revises: 3c5e9a1f7d42
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2d4e8c1a96"
+down_revision: Union[str, None] = "3c5e9a1f7d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_EXPRESSION = "to_tsvector('russian'::regconfig, coalesce(text, ''))"
+
+
+def upgrade() -> None:
+    # Индекс строится по выражению, а не по вычисляемому столбцу: добавление
+    # хранимого столбца перезаписало бы всю таблицу под блокировкой
+    # ACCESS EXCLUSIVE. CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_article_search_vector",
+            "article",
+            [sa.text(SEARCH_VECTOR_EXPRESSION)],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_article_search_vector",
+            table_name="article",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
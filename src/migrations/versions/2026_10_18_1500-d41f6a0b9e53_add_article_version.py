@@ -0,0 +1,36 @@
+"""add_article_version
+
+Revision ID: d41f6a0b9e53
+Revises: 7b2d4e8c1a96
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d41f6a0b9e53"
+down_revision: Union[str, None] = "7b2d4e8c1a96"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "article",
+        sa.Column(
+            "version",
+            sa.Integer(),
+            nullable=False,
+            server_default="1",
+            comment="Версия статьи, увеличивается при каждом изменении",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("article", "version")
@@ -1,12 +1,26 @@
 import datetime
-
-from sqlalchemy import delete, select, update
+import uuid
+
+from sqlalchemy import (
+    any_,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+    Select,
+    UUID,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import joinedload
 
 from abstracts import abstract_repository as abs_repo
 from dto import article_dto
 from repositories.models import article_model
-from tools import consts
+from tools import article_codec, consts
 
 
 class ArticleAlchemyRepository(
@@ -37,6 +51,27 @@ class ArticleAlchemyRepository(
 
         self.session.add(article_db_model)
 
+    async def create_many(self, articles: list[article_dto.ArticleDTO]) -> None:
+        """
+        Создать записи статей одним многострочным INSERT
+        :param articles: объекты статей
+        """
+
+        await self.session.execute(
+            insert(article_model.Article),
+            [
+                {
+                    "id": article.id,
+                    "user_id": article.user_id,
+                    "creation_date": article.creation_date,
+                    "topic_id": article.topic_id,
+                    "text": article.text,
+                    "views": article.views,
+                }
+                for article in articles
+            ],
+        )
+
     async def retrieve(self, article_id: str) -> article_dto.ArticleDTO | None:
         """
         Получить запись статьи
@@ -66,6 +101,7 @@ class ArticleAlchemyRepository(
             creation_date=result.creation_date,
             text=result.text,
             views=result.views,
+            version=result.version,
         )
 
     async def retrieve_by_date(
@@ -85,6 +121,10 @@ class ArticleAlchemyRepository(
                 joinedload(article_model.Article.user),
             )
             .where(article_model.Article.creation_date >= date_from)
+            .order_by(
+                article_model.Article.views.desc().nulls_last(),
+                article_model.Article.creation_date.desc(),
+            )
         )
 
         if articles_count is not None:
@@ -106,10 +146,235 @@ class ArticleAlchemyRepository(
                 creation_date=article.creation_date,
                 text=article.text,
                 views=article.views,
+                version=article.version,
             )
             for article in result
         ]
 
+    async def retrieve_many(
+        self, article_ids: list[uuid.UUID]
+    ) -> list[article_dto.ArticleDTO]:
+        """
+        Получить записи статей по списку идентификаторов одним запросом
+        :param article_ids: идентификаторы статей
+        :return: найденные записи статей в произвольном порядке
+        """
+
+        query = (
+            select(article_model.Article)
+            .options(
+                joinedload(article_model.Article.topic),
+                joinedload(article_model.Article.user),
+            )
+            .where(
+                article_model.Article.id
+                == any_(
+                    bindparam("article_ids", article_ids, type_=ARRAY(UUID))
+                )
+            )
+        )
+        result = await self.session.execute(query)
+
+        return [
+            article_dto.ArticleDTO(
+                id=article.id,
+                user_id=article.user_id,
+                user_name=article.user.name,
+                topic_id=article.topic_id,
+                topic_name=article.topic.name,
+                creation_date=article.creation_date,
+                text=article.text,
+                views=article.views,
+                version=article.version,
+            )
+            for article in result.scalars().all()
+        ]
+
+    @staticmethod
+    def __apply_filters(
+        query: Select, filters: article_dto.ArticleFilterDTO
+    ) -> Select:
+        """
+        Добавить к запросу условия отбора статей
+        :param query: запрос
+        :param filters: условия отбора статей
+        :return: запрос с условиями отбора
+        """
+
+        if filters.topic_id is not None:
+            query = query.where(article_model.Article.topic_id == filters.topic_id)
+
+        if filters.user_id is not None:
+            query = query.where(article_model.Article.user_id == filters.user_id)
+
+        if filters.created_after is not None:
+            query = query.where(
+                article_model.Article.creation_date >= filters.created_after
+            )
+
+        if filters.created_before is not None:
+            query = query.where(
+                article_model.Article.creation_date < filters.created_before
+            )
+
+        return query
+
+    async def retrieve_page(
+        self,
+        filters: article_dto.ArticleFilterDTO,
+        articles_count: int,
+        cursor: tuple[datetime.datetime, uuid.UUID] | None = None,
+        columns: set[str] | None = None,
+    ) -> list[article_dto.ArticleDTO] | list[article_dto.ArticlePartialDTO]:
+        """
+        Получить страницу записей статей, начиная с новых.
+        Страница отсчитывается от курсора, а не смещения, поэтому глубокие страницы
+        стоят столько же, сколько первая
+        :param filters: условия отбора статей
+        :param articles_count: количество статей для получения
+        :param cursor: дата написания и идентификатор последней статьи предыдущей страницы
+        :param columns: колонки статьи, которые нужно получить. Если переданы, автор
+        и тема статьи не присоединяются, а возвращаются частичные записи
+        :return: список статей, удовлетворяющих условиям
+        """
+
+        if columns is None:
+            query = select(article_model.Article).options(
+                joinedload(article_model.Article.topic),
+                joinedload(article_model.Article.user),
+            )
+        else:
+            query = select(
+                *[
+                    getattr(article_model.Article, column)
+                    for column in sorted(columns | {"id", "creation_date"})
+                ]
+            )
+
+        query = self.__apply_filters(query, filters)
+
+        if cursor is not None:
+            query = query.where(
+                tuple_(article_model.Article.creation_date, article_model.Article.id)
+                < tuple_(*cursor)
+            )
+
+        query = query.order_by(
+            article_model.Article.creation_date.desc(),
+            article_model.Article.id.desc(),
+        ).limit(articles_count)
+
+        result = await self.session.execute(query)
+
+        if columns is not None:
+            return [
+                article_dto.ArticlePartialDTO(**article._mapping)
+                for article in result.all()
+            ]
+
+        return [
+            article_dto.ArticleDTO(
+                id=article.id,
+                user_id=article.user_id,
+                user_name=article.user.name,
+                topic_id=article.topic_id,
+                topic_name=article.topic.name,
+                creation_date=article.creation_date,
+                text=article.text,
+                views=article.views,
+                version=article.version,
+            )
+            for article in result.scalars().all()
+        ]
+
+    async def search(
+        self,
+        search_query: str,
+        filters: article_dto.ArticleFilterDTO,
+        articles_count: int,
+        cursor: tuple[float, uuid.UUID] | None = None,
+        columns: set[str] | None = None,
+    ) -> (
+        list[tuple[article_dto.ArticleDTO, float]]
+        | list[tuple[article_dto.ArticlePartialDTO, float]]
+    ):
+        """
+        Найти статьи по тексту, начиная с наиболее релевантных.
+        Отбор идет по GIN-индексу поискового вектора, а страница отсчитывается
+        от курсора, как и в retrieve_page
+        :param search_query: поисковый запрос в синтаксисе websearch_to_tsquery
+        :param filters: условия отбора статей
+        :param articles_count: количество статей для получения
+        :param cursor: релевантность и идентификатор последней статьи предыдущей страницы
+        :param columns: колонки статьи, которые нужно получить. Если переданы, автор
+        и тема статьи не присоединяются, а возвращаются частичные записи
+        :return: список пар из статьи и ее релевантности
+        """
+
+        ts_query = func.websearch_to_tsquery(
+            consts.Articles.SEARCH_CONFIGURATION, search_query
+        )
+        rank = func.ts_rank(article_model.Article.search_vector, ts_query)
+
+        selected_columns = sorted(columns | {"id"}) if columns is not None else []
+
+        if columns is None:
+            query = select(article_model.Article, rank).options(
+                joinedload(article_model.Article.topic),
+                joinedload(article_model.Article.user),
+            )
+        else:
+            query = select(
+                *[
+                    getattr(article_model.Article, column)
+                    for column in selected_columns
+                ],
+                rank,
+            )
+
+        query = query.where(article_model.Article.search_vector.op("@@")(ts_query))
+        query = self.__apply_filters(query, filters)
+
+        if cursor is not None:
+            query = query.where(
+                tuple_(rank, article_model.Article.id) < tuple_(*cursor)
+            )
+
+        query = query.order_by(rank.desc(), article_model.Article.id.desc()).limit(
+            articles_count
+        )
+
+        result = await self.session.execute(query)
+
+        if columns is not None:
+            return [
+                (
+                    article_dto.ArticlePartialDTO(
+                        **dict(zip(selected_columns, article[:-1]))
+                    ),
+                    article[-1],
+                )
+                for article in result.all()
+            ]
+
+        return [
+            (
+                article_dto.ArticleDTO(
+                    id=article.id,
+                    user_id=article.user_id,
+                    user_name=article.user.name,
+                    topic_id=article.topic_id,
+                    topic_name=article.topic.name,
+                    creation_date=article.creation_date,
+                    text=article.text,
+                    views=article.views,
+                    version=article.version,
+                ),
+                article_rank,
+            )
+            for article, article_rank in result.all()
+        ]
+
     async def update(self, article: article_dto.ArticleDTO) -> None:
         """
         Обновить статью
@@ -119,7 +384,29 @@ class ArticleAlchemyRepository(
         query = (
             update(article_model.Article)
             .where(article_model.Article.id == article.id)
-            .values(topic_id=article.topic_id, text=article.text, views=article.views)
+            .values(
+                topic_id=article.topic_id,
+                text=article.text,
+                version=article_model.Article.version + 1,
+            )
+        )
+
+        await self.session.execute(query)
+
+    async def increment_views(self, views: dict[uuid.UUID, int]) -> None:
+        """
+        Увеличить количество просмотров статей одним запросом
+        :param views: словарь вида {идентификатор статьи: количество новых просмотров}
+        """
+
+        query = (
+            update(article_model.Article)
+            .where(article_model.Article.id.in_(views.keys()))
+            .values(
+                views=func.coalesce(article_model.Article.views, 0)
+                + case(views, value=article_model.Article.id)
+            )
+            .execution_options(synchronize_session=False)
         )
 
         await self.session.execute(query)
@@ -147,51 +434,276 @@ class ArticleRedisRepository(
     Репозиторий для работы со статьями
     """
 
+    # Количество результатов транзакции, которые добавляет record_view
+    RECORD_VIEW_RESULTS_COUNT = 5
+
+    @staticmethod
+    def __get_article_key(article_id: str) -> str:
+        """
+        Получить ключ, под которым хранится статья
+        :param article_id: идентификатор статьи
+        :return: ключ статьи
+        """
+
+        return f"{consts.Articles.REDIS_POPULAR_ARTICLE_KEY_PREFIX}{article_id}"
+
+    @staticmethod
+    def __get_staged_article_key(article_id: str) -> str:
+        """
+        Получить ключ, под которым хранится статья нового поколения
+        :param article_id: идентификатор статьи
+        :return: ключ статьи нового поколения
+        """
+
+        return f"{consts.Articles.REDIS_STAGING_ARTICLE_KEY_PREFIX}{article_id}"
+
     async def create(self, article: article_dto.ArticleDTO) -> None:
         """
         Создать запись статьи
         :param article: объект данных о статье
         """
 
-        article_db = dict(
-            article_dto.ArticleDTO(
-                id=article.id,
-                user_id=article.user_id,
-                user_name=article.user_name,
-                creation_date=article.creation_date,
-                topic_name=article.topic_name,
-                topic_id=article.topic_id,
-                text=article.text,
-                views=article.views
+        article_id = str(article.id)
+
+        await self.session.set(
+            self.__get_article_key(article_id), article_codec.encode_article(article)
+        )
+        await self.session.sadd(consts.Articles.REDIS_POPULAR_INDEX_KEY, article_id)
+        await self.session.zadd(
+            consts.Articles.REDIS_POPULAR_RANK_KEY,
+            {article_id: article.views or 0},
+            gt=True,
+        )
+        await self.__add_creation_date(article_id, article.creation_date)
+
+    async def create_staged(self, article: article_dto.ArticleDTO) -> None:
+        """
+        Создать запись статьи в новом поколении популярных статей
+        :param article: объект данных о статье
+        """
+
+        article_id = str(article.id)
+
+        await self.session.set(
+            self.__get_staged_article_key(article_id),
+            article_codec.encode_article(article),
+        )
+        await self.session.sadd(consts.Articles.REDIS_STAGING_INDEX_KEY, article_id)
+        await self.session.zadd(
+            consts.Articles.REDIS_STAGING_RANK_KEY, {article_id: article.views or 0}
+        )
+        await self.__add_creation_date(article_id, article.creation_date)
+
+    async def __add_creation_date(
+        self, article_id: str, creation_date: datetime.datetime
+    ) -> None:
+        """
+        Запомнить дату написания статьи из рейтинга, чтобы убрать ее из рейтинга,
+        когда она перестанет быть новой
+        :param article_id: идентификатор статьи
+        :param creation_date: дата написания статьи
+        """
+
+        await self.session.zadd(
+            consts.Articles.REDIS_POPULAR_CREATION_DATE_KEY,
+            {article_id: creation_date.timestamp()},
+            nx=True,
+        )
+
+    async def retrieve_staged_keys(self) -> None:
+        """
+        Получить идентификаторы статей нового поколения
+        """
+
+        await self.session.smembers(consts.Articles.REDIS_STAGING_INDEX_KEY)
+
+    async def delete_staged(self, *article_ids: str) -> None:
+        """
+        Удалить незавершенное поколение популярных статей
+        :param article_ids: идентификаторы статей нового поколения
+        """
+
+        await self.session.unlink(
+            consts.Articles.REDIS_STAGING_RANK_KEY,
+            consts.Articles.REDIS_STAGING_INDEX_KEY,
+            *(self.__get_staged_article_key(article_id) for article_id in article_ids),
+        )
+
+    async def promote_staged(
+        self,
+        article_ids: list[str],
+        stale_article_ids: list[str],
+        date_from: datetime.datetime,
+    ) -> None:
+        """
+        Сделать новое поколение популярных статей текущим.
+        Команды выполняются в одной транзакции Redis, поэтому читатели видят
+        либо старое, либо новое поколение целиком.
+        Рейтинг не заменяется, а объединяется с новым по максимуму: в текущем
+        рейтинге есть просмотры, еще не перенесенные в БД, и статьи за пределами
+        нового поколения. Из него убираются только статьи, написанные до date_from
+        :param article_ids: идентификаторы статей нового поколения
+        :param stale_article_ids: идентификаторы статей старого поколения,
+        не вошедших в новое
+        :param date_from: дата, начиная с которой статьи остаются в рейтинге
+        """
+
+        for article_id in article_ids:
+            await self.session.rename(
+                self.__get_staged_article_key(article_id),
+                self.__get_article_key(article_id),
             )
+
+        await self.session.rename(
+            consts.Articles.REDIS_STAGING_INDEX_KEY,
+            consts.Articles.REDIS_POPULAR_INDEX_KEY,
+        )
+        await self.session.zremrangebyscore(
+            consts.Articles.REDIS_POPULAR_CREATION_DATE_KEY,
+            "-inf",
+            f"({date_from.timestamp()}",
         )
+        await self.session.zunionstore(
+            consts.Articles.REDIS_POPULAR_RANK_KEY,
+            [
+                consts.Articles.REDIS_POPULAR_RANK_KEY,
+                consts.Articles.REDIS_STAGING_RANK_KEY,
+            ],
+            aggregate="MAX",
+        )
+        await self.session.zinterstore(
+            consts.Articles.REDIS_POPULAR_RANK_KEY,
+            {
+                consts.Articles.REDIS_POPULAR_RANK_KEY: 1,
+                consts.Articles.REDIS_POPULAR_CREATION_DATE_KEY: 0,
+            },
+        )
+        await self.session.unlink(consts.Articles.REDIS_STAGING_RANK_KEY)
+
+        if stale_article_ids:
+            await self.session.unlink(
+                *(self.__get_article_key(article_id) for article_id in stale_article_ids)
+            )
 
-        article_db["id"] = str(article_db["id"])
-        article_db["user_id"] = str(article_db["user_id"])
-        article_db["topic_id"] = str(article_db["topic_id"])
-        article_db["creation_date"] = article_db["creation_date"].strftime(
-            consts.Articles.DATETIME_STRING_FORMAT
+        await self.increment_generation()
+
+    async def retrieve_generation(self) -> None:
+        """
+        Получить номер поколения популярных статей
+        """
+
+        await self.session.get(consts.Articles.REDIS_POPULAR_GENERATION_KEY)
+
+    async def increment_generation(self) -> None:
+        """
+        Увеличить номер поколения популярных статей, чтобы клиенты перезапросили их
+        """
+
+        await self.session.incr(consts.Articles.REDIS_POPULAR_GENERATION_KEY)
+
+    async def retrieve(self, article_id: str) -> None:
+        """
+        Получить закодированную статью
+        :param article_id: идентификатор статьи
+        """
+
+        await self.session.get(self.__get_article_key(article_id))
+
+    async def retrieve_many(self, article_ids: list[str]) -> None:
+        """
+        Получить несколько закодированных статей одной командой
+        :param article_ids: идентификаторы статей
+        """
+
+        await self.session.mget(
+            [self.__get_article_key(article_id) for article_id in article_ids]
         )
 
-        await self.session.hset(name=article_db["id"], mapping=article_db)
+    async def exists(self, article_id: str) -> None:
+        """
+        Проверить, хранится ли статья
+        :param article_id: идентификатор статьи
+        """
+
+        await self.session.exists(self.__get_article_key(article_id))
+
+    async def retrieve_hashes(self, *keys: str) -> None:
+        """
+        Получить статьи, хранящиеся в прежнем формате хешей
+        :param keys: ключи статей
+        """
+
+        for key in keys:
+            await self.session.hgetall(key)
+
+    async def retrieve_rank(self, articles_count: int) -> None:
+        """
+        Получить идентификаторы самых просматриваемых статей вместе с просмотрами
+        :param articles_count: количество статей
+        """
+
+        await self.session.zrevrange(
+            consts.Articles.REDIS_POPULAR_RANK_KEY,
+            0,
+            articles_count - 1,
+            withscores=True,
+            score_cast_func=int,
+        )
 
-    async def retrieve(self, article_id: str, keys: list[str]) -> list:
+    async def record_view(
+        self, article_id: str, views: int, creation_date: datetime.datetime
+    ) -> None:
         """
-        Получить статью
+        Учесть просмотр статьи в рейтинге популярных статей.
+        Добавляет в транзакцию RECORD_VIEW_RESULTS_COUNT результатов, последние два
+        из них - место статьи в рейтинге и признак того, что статья хранится
         :param article_id: идентификатор статьи
-        :param keys: ключи, значения которых нужно получить
-        :return: запись в БД в случае нахождения
+        :param views: количество просмотров статьи, известное на момент чтения
+        :param creation_date: дата написания статьи
         """
 
-        return await self.session.hmget(article_id, keys)
+        await self.__add_creation_date(article_id, creation_date)
+        await self.session.zadd(
+            consts.Articles.REDIS_POPULAR_RANK_KEY, {article_id: views}, nx=True
+        )
+        await self.session.zincrby(consts.Articles.REDIS_POPULAR_RANK_KEY, 1, article_id)
+        await self.session.zrevrank(consts.Articles.REDIS_POPULAR_RANK_KEY, article_id)
+        await self.session.sismember(consts.Articles.REDIS_POPULAR_INDEX_KEY, article_id)
 
     async def retrieve_keys(self) -> list:
         """
-        Получить текущие ключи
-        :return: список ключей
+        Получить идентификаторы статей из индекса
+        :return: список идентификаторов статей
+        """
+
+        return await self.session.smembers(consts.Articles.REDIS_POPULAR_INDEX_KEY)
+
+    async def scan_keys(self, cursor: int, match: str) -> None:
+        """
+        Получить очередную порцию ключей без блокировки Redis
+        :param cursor: курсор SCAN
+        :param match: шаблон ключей
+        """
+
+        await self.session.scan(
+            cursor, match=match, count=consts.Articles.REDIS_SCAN_BATCH_SIZE
+        )
+
+    async def add_keys(self, *article_ids: str) -> None:
+        """
+        Добавить идентификаторы статей в индекс
+        :param article_ids: идентификаторы статей
         """
 
-        return await self.session.keys()
+        await self.session.sadd(consts.Articles.REDIS_POPULAR_INDEX_KEY, *article_ids)
+
+    async def delete_keys(self, *keys: str) -> None:
+        """
+        Удалить ключи в обход индекса
+        :param keys: ключи
+        """
+
+        await self.session.delete(*keys)
 
     async def delete(self, *article_ids: str) -> int:
         """
@@ -200,4 +712,98 @@ class ArticleRedisRepository(
         :return: количество удаленных статей
         """
 
-        return await self.session.delete(*article_ids)
+        await self.session.zrem(consts.Articles.REDIS_POPULAR_RANK_KEY, *article_ids)
+        await self.session.zrem(
+            consts.Articles.REDIS_POPULAR_CREATION_DATE_KEY, *article_ids
+        )
+        await self.session.srem(consts.Articles.REDIS_POPULAR_INDEX_KEY, *article_ids)
+
+        return await self.session.delete(
+            *(self.__get_article_key(article_id) for article_id in article_ids)
+        )
+
+
+class ArticleViewsRedisRepository(
+    abs_repo.AbstractRedisRepository,
+    abs_repo.RetrieveMixin,
+    abs_repo.DeleteMixin,
+):
+    """
+    Репозиторий для буферизации просмотров статей
+    """
+
+    async def increment(self, article_id: str, views: int = 1) -> None:
+        """
+        Добавить просмотры статьи в буфер
+        :param article_id: идентификатор статьи
+        :param views: количество просмотров
+        """
+
+        await self.session.hincrby(
+            consts.Articles.REDIS_PENDING_VIEWS_KEY, article_id, views
+        )
+
+    async def exists(self) -> None:
+        """
+        Проверить, есть ли накопленные просмотры статей
+        """
+
+        await self.session.exists(consts.Articles.REDIS_PENDING_VIEWS_KEY)
+
+    async def start_processing(self) -> None:
+        """
+        Передать накопленные просмотры статей на перенос в БД.
+        Новые просмотры начинают копиться в пустом буфере
+        """
+
+        await self.session.rename(
+            consts.Articles.REDIS_PENDING_VIEWS_KEY,
+            consts.Articles.REDIS_PROCESSING_VIEWS_KEY,
+        )
+
+    async def retrieve(self) -> dict:
+        """
+        Получить просмотры статей, переносимые в БД
+        :return: словарь вида {идентификатор статьи: количество просмотров}
+        """
+
+        return await self.session.hgetall(consts.Articles.REDIS_PROCESSING_VIEWS_KEY)
+
+    async def retrieve_many(self, article_ids: list[str]) -> None:
+        """
+        Получить накопленные просмотры нескольких статей
+        :param article_ids: идентификаторы статей
+        """
+
+        await self.session.hmget(consts.Articles.REDIS_PENDING_VIEWS_KEY, article_ids)
+
+    async def retrieve_processing_many(self, article_ids: list[str]) -> None:
+        """
+        Получить просмотры нескольких статей, переносимые в БД
+        :param article_ids: идентификаторы статей
+        """
+
+        await self.session.hmget(
+            consts.Articles.REDIS_PROCESSING_VIEWS_KEY, article_ids
+        )
+
+    async def retrieve_epoch(self) -> None:
+        """
+        Получить номер последнего переноса просмотров в БД
+        """
+
+        await self.session.get(consts.Articles.REDIS_VIEWS_EPOCH_KEY)
+
+    async def increment_epoch(self) -> None:
+        """
+        Отметить очередной перенос просмотров в БД
+        """
+
+        await self.session.incr(consts.Articles.REDIS_VIEWS_EPOCH_KEY)
+
+    async def delete(self) -> None:
+        """
+        Удалить просмотры статей, перенесенные в БД
+        """
+
+        return await self.session.delete(consts.Articles.REDIS_PROCESSING_VIEWS_KEY)
@@ -30,6 +30,21 @@ class Article(abstract_alchemy_model.Base):
     """
 
     __tablename__ = "article"
+    __table_args__ = (
+        sa.Index("ix_article_creation_date_id", "creation_date", "id"),
+        sa.Index("ix_article_user_id_creation_date_id", "user_id", "creation_date", "id"),
+        sa.Index(
+            "ix_article_topic_id_creation_date_id", "topic_id", "creation_date", "id"
+        ),
+        sa.Index(
+            "ix_article_search_vector",
+            sa.text(
+                f"to_tsvector('{consts.Articles.SEARCH_CONFIGURATION}'::regconfig, "
+                "coalesce(text, ''))"
+            ),
+            postgresql_using="gin",
+        ),
+    )
 
     id = sa.Column(
         sa.UUID,
@@ -50,3 +65,20 @@ class Article(abstract_alchemy_model.Base):
         sa.String(length=consts.Articles.MAX_ARTICLE_LENGTH), comment="Текст статьи"
     )
     views = sa.Column(sa.Integer, comment="Количество просмотров")
+    version = sa.Column(
+        sa.Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        comment="Версия статьи, увеличивается при каждом изменении",
+    )
+    # Поисковый вектор не хранится в таблице, а вычисляется тем же выражением,
+    # по которому построен GIN-индекс ix_article_search_vector, поэтому поиск
+    # идет по индексу. Вместе со статьей вектор не загружается
+    search_vector = orm.column_property(
+        sa.func.to_tsvector(
+            sa.literal_column(f"'{consts.Articles.SEARCH_CONFIGURATION}'::regconfig"),
+            sa.func.coalesce(text, sa.literal_column("''")),
+        ),
+        deferred=True,
+    )
@@ -20,7 +20,7 @@ class User(abstract_alchemy_model.Base):
         comment="Идентификатор пользователя",
         default=lambda: str(uuid.uuid4()),
     )
-    name = sa.Column(sa.String, comment="Имя пользователя")
+    name = sa.Column(sa.String, comment="Имя пользователя", unique=True, index=True)
     hashed_password = sa.Column(sa.String, comment="Хешированный пароль")
     registration_date = sa.Column(
         sa.DateTime, comment="Дата регистрации", default=datetime.datetime.now()
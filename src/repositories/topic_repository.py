@@ -28,3 +28,16 @@ class TopicRepository(abs_repo.AbstractAlchemyRepository, abs_repo.RetrieveMixin
             return
 
         return topic_dto.TopicDTO(id=result.id, name=result.name)
+
+    async def retrieve_all(self) -> list[topic_dto.TopicDTO]:
+        """
+        Получить все записи тем статей
+        """
+
+        query = select(article_model.ArticleTopic)
+        result = await self.session.execute(query)
+
+        return [
+            topic_dto.TopicDTO(id=topic.id, name=topic.name)
+            for topic in result.scalars().all()
+        ]
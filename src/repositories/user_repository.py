@@ -1,3 +1,5 @@
+import uuid
+
 from sqlalchemy import select, or_
 
 from abstracts import abstract_repository as abs_repo
@@ -61,3 +63,25 @@ class UserRepository(
             password=result.hashed_password,
             registration_date=result.registration_date,
         )
+
+    async def retrieve_many(
+        self, user_ids: list[uuid.UUID]
+    ) -> list[user_dto.UserDTO]:
+        """
+        Получить записи пользователей по списку идентификаторов одним запросом
+        :param user_ids: идентификаторы пользователей
+        :return: найденные записи пользователей в произвольном порядке
+        """
+
+        query = select(user_model.User).where(user_model.User.id.in_(user_ids))
+        result = await self.session.execute(query)
+
+        return [
+            user_dto.UserDTO(
+                id=user.id,
+                name=user.name,
+                password=user.hashed_password,
+                registration_date=user.registration_date,
+            )
+            for user in result.scalars().all()
+        ]
@@ -1,8 +1,12 @@
 import datetime
 
-from services import article_service
+from services import article_service, topic_service
+from tools import metrics_helper
 
 
+@metrics_helper.timed(
+    metrics_helper.SCHEDULER_JOB_DURATION.labels("update_popular_articles")
+)
 async def update_popular_articles(
     popular_article_lifetime_in_seconds: int, articles_num: int
 ) -> None:
@@ -20,3 +24,36 @@ async def update_popular_articles(
     await article_service.ArticleService.update_popular_articles(
         date_from, articles_num
     )
+
+
+@metrics_helper.timed(
+    metrics_helper.SCHEDULER_JOB_DURATION.labels("flush_article_views")
+)
+async def flush_article_views() -> None:
+    """
+    Перенести накопленные просмотры статей в БД
+    """
+
+    await article_service.ArticleService.flush_article_views()
+
+
+@metrics_helper.timed(
+    metrics_helper.SCHEDULER_JOB_DURATION.labels("reindex_popular_articles")
+)
+async def reindex_popular_articles() -> None:
+    """
+    Восстановить индекс популярных статей по ключам Redis
+    """
+
+    await article_service.ArticleService.reindex_popular_articles()
+
+
+@metrics_helper.timed(
+    metrics_helper.SCHEDULER_JOB_DURATION.labels("refresh_topics")
+)
+async def refresh_topics() -> None:
+    """
+    Обновить каталог тем статей
+    """
+
+    await topic_service.TopicService.refresh_topics()
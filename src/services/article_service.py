@@ -1,4 +1,8 @@
+import base64
+import binascii
 import datetime
+import sys
+from typing import Any, Callable
 import uuid
 
 from dependency_injector.wiring import Provide
@@ -8,7 +12,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstracts import abstract_repository, abstract_service, abstract_uow, base_dto
 from dto import article_dto, user_dto
-from tools import consts, di_container, enums
+from services import topic_service
+from tools import article_codec, consts, di_container, enums, etag_helper
 
 
 class ArticleService(abstract_service.AbstractService):
@@ -30,8 +35,8 @@ class ArticleService(abstract_service.AbstractService):
         article_redis_repository: abstract_repository.AbstractRedisRepository = Field(
             description="Репозиторий для работы со статьями в связке с Redis"
         )
-        topic_repository: abstract_repository.AbstractAlchemyRepository = Field(
-            description="Репозиторий для работы с темами статей"
+        article_views_repository: abstract_repository.AbstractRedisRepository = Field(
+            description="Репозиторий для буферизации просмотров статей в Redis"
         )
 
         alchemy_uow: abstract_uow.AbstractUOW = Field(
@@ -57,8 +62,8 @@ class ArticleService(abstract_service.AbstractService):
     article_redis_repository_factory = Provide[
         di_container.RepositoryContainer.article_redis_repository_factory
     ]
-    topic_repository_factory = Provide[
-        di_container.RepositoryContainer.topic_repository_factory
+    article_views_repository_factory = Provide[
+        di_container.RepositoryContainer.article_views_repository_factory
     ]
 
     alchemy_uow_factory = Provide[di_container.UOWContainer.alchemy_uow_factory]
@@ -67,6 +72,9 @@ class ArticleService(abstract_service.AbstractService):
         di_container.UOWContainer.alchemy_redis_uow_composite_factory
     ]
 
+    article_cache = Provide[di_container.CacheContainer.article_cache]
+    popular_articles_cache = Provide[di_container.CacheContainer.popular_articles_cache]
+
     @classmethod
     async def __get_di_objects(cls) -> __DIFactoriesObjectsDTO:
         """
@@ -82,18 +90,20 @@ class ArticleService(abstract_service.AbstractService):
             alchemy_session
         )
         article_redis_repository = cls.article_redis_repository_factory(redis_session)
-        topic_repository = cls.topic_repository_factory(alchemy_session)
+        article_views_repository = cls.article_views_repository_factory(redis_session)
 
         alchemy_uow = cls.alchemy_uow_factory()
         alchemy_uow.add_repository(
             article_alchemy_repository.name, article_alchemy_repository
         )
-        alchemy_uow.add_repository(topic_repository.name, topic_repository)
 
         redis_uow = cls.redis_uow_factory()
         redis_uow.add_repository(
             article_redis_repository.name, article_redis_repository
         )
+        redis_uow.add_repository(
+            article_views_repository.name, article_views_repository
+        )
 
         alchemy_redis_uow_composite = cls.alchemy_redis_uow_composite_factory()
         alchemy_redis_uow_composite.add_uow(
@@ -106,7 +116,7 @@ class ArticleService(abstract_service.AbstractService):
             redis_session=redis_session,
             article_alchemy_repository=article_alchemy_repository,
             article_redis_repository=article_redis_repository,
-            topic_repository=topic_repository,
+            article_views_repository=article_views_repository,
             alchemy_uow=alchemy_uow,
             redis_uow=redis_uow,
             alchemy_redis_uow_composite=alchemy_redis_uow_composite,
@@ -125,12 +135,11 @@ class ArticleService(abstract_service.AbstractService):
         :return: созданная статья
         """
 
+        topic = await topic_service.TopicService.retrieve_topic(article_model.topic_id)
+
         di_objects = await cls.__get_di_objects()
 
         async with di_objects.alchemy_uow:
-            topic = await di_objects.alchemy_uow.repositories[
-                di_objects.topic_repository.name
-            ].retrieve(article_model.topic_id)
             article = article_dto.ArticleDTO(
                 id=article_model.id,
                 user_id=user_model.id,
@@ -149,21 +158,272 @@ class ArticleService(abstract_service.AbstractService):
 
         return article
 
+    @classmethod
+    async def create_articles(
+        cls,
+        user_model: user_dto.UserInfoDTO,
+        article_models: list[article_dto.ArticleCreateDTO],
+    ) -> list[article_dto.ArticleBulkCreateResultDTO]:
+        """
+        Выполнить логику пакетного создания статей
+        :param user_model: объект информации о пользователе
+        :param article_models: объекты статей
+        :return: результаты создания каждой статьи в порядке запроса
+        """
+
+        if len(article_models) > consts.Articles.MAX_BULK_ARTICLES_COUNT:
+            raise ValueError("Превышено максимальное количество статей в запросе")
+
+        creation_date = datetime.datetime.now()
+        articles = []
+        results = []
+
+        for article_model in article_models:
+            try:
+                topic = await topic_service.TopicService.retrieve_topic(
+                    article_model.topic_id
+                )
+            except ValueError as error:
+                results.append(article_dto.ArticleBulkCreateResultDTO(error=str(error)))
+
+                continue
+
+            article = article_dto.ArticleDTO(
+                id=article_model.id,
+                user_id=user_model.id,
+                user_name=user_model.name,
+                topic_id=topic.id,
+                topic_name=topic.name,
+                creation_date=creation_date,
+                text=article_model.text,
+                views=0,
+            )
+            articles.append(article)
+            results.append(article_dto.ArticleBulkCreateResultDTO(article=article))
+
+        if not articles:
+            return results
+
+        di_objects = await cls.__get_di_objects()
+
+        async with di_objects.alchemy_uow:
+            await di_objects.alchemy_uow.repositories[
+                di_objects.article_alchemy_repository.name
+            ].create_many(articles)
+
+            await di_objects.alchemy_uow.commit()
+
+        return results
+
+    @staticmethod
+    def __is_rankable(article: article_dto.ArticleDTO) -> bool:
+        """
+        Проверить, может ли статья попасть в рейтинг популярных статей
+        :param article: статья
+        :return: True, если статья написана в течение времени жизни популярных статей
+        """
+
+        return article.creation_date >= (
+            datetime.datetime.now()
+            - datetime.timedelta(
+                seconds=consts.Articles.MOST_VIEWED_ARTICLE_LIFETIME_IN_SEC
+            )
+        )
+
+    @staticmethod
+    def __get_article_etag(article: article_dto.ArticleDTO, views: int) -> str:
+        """
+        Получить ETag статьи
+        :param article: объект статьи
+        :param views: количество просмотров, которое будет в ответе
+        :return: ETag
+        """
+
+        return etag_helper.make_etag(article.id, article.version, views)
+
+    @classmethod
+    async def retrieve_article_if_modified(
+        cls, article_id: uuid.UUID, etags: set[str]
+    ) -> tuple[article_dto.ArticleDTO | None, str]:
+        """
+        Выполнить логику получения статьи, если она изменилась с прошлого запроса.
+        Проверка выполняется по кэшу и Redis, к БД она обращается только после
+        переноса просмотров в БД. Запрос, на который
+        не передается статья, не считается просмотром
+        :param article_id: идентификатор статьи
+        :param etags: ETag из заголовка If-None-Match
+        :return: статья (None - если у клиента актуальная версия) и ее ETag
+        """
+
+        if etags:
+            di_objects = await cls.__get_di_objects()
+
+            cached_article = cls.article_cache.get(str(article_id))
+
+            if cached_article is None:
+                cached_article = await cls.__load_article(di_objects, article_id)
+
+            views_epoch, article_db = cached_article
+
+            async with di_objects.redis_uow:
+                views_repository = di_objects.redis_uow.repositories[
+                    di_objects.article_views_repository.name
+                ]
+
+                await views_repository.retrieve_many([str(article_id)])
+                await views_repository.retrieve_processing_many([str(article_id)])
+                await views_repository.retrieve_epoch()
+
+                (pending_views,), (processing_views,), current_views_epoch = (
+                    await di_objects.redis_uow.commit()
+                )
+
+            if current_views_epoch != views_epoch:
+                _, article_db = await cls.__load_article(di_objects, article_id)
+
+            etag = cls.__get_article_etag(
+                article_db,
+                (article_db.views or 0)
+                + int(pending_views or 0)
+                + int(processing_views or 0),
+            )
+
+            if etag_helper.is_etag_matched(etag, etags):
+                return None, etag
+
+            article = await cls.__record_view(
+                di_objects, article_db, int(processing_views or 0)
+            )
+        else:
+            article = await cls.retrieve_article(article_id)
+
+        return article, cls.__get_article_etag(article, article.views)
+
+    @classmethod
+    async def __record_view(
+        cls,
+        di_objects: __DIFactoriesObjectsDTO,
+        article_db: article_dto.ArticleDTO,
+        processing_views: int,
+    ) -> article_dto.ArticleDTO:
+        """
+        Учесть просмотр уже полученной статьи одним обращением к Redis
+        :param di_objects: объекты, полученные из фабрик DI-контейнеров
+        :param article_db: статья из кэша или БД
+        :param processing_views: просмотры статьи, переносимые в БД
+        :return: статья с актуальным количеством просмотров
+        """
+
+        views_repository = di_objects.redis_uow.repositories[
+            di_objects.article_views_repository.name
+        ]
+        article_redis_repository = di_objects.redis_uow.repositories[
+            di_objects.article_redis_repository.name
+        ]
+        is_rankable = cls.__is_rankable(article_db)
+
+        async with di_objects.redis_uow:
+            await views_repository.increment(str(article_db.id))
+
+            if is_rankable:
+                await article_redis_repository.record_view(
+                    str(article_db.id), article_db.views or 0, article_db.creation_date
+                )
+
+            redis_result = await di_objects.redis_uow.commit()
+
+            article = article_db.model_copy(
+                update={
+                    "views": (article_db.views or 0)
+                    + redis_result[0]
+                    + processing_views
+                }
+            )
+
+            if is_rankable:
+                rank, is_popular = redis_result[-2:]
+
+                if rank < consts.Articles.POPULAR_ARTICLES_COUNT and not is_popular:
+                    await article_redis_repository.create(article)
+                    await di_objects.redis_uow.commit()
+
+        return article
+
+    @classmethod
+    async def __load_article(
+        cls, di_objects: __DIFactoriesObjectsDTO, article_id: uuid.UUID
+    ) -> tuple[bytes | None, article_dto.ArticleDTO]:
+        """
+        Получить статью из БД и положить ее в кэш
+        :param di_objects: объекты, полученные из фабрик DI-контейнеров
+        :param article_id: идентификатор статьи
+        :return: номер последнего переноса просмотров в БД и статья
+        """
+
+        async with di_objects.redis_uow:
+            await di_objects.redis_uow.repositories[
+                di_objects.article_views_repository.name
+            ].retrieve_epoch()
+
+            views_epoch = (await di_objects.redis_uow.commit())[0]
+
+        async with di_objects.alchemy_uow:
+            article_db = await di_objects.alchemy_uow.repositories[
+                di_objects.article_alchemy_repository.name
+            ].retrieve(article_id)
+
+        if article_db is None:
+            raise ValueError("Статья не была найдена в базе данных")
+
+        cls.article_cache.set(
+            str(article_db.id),
+            (views_epoch, article_db),
+            sys.getsizeof(article_db.text)
+            + consts.Articles.CACHED_ARTICLE_OVERHEAD_IN_BYTES,
+        )
+
+        return views_epoch, article_db
+
     @classmethod
     async def retrieve_article(cls, article_id: uuid.UUID) -> article_dto.ArticleDTO:
         """
-        Выполнить логику создания статьи
+        Выполнить логику получения статьи
         :param article_id: идентификатор статьи
         :return: полученная статья
         """
 
         di_objects = await cls.__get_di_objects()
-        uow = di_objects.alchemy_uow
 
-        async with uow:
-            article_db = await uow.repositories[
-                di_objects.article_alchemy_repository.name
-            ].retrieve(article_id)
+        cached_article = cls.article_cache.get(str(article_id))
+
+        if cached_article is None:
+            cached_article = await cls.__load_article(di_objects, article_id)
+
+        views_epoch, article_db = cached_article
+
+        views_repository = di_objects.redis_uow.repositories[
+            di_objects.article_views_repository.name
+        ]
+        article_redis_repository = di_objects.redis_uow.repositories[
+            di_objects.article_redis_repository.name
+        ]
+        is_rankable = cls.__is_rankable(article_db)
+
+        async with di_objects.redis_uow:
+            await views_repository.increment(str(article_db.id))
+            await views_repository.retrieve_epoch()
+            await views_repository.retrieve_processing_many([str(article_db.id)])
+
+            if is_rankable:
+                await article_redis_repository.record_view(
+                    str(article_db.id), article_db.views or 0, article_db.creation_date
+                )
+
+            redis_result = await di_objects.redis_uow.commit()
+            pending_views, current_views_epoch, (processing_views,) = redis_result[:3]
+
+            if current_views_epoch != views_epoch:
+                _, article_db = await cls.__load_article(di_objects, article_id)
 
             article = article_dto.ArticleDTO(
                 id=article_db.id,
@@ -173,17 +433,419 @@ class ArticleService(abstract_service.AbstractService):
                 topic_name=article_db.topic_name,
                 creation_date=article_db.creation_date,
                 text=article_db.text,
-                views=article_db.views + 1,
+                views=(article_db.views or 0)
+                + pending_views
+                + int(processing_views or 0),
+                version=article_db.version,
             )
 
-            await di_objects.alchemy_uow.repositories[
-                di_objects.article_alchemy_repository.name
-            ].update(article)
+            if is_rankable:
+                rank, is_popular = redis_result[-2:]
 
-            await di_objects.alchemy_uow.commit()
+                if rank < consts.Articles.POPULAR_ARTICLES_COUNT and not is_popular:
+                    await article_redis_repository.create(article)
+                    await di_objects.redis_uow.commit()
 
         return article
 
+    @classmethod
+    async def retrieve_articles(
+        cls, article_ids: list[uuid.UUID]
+    ) -> list[article_dto.ArticleDTO]:
+        """
+        Выполнить логику получения нескольких статей
+        :param article_ids: идентификаторы статей
+        :return: найденные статьи в порядке запроса
+        """
+
+        if len(article_ids) > consts.Articles.MAX_BATCH_ARTICLES_COUNT:
+            raise ValueError("Превышено максимальное количество статей в запросе")
+
+        unique_ids = list(dict.fromkeys(article_ids))
+
+        if not unique_ids:
+            return []
+
+        di_objects = await cls.__get_di_objects()
+
+        views_repository = di_objects.redis_uow.repositories[
+            di_objects.article_views_repository.name
+        ]
+        article_redis_repository = di_objects.redis_uow.repositories[
+            di_objects.article_redis_repository.name
+        ]
+
+        async with di_objects.redis_uow:
+            await views_repository.retrieve_epoch()
+
+            views_epoch = (await di_objects.redis_uow.commit())[0]
+
+        articles_db = {}
+        missing_ids = []
+
+        for article_id in unique_ids:
+            cached_article = cls.article_cache.get(str(article_id))
+
+            if cached_article is not None and cached_article[0] == views_epoch:
+                articles_db[article_id] = cached_article[1]
+            else:
+                missing_ids.append(article_id)
+
+        if missing_ids:
+            async with di_objects.alchemy_uow:
+                loaded_articles = await di_objects.alchemy_uow.repositories[
+                    di_objects.article_alchemy_repository.name
+                ].retrieve_many(missing_ids)
+
+            for article_db in loaded_articles:
+                articles_db[article_db.id] = article_db
+                cls.article_cache.set(
+                    str(article_db.id),
+                    (views_epoch, article_db),
+                    sys.getsizeof(article_db.text)
+                    + consts.Articles.CACHED_ARTICLE_OVERHEAD_IN_BYTES,
+                )
+
+        found_ids = [article_id for article_id in unique_ids if article_id in articles_db]
+        rankable_ids = [
+            article_id
+            for article_id in found_ids
+            if cls.__is_rankable(articles_db[article_id])
+        ]
+
+        async with di_objects.redis_uow:
+            for article_id in found_ids:
+                await views_repository.increment(str(article_id))
+
+            await views_repository.retrieve_processing_many(
+                [str(article_id) for article_id in found_ids]
+            )
+
+            for article_id in rankable_ids:
+                await article_redis_repository.record_view(
+                    str(article_id),
+                    articles_db[article_id].views or 0,
+                    articles_db[article_id].creation_date,
+                )
+
+            redis_result = await di_objects.redis_uow.commit()
+
+            articles = {}
+
+            processing_views = redis_result[len(found_ids)]
+
+            for article_id, pending_views, article_processing_views in zip(
+                found_ids, redis_result, processing_views
+            ):
+                article_db = articles_db[article_id]
+                articles[article_id] = article_dto.ArticleDTO(
+                    id=article_db.id,
+                    user_id=article_db.user_id,
+                    user_name=article_db.user_name,
+                    topic_id=article_db.topic_id,
+                    topic_name=article_db.topic_name,
+                    creation_date=article_db.creation_date,
+                    text=article_db.text,
+                    views=(article_db.views or 0)
+                    + pending_views
+                    + int(article_processing_views or 0),
+                    version=article_db.version,
+                )
+
+            rank_results = redis_result[len(found_ids) + 1 :]
+            results_count = article_redis_repository.RECORD_VIEW_RESULTS_COUNT
+            is_popular_created = False
+
+            for index, article_id in enumerate(rankable_ids):
+                rank, is_popular = rank_results[
+                    index * results_count : (index + 1) * results_count
+                ][-2:]
+
+                if rank < consts.Articles.POPULAR_ARTICLES_COUNT and not is_popular:
+                    await article_redis_repository.create(articles[article_id])
+                    is_popular_created = True
+
+            if is_popular_created:
+                await di_objects.redis_uow.commit()
+
+        return [
+            articles[article_id] for article_id in article_ids if article_id in articles
+        ]
+
+    @staticmethod
+    def __encode_cursor(
+        article: article_dto.ArticleDTO | article_dto.ArticlePartialDTO,
+    ) -> str:
+        """
+        Закодировать курсор страницы по последней статье
+        :param article: последняя статья страницы
+        :return: курсор
+        """
+
+        cursor = f"{article.creation_date.isoformat()}|{article.id}"
+
+        return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("utf-8")
+
+    @staticmethod
+    def __decode_cursor(cursor: str) -> tuple[datetime.datetime, uuid.UUID]:
+        """
+        Раскодировать курсор страницы
+        :param cursor: курсор
+        :return: дата написания и идентификатор последней статьи предыдущей страницы
+        """
+
+        try:
+            creation_date, article_id = (
+                base64.urlsafe_b64decode(cursor.encode("utf-8"))
+                .decode("utf-8")
+                .split("|")
+            )
+
+            return datetime.datetime.fromisoformat(creation_date), uuid.UUID(article_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError("Некорректный курсор страницы")
+
+    @classmethod
+    async def list_articles(
+        cls,
+        filters: article_dto.ArticleFilterDTO,
+        articles_count: int = consts.Articles.DEFAULT_PAGE_ARTICLES_COUNT,
+        cursor: str | None = None,
+        columns: set[str] | None = None,
+    ) -> article_dto.ArticlePageDTO:
+        """
+        Выполнить логику получения страницы списка статей
+        :param filters: условия отбора статей
+        :param articles_count: количество статей на странице
+        :param cursor: курсор, полученный с предыдущей страницей
+        :param columns: поля статьи, которые нужно получить. По умолчанию - все поля
+        с именами автора и темы
+        :return: страница статей
+        """
+
+        if not 0 < articles_count <= consts.Articles.MAX_PAGE_ARTICLES_COUNT:
+            raise ValueError("Некорректное количество статей на странице")
+
+        di_objects = await cls.__get_di_objects()
+
+        async with di_objects.alchemy_uow:
+            articles_db = await di_objects.alchemy_uow.repositories[
+                di_objects.article_alchemy_repository.name
+            ].retrieve_page(
+                filters,
+                articles_count + 1,
+                cls.__decode_cursor(cursor) if cursor is not None else None,
+                columns,
+            )
+
+        has_next_page = len(articles_db) > articles_count
+        articles_db = articles_db[:articles_count]
+
+        if not articles_db:
+            return article_dto.ArticlePageDTO(articles=[])
+
+        if columns is not None and "views" not in columns:
+            return article_dto.ArticlePageDTO(
+                articles=articles_db,
+                next_cursor=(
+                    cls.__encode_cursor(articles_db[-1]) if has_next_page else None
+                ),
+            )
+
+        articles = await cls.__add_pending_views(di_objects, articles_db)
+
+        return article_dto.ArticlePageDTO(
+            articles=articles,
+            next_cursor=cls.__encode_cursor(articles[-1]) if has_next_page else None,
+        )
+
+    @staticmethod
+    async def __add_pending_views(
+        di_objects: __DIFactoriesObjectsDTO,
+        articles: list[article_dto.ArticleDTO | article_dto.ArticlePartialDTO],
+    ) -> list[article_dto.ArticleDTO | article_dto.ArticlePartialDTO]:
+        """
+        Добавить к просмотрам статей из БД просмотры, еще не перенесенные в БД
+        :param di_objects: объекты, полученные из фабрик DI-контейнеров
+        :param articles: статьи, полученные из БД
+        :return: статьи с актуальным количеством просмотров
+        """
+
+        views_repository = di_objects.redis_uow.repositories[
+            di_objects.article_views_repository.name
+        ]
+        article_ids = [str(article.id) for article in articles]
+
+        async with di_objects.redis_uow:
+            await views_repository.retrieve_many(article_ids)
+            await views_repository.retrieve_processing_many(article_ids)
+
+            pending_views, processing_views = await di_objects.redis_uow.commit()
+
+        return [
+            article.model_copy(
+                update={
+                    "views": (article.views or 0)
+                    + int(article_pending_views or 0)
+                    + int(article_processing_views or 0)
+                }
+            )
+            for article, article_pending_views, article_processing_views in zip(
+                articles, pending_views, processing_views
+            )
+        ]
+
+    @staticmethod
+    def __encode_search_cursor(
+        rank: float, article: article_dto.ArticleDTO | article_dto.ArticlePartialDTO
+    ) -> str:
+        """
+        Закодировать курсор страницы результатов поиска по последней статье
+        :param rank: релевантность последней статьи страницы
+        :param article: последняя статья страницы
+        :return: курсор
+        """
+
+        cursor = f"{rank!r}|{article.id}"
+
+        return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("utf-8")
+
+    @staticmethod
+    def __decode_search_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+        """
+        Раскодировать курсор страницы результатов поиска
+        :param cursor: курсор
+        :return: релевантность и идентификатор последней статьи предыдущей страницы
+        """
+
+        try:
+            rank, article_id = (
+                base64.urlsafe_b64decode(cursor.encode("utf-8"))
+                .decode("utf-8")
+                .split("|")
+            )
+
+            return float(rank), uuid.UUID(article_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError("Некорректный курсор страницы")
+
+    @classmethod
+    async def search_articles(
+        cls,
+        search_query: str,
+        filters: article_dto.ArticleFilterDTO,
+        articles_count: int = consts.Articles.DEFAULT_PAGE_ARTICLES_COUNT,
+        cursor: str | None = None,
+        columns: set[str] | None = None,
+    ) -> article_dto.ArticlePageDTO:
+        """
+        Выполнить логику полнотекстового поиска статей
+        :param search_query: поисковый запрос
+        :param filters: условия отбора статей
+        :param articles_count: количество статей на странице
+        :param cursor: курсор, полученный с предыдущей страницей
+        :param columns: поля статьи, которые нужно получить. По умолчанию - все поля
+        с именами автора и темы
+        :return: страница найденных статей, начиная с наиболее релевантных
+        """
+
+        search_query = search_query.strip()
+
+        if not search_query:
+            raise ValueError("Поисковый запрос не должен быть пустым")
+
+        if len(search_query) > consts.Articles.MAX_SEARCH_QUERY_LENGTH:
+            raise ValueError("Слишком длинный поисковый запрос")
+
+        if not 0 < articles_count <= consts.Articles.MAX_PAGE_ARTICLES_COUNT:
+            raise ValueError("Некорректное количество статей на странице")
+
+        di_objects = await cls.__get_di_objects()
+
+        async with di_objects.alchemy_uow:
+            results = await di_objects.alchemy_uow.repositories[
+                di_objects.article_alchemy_repository.name
+            ].search(
+                search_query,
+                filters,
+                articles_count + 1,
+                cls.__decode_search_cursor(cursor) if cursor is not None else None,
+                columns,
+            )
+
+        has_next_page = len(results) > articles_count
+        results = results[:articles_count]
+
+        if not results:
+            return article_dto.ArticlePageDTO(articles=[])
+
+        last_article, last_rank = results[-1]
+        next_cursor = (
+            cls.__encode_search_cursor(last_rank, last_article)
+            if has_next_page
+            else None
+        )
+        articles = [article for article, _ in results]
+
+        if columns is not None and "views" not in columns:
+            return article_dto.ArticlePageDTO(
+                articles=articles, next_cursor=next_cursor
+            )
+
+        return article_dto.ArticlePageDTO(
+            articles=await cls.__add_pending_views(di_objects, articles),
+            next_cursor=next_cursor,
+        )
+
+    @classmethod
+    async def flush_article_views(cls) -> None:
+        """
+        Выполнить логику переноса накопленных просмотров статей в БД.
+        Буфер переименовывается в хеш переносимых просмотров, который удаляется
+        только после коммита в БД, поэтому при сбое просмотры не теряются,
+        а переносятся при следующем запуске
+        """
+
+        di_objects = await cls.__get_di_objects()
+
+        uow = di_objects.alchemy_redis_uow_composite
+        alchemy_uow = uow.uows[enums.UOWName.ALCHEMY_UOW.value]
+        redis_uow = uow.uows[enums.UOWName.REDIS_UOW.value]
+        views_repository = redis_uow.repositories[
+            enums.RepositoryName.ARTICLE_VIEWS_REPOSITORY.value
+        ]
+
+        async with uow:
+            await views_repository.retrieve()
+            await views_repository.exists()
+
+            processing_views, has_pending_views = await redis_uow.commit()
+
+            # Просмотры, оставшиеся от прерванного переноса, переносятся первыми
+            if not processing_views:
+                if not has_pending_views:
+                    return
+
+                await views_repository.start_processing()
+                await views_repository.retrieve()
+
+                processing_views = (await redis_uow.commit())[1]
+
+            views = {
+                uuid.UUID(article_id.decode("utf-8")): int(article_views)
+                for article_id, article_views in processing_views.items()
+            }
+
+            await alchemy_uow.repositories[
+                enums.RepositoryName.ARTICLE_ALCHEMY_REPOSITORY.value
+            ].increment_views(views)
+
+            await alchemy_uow.commit()
+
+            await views_repository.delete()
+            await views_repository.increment_epoch()
+            await redis_uow.commit()
+
     @classmethod
     async def update_article(
         cls,
@@ -217,15 +879,10 @@ class ArticleService(abstract_service.AbstractService):
             topic = None
 
             if article_model.topic_id is not None:
-                topic = (
-                    await uow.uows[enums.UOWName.ALCHEMY_UOW.value]
-                    .repositories[enums.RepositoryName.TOPIC_REPOSITORY.value]
-                    .retrieve(str(article_model.topic_id))
+                topic = await topic_service.TopicService.retrieve_topic(
+                    article_model.topic_id
                 )
 
-                if topic is None:
-                    raise ValueError("Тема статьи не была найдена в базе данных")
-
             article = article_dto.ArticleDTO(
                 id=article_db.id,
                 user_id=user_model.id,
@@ -239,29 +896,32 @@ class ArticleService(abstract_service.AbstractService):
                     else article_db.text
                 ),
                 views=article_db.views,
+                version=article_db.version + 1,
             )
 
             await uow.uows[enums.UOWName.ALCHEMY_UOW.value].repositories[
                 enums.RepositoryName.ARTICLE_ALCHEMY_REPOSITORY.value
             ].update(article)
 
-            article_redis_repo_keys = list(article.model_fields.keys())
+            article_redis_repository = uow.uows[
+                enums.UOWName.REDIS_UOW.value
+            ].repositories[enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value]
 
-            (
-                uow.uows[enums.UOWName.REDIS_UOW.value]
-                .repositories[enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value]
-                .retrieve(str(article.id), article_redis_repo_keys)
-            )
+            await article_redis_repository.exists(str(article.id))
 
-            redis_article = await uow.uows[enums.UOWName.REDIS_UOW.value].commit()
+            is_popular = (await uow.uows[enums.UOWName.REDIS_UOW.value].commit())[0]
 
-            if not redis_article:
-                await uow.uows[enums.UOWName.REDIS_UOW.value].repositories[
-                    enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
-                ].create(article)
+            if is_popular:
+                await article_redis_repository.create(article)
+                await article_redis_repository.increment_generation()
 
             await uow.commit()
 
+        cls.article_cache.delete(str(article.id))
+
+        if is_popular:
+            cls.popular_articles_cache.invalidate()
+
         return article
 
     @classmethod
@@ -296,12 +956,14 @@ class ArticleService(abstract_service.AbstractService):
                 enums.RepositoryName.ARTICLE_ALCHEMY_REPOSITORY.value
             ].delete(str(article_id))
 
-            uow.uows[enums.UOWName.REDIS_UOW.value].repositories[
+            await uow.uows[enums.UOWName.REDIS_UOW.value].repositories[
                 enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
             ].delete(str(article_id))
 
             await uow.commit()
 
+        cls.article_cache.delete(str(article_id))
+
     @classmethod
     async def update_popular_articles(
         cls, date_from: datetime.datetime, articles_num: int
@@ -328,23 +990,117 @@ class ArticleService(abstract_service.AbstractService):
 
                 return
 
-            await uow.uows[enums.UOWName.REDIS_UOW.value].repositories[
+            redis_uow = uow.uows[enums.UOWName.REDIS_UOW.value]
+            redis_repository = redis_uow.repositories[
                 enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
-            ].retrieve_keys()
+            ]
 
-            current_redis_keys = (
-                await uow.uows[enums.UOWName.REDIS_UOW.value].commit()
-            )[0]
+            await redis_repository.retrieve_keys()
+            await redis_repository.retrieve_staged_keys()
+
+            current_article_ids, staged_article_ids = (
+                {article_id.decode("utf-8") for article_id in article_ids}
+                for article_ids in await redis_uow.commit()
+            )
 
-            if current_redis_keys:
-                await uow.uows[enums.UOWName.REDIS_UOW.value].repositories[
-                    enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
-                ].delete(*current_redis_keys)
+            await redis_repository.delete_staged(*staged_article_ids)
 
             for article in articles:
-                await uow.uows[enums.UOWName.REDIS_UOW.value].repositories[
-                    enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
-                ].create(article)
+                await redis_repository.create_staged(article)
+
+            await redis_uow.commit()
+
+            new_article_ids = {str(article.id) for article in articles}
+
+            await redis_repository.promote_staged(
+                list(new_article_ids),
+                list(current_article_ids - new_article_ids),
+                date_from,
+            )
+
+            await redis_uow.commit()
+
+        cls.popular_articles_cache.invalidate()
+
+    @classmethod
+    async def reindex_popular_articles(cls) -> None:
+        """
+        Выполнить логику восстановления индекса популярных статей по ключам Redis
+        """
+
+        di_objects = await cls.__get_di_objects()
+
+        uow = di_objects.redis_uow
+        repository = uow.repositories[
+            enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
+        ]
+        key_prefix = consts.Articles.REDIS_POPULAR_ARTICLE_KEY_PREFIX
+
+        async with uow:
+            scanned_keys = {}
+
+            for match in (
+                f"{key_prefix}*",
+                f"{consts.Articles.REDIS_HASH_ARTICLE_KEY_PREFIX}*",
+                consts.Articles.REDIS_HASH_STAGING_ARTICLE_KEY_PATTERN,
+                consts.Articles.REDIS_LEGACY_ARTICLE_KEY_PATTERN,
+            ):
+                scanned_keys[match] = []
+                cursor = None
+
+                while cursor != 0:
+                    await repository.scan_keys(cursor or 0, match)
+
+                    cursor, keys = (await uow.commit())[0]
+                    scanned_keys[match].extend(key.decode("utf-8") for key in keys)
+
+            article_ids = {
+                key.removeprefix(key_prefix) for key in scanned_keys[f"{key_prefix}*"]
+            }
+            legacy_keys = [
+                *scanned_keys[consts.Articles.REDIS_LEGACY_ARTICLE_KEY_PATTERN],
+                *scanned_keys[f"{consts.Articles.REDIS_HASH_ARTICLE_KEY_PREFIX}*"],
+                *scanned_keys[consts.Articles.REDIS_HASH_STAGING_ARTICLE_KEY_PATTERN],
+            ]
+
+            hash_keys = scanned_keys[
+                f"{consts.Articles.REDIS_HASH_ARTICLE_KEY_PREFIX}*"
+            ]
+
+            if hash_keys:
+                await repository.retrieve_hashes(*hash_keys)
+
+                for article_fields in await uow.commit():
+                    if not article_fields:
+                        continue
+
+                    try:
+                        article = cls.__decode_hash_article(article_fields)
+                    except (KeyError, ValueError) as e:
+                        print(f"Не удалось перенести статью из хеша Redis: {e}")
+
+                        continue
+
+                    await repository.create(article)
+                    article_ids.add(str(article.id))
+
+                await uow.commit()
+
+            await repository.retrieve_keys()
+
+            indexed_article_ids = {
+                article_id.decode("utf-8") for article_id in (await uow.commit())[0]
+            }
+            stale_article_ids = indexed_article_ids - article_ids
+
+            if legacy_keys:
+                await repository.delete_keys(*legacy_keys)
+
+            if stale_article_ids:
+                await repository.delete(*stale_article_ids)
+
+            if article_ids:
+                await repository.add_keys(*article_ids)
 
             await uow.commit()
 
@@ -355,49 +1111,110 @@ class ArticleService(abstract_service.AbstractService):
         :return: список популярных статей
         """
 
+        articles, _ = await cls.retrieve_popular_articles_if_modified(set())
+
+        return articles
+
+    @classmethod
+    async def retrieve_rendered_popular_articles(
+        cls,
+        name: str,
+        render: Callable[[list[article_dto.ArticleDTO], str], Any],
+    ) -> Any:
+        """
+        Выполнить логику получения готового представления списка лучших статей.
+        Представление строится один раз и хранится в кэше stale-while-revalidate,
+        который сбрасывается при смене поколения популярных статей
+        :param name: название представления, например формат ответа
+        :param render: функция, строящая представление по статьям и их ETag
+        :return: представление списка популярных статей
+        """
+
+        async def load() -> Any:
+            articles, etag = await cls.retrieve_popular_articles_if_modified(set())
+
+            return render(articles, etag)
+
+        return await cls.popular_articles_cache.get(name, load)
+
+    @classmethod
+    async def retrieve_popular_articles_if_modified(
+        cls, etags: set[str]
+    ) -> tuple[list[article_dto.ArticleDTO] | None, str]:
+        """
+        Выполнить логику получения списка лучших статей, если он изменился с прошлого
+        запроса. ETag зависит от поколения популярных статей и их рейтинга, поэтому
+        проверка не требует чтения самих статей
+        :param etags: ETag из заголовка If-None-Match
+        :return: список популярных статей (None - если у клиента актуальная версия)
+        и его ETag
+        """
+
         di_objects = await cls.__get_di_objects()
 
         uow = di_objects.redis_uow
+        repository = uow.repositories[
+            enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
+        ]
 
         async with uow:
-            await uow.repositories[
-                enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
-            ].retrieve_keys()
+            await repository.retrieve_rank(consts.Articles.POPULAR_ARTICLES_COUNT)
+            await repository.retrieve_generation()
+
+            rank, generation = await uow.commit()
+
+            article_views = {
+                article_id.decode("utf-8"): views for article_id, views in rank
+            }
+            article_ids = list(article_views.keys())
+            etag = etag_helper.make_etag(
+                generation,
+                *(f"{article_id}:{views}" for article_id, views in article_views.items()),
+            )
 
-            article_ids = (await uow.commit())[0]
+            if etag_helper.is_etag_matched(etag, etags):
+                return None, etag
 
             if not article_ids:
                 print("За рассматриваемый период не было опубликовано новых статей")
 
-                return []
+                return [], etag
 
-            result = []
-            article_redis_repo_keys = list(article_dto.ArticleDTO.model_fields.keys())
+            await repository.retrieve_many(article_ids)
 
-            for article_id in article_ids:
-                await uow.repositories[
-                    enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value
-                ].retrieve(article_id, article_redis_repo_keys)
+            packed_articles = (await uow.commit())[0]
 
-                article_model_fields = (await uow.commit())[0]
-                article_model_fields = [
-                    field.decode("utf-8") for field in article_model_fields
-                ]
+        return [
+            article.model_copy(update={"views": int(article_views[article_id])})
+            for article_id, article in zip(
+                article_ids, article_codec.decode_articles(packed_articles)
+            )
+            if article is not None
+        ], etag
 
-                result.append(
-                    article_dto.ArticleDTO(
-                        id=uuid.UUID(article_model_fields[0]),
-                        user_id=uuid.UUID(article_model_fields[1]),
-                        user_name=article_model_fields[2],
-                        creation_date=datetime.datetime.strptime(
-                            article_model_fields[3],
-                            consts.Articles.DATETIME_STRING_FORMAT,
-                        ),
-                        topic_name=article_model_fields[4],
-                        topic_id=uuid.UUID(article_model_fields[5]),
-                        text=article_model_fields[6],
-                        views=article_model_fields[7],
-                    )
-                )
+    @staticmethod
+    def __decode_hash_article(article_fields: dict[bytes, bytes]) -> article_dto.ArticleDTO:
+        """
+        Собрать объект статьи из хеша Redis прежнего формата
+        :param article_fields: поля и значения хеша статьи
+        :return: объект статьи
+        """
 
-            return result
+        article_fields = {
+            key.decode("utf-8"): value.decode("utf-8")
+            for key, value in article_fields.items()
+        }
+
+        return article_dto.ArticleDTO(
+            id=uuid.UUID(article_fields["id"]),
+            user_id=uuid.UUID(article_fields["user_id"]),
+            user_name=article_fields["user_name"],
+            creation_date=datetime.datetime.strptime(
+                article_fields["creation_date"],
+                consts.Articles.DATETIME_STRING_FORMAT,
+            ),
+            topic_name=article_fields["topic_name"],
+            topic_id=uuid.UUID(article_fields["topic_id"]),
+            text=article_fields["text"],
+            views=int(article_fields["views"]),
+        )
@@ -98,19 +98,22 @@ class AuthService(abstract_service.AbstractService):
         )
         jwt_manager = jwt_helper.JWTHelper()
 
+        async with di_objects.alchemy_uow:
+            if await di_objects.alchemy_uow.repositories[
+                di_objects.user_repository.name
+            ].retrieve(user_name=user_model.name):
+                raise ValueError("Пользователь уже зарегистрирован")
+
         user = user_dto.UserDTO(
             id=uuid.uuid4(),
             name=user_model.name,
-            password=password_manager.encode_password(user_model.password),
+            password=await password_manager.encode_password_async(
+                user_model.password
+            ),
             registration_date=datetime.datetime.now(),
         )
 
         async with di_objects.alchemy_uow:
-            if await di_objects.alchemy_uow.repositories[
-                di_objects.user_repository.name
-            ].retrieve(user_name=user_model.name):
-                raise ValueError("Пользователь уже зарегистрирован")
-
             di_objects.alchemy_uow.repositories[di_objects.user_repository.name].create(
                 user
             )
@@ -160,10 +163,10 @@ class AuthService(abstract_service.AbstractService):
             if user is None:
                 raise ValueError("Пользователь не зарегистрирован")
 
-            if not password_manager.is_password_valid(
-                user_model.password, user.password
-            ):
-                raise ValueError("Неверный пароль")
+        if not await password_manager.is_password_valid_async(
+            user_model.password, user.password
+        ):
+            raise ValueError("Неверный пароль")
 
         access_token = jwt_manager.issue_jwt(user, consts.Auth.ACCESS_TOKEN_ATTRS)
         refresh_token = jwt_manager.issue_jwt(user, consts.Auth.REFRESH_TOKEN_ATTRS)
@@ -0,0 +1,96 @@
+import types
+import uuid
+
+from dependency_injector.wiring import Provide
+from pydantic import Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from abstracts import abstract_repository, abstract_service, abstract_uow, base_dto
+from dto import topic_dto
+from tools import di_container
+
+
+class TopicService(abstract_service.AbstractService):
+    """
+    Сервис для работы с каталогом тем статей
+    """
+
+    class __DIFactoriesObjectsDTO(base_dto.PydanticBase):
+        """
+        DTO для объектов, получаемых из фабрик DI-контейнеров
+        """
+
+        alchemy_session: AsyncSession = Field(description="Сессия Алхимии")
+
+        topic_repository: abstract_repository.AbstractAlchemyRepository = Field(
+            description="Репозиторий для работы с темами статей"
+        )
+
+        alchemy_uow: abstract_uow.AbstractUOW = Field(
+            description="UOW для работы с репозиториями Алхимии"
+        )
+
+    alchemy_session_factory = Provide[
+        di_container.SessionContainer.alchemy_session_factory
+    ]
+
+    topic_repository_factory = Provide[
+        di_container.RepositoryContainer.topic_repository_factory
+    ]
+
+    alchemy_uow_factory = Provide[di_container.UOWContainer.alchemy_uow_factory]
+
+    __topics: types.MappingProxyType[uuid.UUID, topic_dto.TopicDTO] | None = None
+
+    @classmethod
+    async def __get_di_objects(cls) -> __DIFactoriesObjectsDTO:
+        """
+        Получить объекты из фабрик DI-контейнеров
+        """
+
+        async with cls.alchemy_session_factory.session_maker() as async_session:
+            alchemy_session = async_session
+
+        topic_repository = cls.topic_repository_factory(alchemy_session)
+
+        alchemy_uow = cls.alchemy_uow_factory()
+        alchemy_uow.add_repository(topic_repository.name, topic_repository)
+
+        return cls.__DIFactoriesObjectsDTO(
+            alchemy_session=alchemy_session,
+            topic_repository=topic_repository,
+            alchemy_uow=alchemy_uow,
+        )
+
+    @classmethod
+    async def refresh_topics(cls) -> None:
+        """
+        Загрузить каталог тем статей из БД
+        """
+
+        di_objects = await cls.__get_di_objects()
+
+        async with di_objects.alchemy_uow:
+            topics = await di_objects.alchemy_uow.repositories[
+                di_objects.topic_repository.name
+            ].retrieve_all()
+
+        cls.__topics = types.MappingProxyType({topic.id: topic for topic in topics})
+
+    @classmethod
+    async def retrieve_topic(cls, topic_id: uuid.UUID) -> topic_dto.TopicDTO:
+        """
+        Получить тему статьи из каталога
+        :param topic_id: идентификатор темы статьи
+        :return: тема статьи
+        """
+
+        if cls.__topics is None:
+            await cls.refresh_topics()
+
+        topic = cls.__topics.get(topic_id)
+
+        if topic is None:
+            raise ValueError("Тема статьи не была найдена в базе данных")
+
+        return topic
@@ -83,3 +83,24 @@ class UserService(abstract_service.AbstractService):
             password=user.password,
             registration_date=user.registration_date,
         )
+
+    @classmethod
+    async def get_users(
+        cls, user_ids: list[uuid.UUID]
+    ) -> list[user_dto.UserDTO | None]:
+        """
+        Выполнить логику получения данных нескольких пользователей
+        :param user_ids: идентификаторы пользователей
+        :return: пользователи в порядке идентификаторов, None - если пользователь не найден
+        """
+
+        di_objects = await cls.__get_di_objects()
+
+        async with di_objects.alchemy_uow:
+            users = await di_objects.alchemy_uow.repositories[
+                di_objects.user_repository.name
+            ].retrieve_many(user_ids)
+
+        users_by_id = {user.id: user for user in users}
+
+        return [users_by_id.get(user_id) for user_id in user_ids]
@@ -0,0 +1,145 @@
+import asyncio
+import datetime
+import os
+from typing import AsyncGenerator
+import uuid
+
+import dotenv
+import pytest
+from sqlalchemy import delete, text
+from sqlalchemy.exc import SQLAlchemyError
+
+dotenv.load_dotenv()
+
+# Настройки приложения читаются при импорте, поэтому обязательным переменным нужны
+# значения и без .env. Postgres при этом может быть недоступен - тогда тесты,
+# которым он нужен, пропускаются
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-articles-aggregator")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRATION_IN_SEC", "600")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRATION_IN_SEC", "6000")
+os.environ.setdefault("PG_PASSWORD", "")
+
+from dependency_injector import providers  # noqa: E402
+
+from dto import article_dto  # noqa: E402
+from repositories.models import article_model, user_model  # noqa: E402
+from tests import fake_redis  # noqa: E402
+from tools import di_container, enums  # noqa: E402
+from tools.factories import session_factory  # noqa: E402
+
+POSTGRES_CONNECT_TIMEOUT_IN_SEC = 3
+SERVICE_MODULES = [
+    "services.article_service",
+    "services.auth_service",
+    "services.user_service",
+    "services.topic_service",
+]
+
+
+@pytest.fixture
+async def alchemy_session_factory() -> (
+    AsyncGenerator[session_factory.AlchemySessionFactory, None]
+):
+    """
+    Фабрика сессий Алхимии, подключенная к Postgres из настроек приложения.
+    Если Postgres недоступен, тест пропускается
+    """
+
+    factory = session_factory.AlchemySessionFactory()
+    factory.connect()
+
+    try:
+        async with asyncio.timeout(POSTGRES_CONNECT_TIMEOUT_IN_SEC):
+            async with factory.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+    except (OSError, SQLAlchemyError, TimeoutError) as e:
+        await factory.dispose()
+        pytest.skip(f"Postgres недоступен: {e}")
+
+    yield factory
+
+    await factory.dispose()
+
+
+@pytest.fixture
+async def containers(
+    alchemy_session_factory: session_factory.AlchemySessionFactory,
+) -> AsyncGenerator[dict, None]:
+    """
+    DI-контейнеры, подключенные к сервисам: Postgres из настроек приложения
+    и Redis на fakeredis
+    """
+
+    session_container = di_container.SessionContainer()
+    session_container.alchemy_session_factory.override(
+        providers.Object(alchemy_session_factory)
+    )
+    session_container.redis_article_session_factory.override(
+        providers.Singleton(fake_redis.FakeRedisSessionFactory)
+    )
+    session_container.redis_token_session_factory.override(
+        providers.Singleton(fake_redis.FakeRedisSessionFactory)
+    )
+
+    wired_containers = {
+        "session_container": session_container,
+        "repository_container": di_container.RepositoryContainer(),
+        "uow_container": di_container.UOWContainer(),
+        "cache_container": di_container.CacheContainer(),
+    }
+
+    for container in wired_containers.values():
+        container.wire(modules=SERVICE_MODULES)
+
+    yield wired_containers
+
+    for container in wired_containers.values():
+        container.unwire()
+
+    await session_container.redis_article_session_factory().dispose()
+    await session_container.redis_token_session_factory().dispose()
+
+
+@pytest.fixture
+async def article(
+    alchemy_session_factory: session_factory.AlchemySessionFactory,
+) -> AsyncGenerator[article_dto.ArticleDTO, None]:
+    """
+    Статья нового пользователя, записанная в БД. После теста удаляется
+    """
+
+    user_id = uuid.uuid4()
+    article_id = uuid.uuid4()
+    topic = enums.ArticleTopic.TECH
+
+    async with alchemy_session_factory.session_maker() as session:
+        session.add(
+            user_model.User(
+                id=user_id, name=f"t{user_id.hex[:12]}", hashed_password="-"
+            )
+        )
+        await session.flush()
+        session.add(
+            article_model.Article(
+                id=article_id,
+                user_id=user_id,
+                creation_date=datetime.datetime.now(),
+                topic_id=topic.id,
+                text="Статья для тестов",
+                views=0,
+            )
+        )
+        await session.commit()
+
+    yield article_dto.ArticleDTO(
+        id=article_id, user_id=user_id, topic_id=topic.id, text="Статья для тестов"
+    )
+
+    async with alchemy_session_factory.session_maker() as session:
+        await session.execute(
+            delete(article_model.Article).where(article_model.Article.id == article_id)
+        )
+        await session.execute(
+            delete(user_model.User).where(user_model.User.id == user_id)
+        )
+        await session.commit()
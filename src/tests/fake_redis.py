@@ -0,0 +1,37 @@
+import fakeredis
+from redis.asyncio.client import Pipeline
+
+
+class FakeRedisSessionFactory:
+    """
+    Фабрика сессий Redis поверх fakeredis для запуска без сервера Redis
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализировать переменные
+        """
+
+        self.redis_client = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+
+    def __call__(self) -> Pipeline:
+        """
+        Получить новую сессию Redis
+        """
+
+        return self.redis_client.pipeline()
+
+    async def dispose(self) -> None:
+        """
+        Закрыть клиент
+        """
+
+        await self.redis_client.aclose()
+
+    def get_pool_stats(self) -> None:
+        """
+        Получить статистику пула соединений. У fakeredis нет пула соединений
+        :return: None
+        """
+
+        return
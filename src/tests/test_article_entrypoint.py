@@ -0,0 +1,45 @@
+from fastapi import HTTPException, status
+import pytest
+
+from tools import consts
+from web.fast_api.entrypoints import article_entrypoint
+
+BAD_CURSOR = "garbage"
+
+
+async def test_list_with_bad_cursor_is_client_error(containers: dict) -> None:
+    """
+    Некорректный курсор списка статей - ошибка клиента, а не сервера
+    """
+
+    with pytest.raises(HTTPException) as error:
+        await article_entrypoint.retrieve_articles(
+            article_ids=None,
+            topic_id=None,
+            user_id=None,
+            created_after=None,
+            created_before=None,
+            cursor=BAD_CURSOR,
+            limit=consts.Articles.DEFAULT_PAGE_ARTICLES_COUNT,
+        )
+
+    assert error.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_search_with_bad_cursor_is_client_error(containers: dict) -> None:
+    """
+    Некорректный курсор результатов поиска - ошибка клиента, а не сервера
+    """
+
+    with pytest.raises(HTTPException) as error:
+        await article_entrypoint.search_articles(
+            search_query="статья",
+            topic_id=None,
+            user_id=None,
+            created_after=None,
+            created_before=None,
+            cursor=BAD_CURSOR,
+            limit=consts.Articles.DEFAULT_PAGE_ARTICLES_COUNT,
+        )
+
+    assert error.value.status_code == status.HTTP_400_BAD_REQUEST
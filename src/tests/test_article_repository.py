@@ -0,0 +1,138 @@
+import datetime
+from typing import AsyncGenerator
+import uuid
+
+import fakeredis
+import pytest
+from redis.asyncio.client import Pipeline
+
+from dto import article_dto
+from repositories import article_repository
+from tools import consts, enums
+
+
+@pytest.fixture
+async def redis_client() -> AsyncGenerator[fakeredis.FakeAsyncRedis, None]:
+    """
+    Клиент fakeredis с пустой базой
+    """
+
+    client = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+
+    yield client
+
+    await client.aclose()
+
+
+def make_repository(
+    redis_session: Pipeline,
+) -> article_repository.ArticleRedisRepository:
+    """
+    Создать репозиторий популярных статей
+    :param redis_session: сессия Redis
+    :return: репозиторий
+    """
+
+    return article_repository.ArticleRedisRepository(
+        enums.RepositoryName.ARTICLE_REDIS_REPOSITORY.value, redis_session
+    )
+
+
+def make_article(
+    creation_date: datetime.datetime, views: int
+) -> article_dto.ArticleDTO:
+    """
+    Создать статью
+    :param creation_date: дата написания статьи
+    :param views: количество просмотров
+    :return: статья
+    """
+
+    return article_dto.ArticleDTO(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        user_name="author",
+        creation_date=creation_date,
+        topic_id=enums.ArticleTopic.TECH.id,
+        topic_name=enums.ArticleTopic.TECH.name,
+        text="text",
+        views=views,
+    )
+
+
+async def test_promote_staged_merges_rank(
+    redis_client: fakeredis.FakeAsyncRedis,
+) -> None:
+    """
+    Новое поколение объединяется с текущим рейтингом: просмотры статей вне нового
+    поколения и еще не перенесенные в БД просмотры сохраняются, а статьи,
+    написанные до начала периода, убираются
+    """
+
+    now = datetime.datetime.now()
+    date_from = now - datetime.timedelta(hours=1)
+    climbing_article = make_article(now, 0)
+    viewed_article = make_article(now, 40)
+    expired_article = make_article(now - datetime.timedelta(hours=2), 100)
+    new_article = make_article(now, 30)
+
+    repository = make_repository(redis_client.pipeline())
+
+    for _ in range(7):
+        await repository.record_view(
+            str(climbing_article.id), 0, climbing_article.creation_date
+        )
+
+    await repository.record_view(
+        str(viewed_article.id), 50, viewed_article.creation_date
+    )
+    await repository.record_view(
+        str(expired_article.id), 100, expired_article.creation_date
+    )
+    await repository.session.execute()
+
+    await repository.create_staged(viewed_article)
+    await repository.create_staged(new_article)
+    await repository.session.execute()
+
+    await repository.promote_staged(
+        [str(viewed_article.id), str(new_article.id)], [], date_from
+    )
+    await repository.session.execute()
+
+    rank = dict(
+        await redis_client.zrange(
+            consts.Articles.REDIS_POPULAR_RANK_KEY, 0, -1, withscores=True
+        )
+    )
+
+    assert rank == {
+        str(viewed_article.id).encode("utf-8"): 51,
+        str(new_article.id).encode("utf-8"): 30,
+        str(climbing_article.id).encode("utf-8"): 7,
+    }
+    assert not await redis_client.exists(consts.Articles.REDIS_STAGING_RANK_KEY)
+    assert await redis_client.zscore(
+        consts.Articles.REDIS_POPULAR_CREATION_DATE_KEY, str(expired_article.id)
+    ) is None
+
+
+async def test_record_view_results_layout(
+    redis_client: fakeredis.FakeAsyncRedis,
+) -> None:
+    """
+    record_view добавляет в транзакцию RECORD_VIEW_RESULTS_COUNT результатов,
+    последние два из них - место статьи в рейтинге и признак ее хранения
+    """
+
+    article = make_article(datetime.datetime.now(), 3)
+    repository = make_repository(redis_client.pipeline())
+
+    await repository.create(article)
+    await repository.session.execute()
+
+    await repository.record_view(str(article.id), 3, article.creation_date)
+    results = await repository.session.execute()
+
+    assert len(results) == repository.RECORD_VIEW_RESULTS_COUNT
+    assert results[-2:] == [0, True]
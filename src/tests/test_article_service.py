@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from dto import article_dto
+from repositories import article_repository
+from services import article_service
+
+ArticleService = article_service.ArticleService
+
+
+async def test_batch_read_keeps_article_etag(
+    containers: dict, article: article_dto.ArticleDTO
+) -> None:
+    """
+    ETag статьи, закэшированной пакетным чтением, совпадает с ETag холодного
+    одиночного чтения, и клиент с актуальной копией получает 304
+    """
+
+    article_cache = containers["cache_container"].article_cache()
+
+    await ArticleService.retrieve_articles([article.id])
+    warm_article, warm_etag = await ArticleService.retrieve_article_if_modified(
+        article.id, set()
+    )
+
+    article_cache.delete(str(article.id))
+    cold_article, cold_etag = await ArticleService.retrieve_article_if_modified(
+        article.id, {warm_etag}
+    )
+
+    assert warm_article is not None
+    assert cold_article is None
+    assert cold_etag == warm_etag
+
+
+async def test_search_loads_only_requested_columns(
+    containers: dict, article: article_dto.ArticleDTO
+) -> None:
+    """
+    Поиск с выбранными полями возвращает частичные записи без текста статьи
+    """
+
+    articles_page = await ArticleService.search_articles(
+        "статья",
+        article_dto.ArticleFilterDTO(user_id=article.user_id),
+        columns={"views"},
+    )
+
+    assert articles_page.articles == [
+        article_dto.ArticlePartialDTO(id=article.id, views=0)
+    ]
+
+
+async def test_interrupted_flush_keeps_views(
+    containers: dict,
+    article: article_dto.ArticleDTO,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Во время переноса в БД просмотры не пропадают из ответов, а если перенос
+    прервался, они переносятся при следующем запуске
+    """
+
+    views_during_flush = []
+
+    async def interrupt(*args, **kwargs) -> None:
+        article_during_flush = await ArticleService.retrieve_article(article.id)
+        views_during_flush.append(article_during_flush.views)
+
+        raise asyncio.CancelledError
+
+    await ArticleService.retrieve_article(article.id)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            article_repository.ArticleAlchemyRepository, "increment_views", interrupt
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await ArticleService.flush_article_views()
+
+    assert views_during_flush == [2]
+    assert (await ArticleService.retrieve_article(article.id)).views == 3
+
+    await ArticleService.flush_article_views()
+    await ArticleService.flush_article_views()
+
+    assert (await ArticleService.retrieve_article(article.id)).views == 4
+    assert (await ArticleService.retrieve_articles([article.id]))[0].views == 5
+
+
+async def test_stale_etag_reuses_loaded_article(
+    containers: dict,
+    article: article_dto.ArticleDTO,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    При устаревшем ETag статья отдается по уже загруженным данным,
+    без повторного полного чтения, а просмотр учитывается
+    """
+
+    async def fail(*args, **kwargs) -> None:
+        raise AssertionError("Статья прочитана повторно")
+
+    _, etag = await ArticleService.retrieve_article_if_modified(article.id, set())
+    monkeypatch.setattr(ArticleService, "retrieve_article", fail)
+
+    not_modified = await ArticleService.retrieve_article_if_modified(
+        article.id, {etag}
+    )
+    fresh_article, fresh_etag = await ArticleService.retrieve_article_if_modified(
+        article.id, {'"stale"'}
+    )
+    fresh_not_modified = await ArticleService.retrieve_article_if_modified(
+        article.id, {fresh_etag}
+    )
+
+    assert not_modified == (None, etag)
+    assert fresh_article.views == 2
+    assert fresh_article.text == article.text
+    assert fresh_not_modified == (None, fresh_etag)
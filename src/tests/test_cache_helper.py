@@ -0,0 +1,55 @@
+import asyncio
+
+from tools import cache_helper
+
+
+async def test_swr_cache_miss_survives_cancelled_waiter() -> None:
+    """
+    Отмена одного из запросов, ждущих загрузки записи, не отменяет загрузку
+    для остальных
+    """
+
+    cache = cache_helper.SWRCache(max_age_in_sec=10)
+
+    async def loader() -> list[int]:
+        await asyncio.sleep(0.05)
+
+        return [1]
+
+    cancelled_get = asyncio.create_task(cache.get("key", loader))
+    waiting_get = asyncio.create_task(cache.get("key", loader))
+    await asyncio.sleep(0)
+    cancelled_get.cancel()
+
+    assert await waiting_get == [1]
+    assert cancelled_get.cancelled()
+
+
+async def test_swr_cache_drops_refresh_started_before_invalidation() -> None:
+    """
+    Обновление, начатое до инвалидации, не сохраняет прочитанное им прежнее
+    значение как актуальное
+    """
+
+    cache = cache_helper.SWRCache(max_age_in_sec=10)
+    source = {"value": "old"}
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def loader() -> str:
+        value = source["value"]
+        loading.set()
+        await release.wait()
+
+        return value
+
+    first_get = asyncio.create_task(cache.get("key", loader))
+    await loading.wait()
+
+    source["value"] = "new"
+    cache.invalidate()
+    release.set()
+
+    assert await first_get == "new"
+    assert await cache.get("key", loader) == "new"
+    assert cache.stats().stale_hits == 0
@@ -0,0 +1,158 @@
+import datetime
+import uuid
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dto import article_dto
+from repositories import article_repository, user_repository
+from repositories.models import article_model
+from tools import enums
+from tools.factories import session_factory
+
+ARTICLES_COUNT = 10
+
+
+async def explain(
+    alchemy_session_factory: session_factory.AlchemySessionFactory,
+    run_query,
+) -> str:
+    """
+    Выполнить запрос репозитория и получить план этого же запроса.
+    Последовательное чтение запрещено, поэтому на маленьких таблицах план
+    показывает, может ли запрос использовать индекс, а не что дешевле.
+    Значения условий отбора берутся новые, чтобы выбор индекса не зависел
+    от того, какие данные уже лежат в тестовой БД
+    :param alchemy_session_factory: фабрика сессий Алхимии
+    :param run_query: корутинная функция, выполняющая запрос в переданной сессии
+    :return: план запроса
+    """
+
+    statements = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sync_engine = alchemy_session_factory.engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+
+    try:
+        async with alchemy_session_factory.session_maker() as session:
+            await session.execute(text("SET LOCAL enable_seqscan = off"))
+            statements.clear()
+            await run_query(session)
+            statement, parameters = statements[-1]
+
+            connection = await session.connection()
+            plan = await connection.exec_driver_sql(
+                f"EXPLAIN {statement}", parameters
+            )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    return "\n".join(row[0] for row in plan)
+
+
+@pytest.mark.parametrize(
+    ("filters", "index_name"),
+    [
+        (article_dto.ArticleFilterDTO(), "ix_article_creation_date_id"),
+        (
+            article_dto.ArticleFilterDTO(user_id=uuid.uuid4()),
+            "ix_article_user_id_creation_date_id",
+        ),
+        (
+            article_dto.ArticleFilterDTO(topic_id=uuid.uuid4()),
+            "ix_article_topic_id_creation_date_id",
+        ),
+        (
+            article_dto.ArticleFilterDTO(
+                topic_id=uuid.uuid4(),
+                created_after=datetime.datetime.now() - datetime.timedelta(days=7),
+            ),
+            "ix_article_topic_id_creation_date_id",
+        ),
+    ],
+)
+@pytest.mark.parametrize("has_cursor", [False, True])
+async def test_article_page_uses_index(
+    alchemy_session_factory: session_factory.AlchemySessionFactory,
+    filters: article_dto.ArticleFilterDTO,
+    index_name: str,
+    has_cursor: bool,
+) -> None:
+    """
+    Страница статей с условиями отбора и без них читается по индексу,
+    который уже упорядочен так же, как страница
+    """
+
+    cursor = (datetime.datetime.now(), uuid.uuid4()) if has_cursor else None
+
+    async def run_query(session: AsyncSession) -> None:
+        await article_repository.ArticleAlchemyRepository(
+            enums.RepositoryName.ARTICLE_ALCHEMY_REPOSITORY.value, session
+        ).retrieve_page(filters, ARTICLES_COUNT, cursor)
+
+    plan = await explain(alchemy_session_factory, run_query)
+
+    assert f"Index Scan Backward using {index_name} on article" in plan
+    assert "Sort" not in plan
+
+
+async def test_user_lookup_by_name_uses_index(
+    alchemy_session_factory: session_factory.AlchemySessionFactory,
+) -> None:
+    """
+    Пользователь по имени ищется по уникальному индексу имени
+    """
+
+    async def run_query(session: AsyncSession) -> None:
+        await user_repository.UserRepository(
+            enums.RepositoryName.USER_REPOSITORY.value, session
+        ).retrieve(user_name="missing-user")
+
+    plan = await explain(alchemy_session_factory, run_query)
+
+    assert "ix_user_name" in plan
+
+
+async def test_article_search_uses_index(
+    alchemy_session_factory: session_factory.AlchemySessionFactory,
+) -> None:
+    """
+    Поиск статей по тексту идет по GIN-индексу выражения поискового вектора
+    """
+
+    async def run_query(session: AsyncSession) -> None:
+        await article_repository.ArticleAlchemyRepository(
+            enums.RepositoryName.ARTICLE_ALCHEMY_REPOSITORY.value, session
+        ).search("новости", article_dto.ArticleFilterDTO(), ARTICLES_COUNT)
+
+    plan = await explain(alchemy_session_factory, run_query)
+
+    assert "Bitmap Index Scan on ix_article_search_vector" in plan
+
+
+def test_search_index_matches_model() -> None:
+    """
+    Выражение GIN-индекса в миграции совпадает с выражением модели, иначе
+    поиск перестанет использовать индекс без какой-либо ошибки
+    """
+
+    migration = (
+        ScriptDirectory.from_config(Config("alembic.ini"))
+        .get_revision("7b2d4e8c1a96")
+        .module
+    )
+    index = next(
+        index
+        for index in article_model.Article.__table__.indexes
+        if index.name == "ix_article_search_vector"
+    )
+
+    assert [str(expression) for expression in index.expressions] == [
+        migration.SEARCH_VECTOR_EXPRESSION
+    ]
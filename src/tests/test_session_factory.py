@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from typing import Generator
+
+import fakeredis
+from pydantic import RedisDsn
+import pytest
+
+from tools import app_config
+from tools.factories import session_factory
+
+REDIS_POOL_SIZE = 4
+REDIS_POOL_TIMEOUT_IN_SEC = 30
+CONCURRENT_SESSIONS = REDIS_POOL_SIZE * 5
+PIPELINES_PER_SESSION = 3
+
+
+@pytest.fixture
+def redis_dsn() -> Generator[RedisDsn, None, None]:
+    """
+    DSN сервера fakeredis, принимающего TCP-соединения на свободном порту
+    """
+
+    server = fakeredis.TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    host, port = server.server_address
+
+    yield RedisDsn(f"redis://{host}:{port}")
+
+    server.shutdown()
+    server.server_close()
+
+
+async def test_redis_pool_limit_holds_under_concurrent_pipelines(
+    redis_dsn: RedisDsn, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Конвейеров одновременно больше, чем соединений в пуле: пул не превышает
+    предел, соединения не делятся между конвейерами и возвращаются в пул
+    """
+
+    monkeypatch.setattr(app_config.config, "redis_max_connections", REDIS_POOL_SIZE)
+    monkeypatch.setattr(
+        app_config.config, "redis_pool_timeout_in_sec", REDIS_POOL_TIMEOUT_IN_SEC
+    )
+    factory = session_factory.BaseRedisSessionFactory(redis_dsn)
+    max_in_use = 0
+    is_running = True
+
+    async def watch_pool() -> None:
+        nonlocal max_in_use
+
+        while is_running:
+            max_in_use = max(max_in_use, factory.get_pool_stats().in_use)
+            await asyncio.sleep(0)
+
+    async def run_session(index: int) -> list[list]:
+        results = []
+
+        for iteration in range(PIPELINES_PER_SESSION):
+            pipeline = factory()
+            pipeline.set(f"stress:{index}", f"{index}:{iteration}")
+            pipeline.get(f"stress:{index}")
+            results.append(await pipeline.execute())
+
+        return results
+
+    watcher = asyncio.create_task(watch_pool())
+
+    try:
+        sessions_results = await asyncio.gather(
+            *[run_session(index) for index in range(CONCURRENT_SESSIONS)]
+        )
+    finally:
+        is_running = False
+        await watcher
+
+    pool_stats = factory.get_pool_stats()
+    await factory.dispose()
+
+    for index, results in enumerate(sessions_results):
+        assert results == [
+            [True, f"{index}:{iteration}".encode("utf-8")]
+            for iteration in range(PIPELINES_PER_SESSION)
+        ]
+
+    assert max_in_use == REDIS_POOL_SIZE
+    assert pool_stats.max_size == REDIS_POOL_SIZE
+    assert pool_stats.opened <= REDIS_POOL_SIZE
+    assert pool_stats.in_use == 0
@@ -49,6 +49,16 @@ class Config(BaseSettings):
         description="Время жизни refresh-токена в секундах",
         alias="REFRESH_TOKEN_EXPIRATION_IN_SEC",
     )
+    password_hasher_max_workers: int = Field(
+        description="Количество потоков для хеширования и проверки паролей",
+        default=4,
+        alias="PASSWORD_HASHER_MAX_WORKERS",
+    )
+    token_cache_max_size: int = Field(
+        description="Максимальное количество проверенных токенов в кэше. 0 - кэш отключен",
+        default=10_000,
+        alias="TOKEN_CACHE_MAX_SIZE",
+    )
 
     postgres_username: str = Field(
         description="Имя пользователя БД Postgres", default="admin", alias="PG_USERNAME"
@@ -73,6 +83,61 @@ class Config(BaseSettings):
         alias="PG_URL_SCHEME",
     )
 
+    postgres_pool_size: int = Field(
+        description="Количество постоянных соединений в пуле Postgres",
+        default=10,
+        alias="PG_POOL_SIZE",
+    )
+    postgres_max_overflow: int = Field(
+        description="Количество дополнительных соединений сверх размера пула Postgres",
+        default=20,
+        alias="PG_MAX_OVERFLOW",
+    )
+    postgres_pool_pre_ping: bool = Field(
+        description="Флаг о том, что соединение проверяется перед выдачей из пула",
+        default=True,
+        alias="PG_POOL_PRE_PING",
+    )
+    postgres_pool_recycle_in_sec: int = Field(
+        description="Время жизни соединения в пуле Postgres в секундах",
+        default=1800,
+        alias="PG_POOL_RECYCLE_IN_SEC",
+    )
+    postgres_pool_timeout_in_sec: float = Field(
+        description="Время ожидания свободного соединения из пула Postgres в секундах",
+        default=30,
+        alias="PG_POOL_TIMEOUT_IN_SEC",
+    )
+    postgres_connect_timeout_in_sec: float = Field(
+        description="Время ожидания установки соединения с Postgres в секундах",
+        default=10,
+        alias="PG_CONNECT_TIMEOUT_IN_SEC",
+    )
+
+    is_article_cache_enabled: bool = Field(
+        description="Флаг о том, что статьи кэшируются в памяти процесса",
+        default=True,
+        alias="ARTICLE_CACHE_ENABLED",
+    )
+    article_cache_max_size_in_bytes: int = Field(
+        description="Максимальный объем кэша статей в байтах",
+        default=64 * 1024 * 1024,
+        alias="ARTICLE_CACHE_MAX_SIZE_IN_BYTES",
+    )
+    article_cache_ttl_in_sec: float = Field(
+        description="Время жизни статьи в кэше в секундах",
+        default=60,
+        alias="ARTICLE_CACHE_TTL_IN_SEC",
+    )
+    popular_articles_cache_max_age_in_sec: float = Field(
+        description=(
+            "Время в секундах, после которого готовый список популярных статей "
+            "обновляется в фоне"
+        ),
+        default=10,
+        alias="POPULAR_ARTICLES_CACHE_MAX_AGE_IN_SEC",
+    )
+
     redis_article_host: str = Field(
         escription="Хост Redis для хранения статей",
         default="redis_articles",
@@ -96,6 +161,26 @@ class Config(BaseSettings):
     redis_scheme: str = Field(
         description="Схема URL БД Redis", default="redis", alias="REDIS_URL_SCHEME"
     )
+    redis_max_connections: int = Field(
+        description="Максимальное количество соединений в пуле Redis",
+        default=50,
+        alias="REDIS_MAX_CONNECTIONS",
+    )
+    redis_pool_timeout_in_sec: float = Field(
+        description="Время ожидания свободного соединения из пула Redis в секундах",
+        default=5,
+        alias="REDIS_POOL_TIMEOUT_IN_SEC",
+    )
+    redis_socket_timeout_in_sec: float = Field(
+        description="Время ожидания ответа от Redis в секундах",
+        default=5,
+        alias="REDIS_SOCKET_TIMEOUT_IN_SEC",
+    )
+    redis_connect_timeout_in_sec: float = Field(
+        description="Время ожидания установки соединения с Redis в секундах",
+        default=5,
+        alias="REDIS_CONNECT_TIMEOUT_IN_SEC",
+    )
 
     @computed_field
     @property
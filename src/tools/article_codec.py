@@ -0,0 +1,92 @@
+import datetime
+import struct
+import uuid
+
+from dto import article_dto
+
+FORMAT_VERSION = 1
+
+__EPOCH = datetime.datetime(1970, 1, 1)
+__HEADER = struct.Struct("!B16s16s16sqqIII")
+
+
+def encode_article(article: article_dto.ArticleDTO) -> bytes:
+    """
+    Закодировать статью в компактное бинарное представление.
+    Формат: версия, идентификаторы по 16 байт, дата написания в микросекундах
+    от начала эпохи, просмотры и длины строк, за которыми следуют строки в UTF-8
+    :param article: объект статьи
+    :return: закодированная статья
+    """
+
+    user_name = (article.user_name or "").encode("utf-8")
+    topic_name = (article.topic_name or "").encode("utf-8")
+    text = article.text.encode("utf-8")
+
+    return (
+        __HEADER.pack(
+            FORMAT_VERSION,
+            article.id.bytes,
+            article.user_id.bytes,
+            article.topic_id.bytes,
+            (article.creation_date - __EPOCH) // datetime.timedelta(microseconds=1),
+            article.views or 0,
+            len(user_name),
+            len(topic_name),
+            len(text),
+        )
+        + user_name
+        + topic_name
+        + text
+    )
+
+
+def decode_article(value: bytes) -> article_dto.ArticleDTO:
+    """
+    Раскодировать статью из бинарного представления
+    :param value: закодированная статья
+    :return: объект статьи
+    """
+
+    (
+        version,
+        article_id,
+        user_id,
+        topic_id,
+        creation_date,
+        views,
+        user_name_length,
+        topic_name_length,
+        text_length,
+    ) = __HEADER.unpack_from(value)
+
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Неизвестная версия формата статьи: {version}")
+
+    offset = __HEADER.size
+    user_name = value[offset : offset + user_name_length].decode("utf-8")
+    offset += user_name_length
+    topic_name = value[offset : offset + topic_name_length].decode("utf-8")
+    offset += topic_name_length
+    text = value[offset : offset + text_length].decode("utf-8")
+
+    return article_dto.ArticleDTO.model_construct(
+        id=uuid.UUID(bytes=article_id),
+        user_id=uuid.UUID(bytes=user_id),
+        user_name=user_name,
+        creation_date=__EPOCH + datetime.timedelta(microseconds=creation_date),
+        topic_id=uuid.UUID(bytes=topic_id),
+        topic_name=topic_name,
+        text=text,
+        views=views,
+    )
+
+
+def decode_articles(values: list[bytes | None]) -> list[article_dto.ArticleDTO | None]:
+    """
+    Раскодировать несколько статей, полученных одним MGET
+    :param values: закодированные статьи, None - если статья не найдена
+    :return: объекты статей в том же порядке, None - если статья не найдена
+    """
+
+    return [decode_article(value) if value is not None else None for value in values]
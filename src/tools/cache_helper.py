@@ -0,0 +1,274 @@
+import asyncio
+import collections
+import time
+from typing import Awaitable, Callable, Hashable
+
+from dto import cache_dto
+
+
+class LRUCache:
+    """
+    Ограниченный по размеру кэш в памяти процесса.
+    Вытесняет давно не использованные записи и не отдает записи с истекшим временем жизни
+    """
+
+    def __init__(self, max_size: int, ttl_in_sec: float | None = None) -> None:
+        """
+        Инициализировать переменные
+        :param max_size: максимальный суммарный размер записей (например, в байтах)
+        :param ttl_in_sec: время жизни записи по умолчанию в секундах
+        """
+
+        self.max_size = max_size
+        self.ttl_in_sec = ttl_in_sec
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__entries: collections.OrderedDict[
+            Hashable, tuple[any, int, float | None]
+        ] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        """
+        Получить количество записей в кэше
+        :return: количество записей
+        """
+
+        return len(self.__entries)
+
+    def __remove(self, key: Hashable) -> None:
+        """
+        Удалить запись и освободить занимаемый ей размер
+        :param key: ключ записи
+        """
+
+        entry = self.__entries.pop(key, None)
+
+        if entry is not None:
+            self.size -= entry[1]
+
+    def get(self, key: Hashable) -> any:
+        """
+        Получить значение из кэша
+        :param key: ключ записи
+        :return: значение, если запись найдена и не устарела, иначе - None
+        """
+
+        entry = self.__entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+
+            return
+
+        value, _, expires_at = entry
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.__remove(key)
+            self.misses += 1
+
+            return
+
+        self.__entries.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: any,
+        size: int = 1,
+        ttl_in_sec: float | None = None,
+    ) -> None:
+        """
+        Положить значение в кэш
+        :param key: ключ записи
+        :param value: значение
+        :param size: размер записи
+        :param ttl_in_sec: время жизни записи в секундах, если отличается от значения по умолчанию
+        """
+
+        self.__remove(key)
+
+        if size > self.max_size:
+            return
+
+        ttl_in_sec = ttl_in_sec if ttl_in_sec is not None else self.ttl_in_sec
+        expires_at = time.monotonic() + ttl_in_sec if ttl_in_sec is not None else None
+
+        self.__entries[key] = (value, size, expires_at)
+        self.size += size
+
+        while self.size > self.max_size:
+            self.__remove(next(iter(self.__entries)))
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Удалить запись из кэша
+        :param key: ключ записи
+        """
+
+        self.__remove(key)
+
+    def clear(self) -> None:
+        """
+        Очистить кэш
+        """
+
+        self.__entries.clear()
+        self.size = 0
+
+    def stats(self) -> cache_dto.CacheStatsDTO:
+        """
+        Получить статистику работы кэша
+        :return: статистика работы кэша
+        """
+
+        return cache_dto.CacheStatsDTO(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            items=len(self.__entries),
+            size=self.size,
+            max_size=self.max_size,
+        )
+
+
+class SWRCache:
+    """
+    Кэш в памяти процесса с семантикой stale-while-revalidate.
+    Устаревшая запись отдается сразу, а обновляется в фоне одной задачей на ключ,
+    поэтому запросы не ждут загрузки, кроме самой первой
+    """
+
+    def __init__(self, max_age_in_sec: float) -> None:
+        """
+        Инициализировать переменные
+        :param max_age_in_sec: время в секундах, после которого запись считается устаревшей
+        """
+
+        self.max_age_in_sec = max_age_in_sec
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+        self.__entries: dict[Hashable, tuple[any, float]] = {}
+        self.__loaders: dict[Hashable, Callable[[], Awaitable[any]]] = {}
+        self.__refresh_tasks: dict[Hashable, tuple[asyncio.Task, int]] = {}
+        self.__generation = 0
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[any]]) -> any:
+        """
+        Получить значение из кэша
+        :param key: ключ записи
+        :param loader: корутинная функция, строящая значение записи
+        :return: значение
+        """
+
+        self.__loaders[key] = loader
+        entry = self.__entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+
+            # Задачу ждут все запросы с промахом по ключу, поэтому отмена одного из
+            # них, например при разрыве соединения клиентом, не должна ее отменять
+            return await asyncio.shield(self.__get_refresh_task(key))
+
+        value, expires_at = entry
+
+        if expires_at <= time.monotonic():
+            self.stale_hits += 1
+            self.__get_refresh_task(key)
+        else:
+            self.hits += 1
+
+        return value
+
+    def invalidate(self) -> None:
+        """
+        Пометить все записи устаревшими и начать их фоновое обновление.
+        До окончания обновления отдаются прежние значения. Обновления, начатые
+        до вызова, могли прочитать прежние данные, поэтому их результат
+        не сохраняется, а обновление запускается заново
+        """
+
+        self.__generation += 1
+
+        for key, (value, _) in self.__entries.items():
+            self.__entries[key] = (value, 0.0)
+
+        for key in self.__entries.keys() | self.__refresh_tasks.keys():
+            self.__get_refresh_task(key)
+
+    def __get_refresh_task(self, key: Hashable) -> asyncio.Task:
+        """
+        Получить задачу обновления записи, создав ее, если она еще не запущена
+        после последней инвалидации
+        :param key: ключ записи
+        :return: задача обновления записи
+        """
+
+        refresh_task = self.__refresh_tasks.get(key)
+
+        if refresh_task is not None and refresh_task[1] == self.__generation:
+            return refresh_task[0]
+
+        task = asyncio.create_task(self.__refresh(key, self.__generation))
+        self.__refresh_tasks[key] = (task, self.__generation)
+
+        return task
+
+    async def __refresh(self, key: Hashable, generation: int) -> any:
+        """
+        Построить значение записи и положить его в кэш
+        :param key: ключ записи
+        :param generation: номер инвалидации, после которой начато обновление
+        :return: значение
+        """
+
+        try:
+            value = await self.__loaders[key]()
+        except Exception as e:
+            self.refresh_errors += 1
+
+            if key not in self.__entries:
+                raise
+
+            print(f"Не удалось обновить запись кэша {key}: {e}")
+
+            return self.__entries[key][0]
+        finally:
+            if self.__refresh_tasks.get(key, (None, None))[1] == generation:
+                self.__refresh_tasks.pop(key)
+
+        if generation != self.__generation:
+            return await asyncio.shield(self.__get_refresh_task(key))
+
+        self.__entries[key] = (value, time.monotonic() + self.max_age_in_sec)
+        self.refreshes += 1
+
+        return value
+
+    def stats(self) -> cache_dto.SWRCacheStatsDTO:
+        """
+        Получить статистику работы кэша
+        :return: статистика работы кэша
+        """
+
+        return cache_dto.SWRCacheStatsDTO(
+            hits=self.hits,
+            stale_hits=self.stale_hits,
+            misses=self.misses,
+            refreshes=self.refreshes,
+            refresh_errors=self.refresh_errors,
+            items=len(self.__entries),
+        )
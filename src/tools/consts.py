@@ -12,7 +12,41 @@ class Articles:
     MAX_ARTICLE_LENGTH = 10_000
     MOST_VIEWED_ARTICLE_LIFETIME_IN_SEC = 86400
     POPULAR_ARTICLES_COUNT = 10
+    MAX_BULK_ARTICLES_COUNT = 1000
+    MAX_BATCH_ARTICLES_COUNT = 100
+    DEFAULT_PAGE_ARTICLES_COUNT = 20
+    MAX_PAGE_ARTICLES_COUNT = 100
+    # По этой конфигурации построен GIN-индекс в миграции 7b2d4e8c1a96. Ее изменение
+    # требует новой миграции индекса, иначе поиск перестанет использовать индекс
+    SEARCH_CONFIGURATION = "russian"
+    MAX_SEARCH_QUERY_LENGTH = 256
     DATETIME_STRING_FORMAT = "%Y.%m.%d %H:%M:%S"
+    VIEWS_FLUSH_INTERVAL_IN_SEC = 10
+    HTTP_CACHE_CONTROL = f"public, max-age={VIEWS_FLUSH_INTERVAL_IN_SEC}"
+    REDIS_PENDING_VIEWS_KEY = "articles:views:pending"
+    REDIS_PROCESSING_VIEWS_KEY = "articles:views:processing"
+    REDIS_VIEWS_EPOCH_KEY = "articles:views:epoch"
+    CACHED_ARTICLE_OVERHEAD_IN_BYTES = 1024
+    REDIS_POPULAR_RANK_KEY = "articles:popular:rank"
+    REDIS_POPULAR_INDEX_KEY = "articles:popular:index"
+    REDIS_POPULAR_ARTICLE_KEY_PREFIX = "articles:popular:packed:"
+    REDIS_POPULAR_GENERATION_KEY = "articles:popular:generation"
+    REDIS_POPULAR_CREATION_DATE_KEY = "articles:popular:creation-date"
+    REDIS_STAGING_RANK_KEY = "articles:popular:staging:rank"
+    REDIS_STAGING_INDEX_KEY = "articles:popular:staging:index"
+    REDIS_STAGING_ARTICLE_KEY_PREFIX = "articles:popular:staging:packed:"
+    REDIS_LEGACY_ARTICLE_KEY_PATTERN = "????????-????-????-????-????????????"
+    REDIS_HASH_ARTICLE_KEY_PREFIX = "articles:popular:article:"
+    REDIS_HASH_STAGING_ARTICLE_KEY_PATTERN = "articles:popular:staging:article:*"
+    REDIS_SCAN_BATCH_SIZE = 500
+
+
+class Topics:
+    """
+    Константы, связанные с темами статей
+    """
+
+    CATALOG_REFRESH_INTERVAL_IN_SEC = 600
 
 
 class Auth:
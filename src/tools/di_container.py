@@ -1,19 +1,24 @@
 from dependency_injector import containers, providers
 
+from tools import app_config, cache_helper
 from tools.factories import session_factory
 from tools.factories import repository_factory, uow_factory
 
+config = app_config.config
+
 
 class SessionContainer(containers.DeclarativeContainer):
     """
     DI-контейнер с провайдерами сессий
     """
 
-    alchemy_session_factory = providers.Factory(session_factory.AlchemySessionFactory)
-    redis_article_session_factory = providers.Factory(
+    alchemy_session_factory = providers.Singleton(
+        session_factory.AlchemySessionFactory
+    )
+    redis_article_session_factory = providers.Singleton(
         session_factory.RedisArticleSessionFactory
     )
-    redis_token_session_factory = providers.Factory(
+    redis_token_session_factory = providers.Singleton(
         session_factory.RedisTokenSessionFactory
     )
 
@@ -29,6 +34,9 @@ class RepositoryContainer(containers.DeclarativeContainer):
     article_redis_repository_factory = providers.Factory(
         repository_factory.ArticleRedisRepositoryFactory
     )
+    article_views_repository_factory = providers.Factory(
+        repository_factory.ArticleViewsRedisRepositoryFactory
+    )
     user_repository_factory = providers.Factory(
         repository_factory.UserRepositoryFactory
     )
@@ -50,3 +58,23 @@ class UOWContainer(containers.DeclarativeContainer):
     alchemy_redis_uow_composite_factory = providers.Factory(
         uow_factory.AlchemyRedisUOWCompositeFactory
     )
+
+
+class CacheContainer(containers.DeclarativeContainer):
+    """
+    DI-контейнер с провайдерами кэшей в памяти процесса
+    """
+
+    article_cache = providers.Singleton(
+        cache_helper.LRUCache,
+        max_size=(
+            config.article_cache_max_size_in_bytes
+            if config.is_article_cache_enabled
+            else 0
+        ),
+        ttl_in_sec=config.article_cache_ttl_in_sec,
+    )
+    popular_articles_cache = providers.Singleton(
+        cache_helper.SWRCache,
+        max_age_in_sec=config.popular_articles_cache_max_age_in_sec,
+    )
@@ -20,6 +20,7 @@ class RepositoryName(enum.Enum):
 
     ARTICLE_ALCHEMY_REPOSITORY = "article_alchemy_repository"
     ARTICLE_REDIS_REPOSITORY = "article_redis_repository"
+    ARTICLE_VIEWS_REPOSITORY = "article_views_repository"
     USER_REPOSITORY = "user_repository"
     TOKEN_REPOSITORY = "token_repository"
     TOPIC_REPOSITORY = "topic_repository"
@@ -0,0 +1,52 @@
+import hashlib
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Сформировать сильный ETag по значениям, от которых зависит ответ
+    :param parts: значения, от которых зависит ответ
+    :return: ETag в кавычках
+    """
+
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+    return f'"{digest}"'
+
+
+def parse_if_none_match(header: str | None) -> set[str]:
+    """
+    Получить ETag из заголовка If-None-Match.
+    Для If-None-Match теги сравниваются без учета слабости, поэтому префикс W/
+    отбрасывается
+    :param header: значение заголовка
+    :return: множество ETag в кавычках, {"*"} - если подходит любой
+    """
+
+    if not header:
+        return set()
+
+    etags = set()
+
+    for etag in header.split(","):
+        etag = etag.strip()
+
+        if etag.startswith("W/"):
+            etag = etag[2:]
+
+        if etag:
+            etags.add(etag)
+
+    return etags
+
+
+def is_etag_matched(etag: str, etags: set[str]) -> bool:
+    """
+    Проверить, есть ли у клиента актуальная версия ответа
+    :param etag: ETag актуальной версии ответа
+    :param etags: ETag из заголовка If-None-Match
+    :return: True - если ответ можно не передавать
+    """
+
+    return "*" in etags or etag in etags
@@ -2,7 +2,7 @@ from redis.asyncio.client import Pipeline
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstracts import abstract_factory
-from tools import enums
+from tools import enums, metrics_helper
 from repositories import (
     article_repository,
     token_repository,
@@ -10,6 +10,17 @@ from repositories import (
     user_repository,
 )
 
+# Методы репозиториев Redis только добавляют команды в конвейер, поэтому их
+# длительность не учитывается: обращение к Redis измеряется при коммите UOW
+for repository_class in (
+    article_repository.ArticleAlchemyRepository,
+    topic_repository.TopicRepository,
+    user_repository.UserRepository,
+):
+    metrics_helper.instrument_methods(
+        repository_class, metrics_helper.REPOSITORY_METHOD_DURATION
+    )
+
 
 class UserRepositoryFactory(abstract_factory.AbstractFactory):
     """
@@ -77,6 +88,24 @@ class ArticleRedisRepositoryFactory(abstract_factory.AbstractFactory):
         )
 
 
+class ArticleViewsRedisRepositoryFactory(abstract_factory.AbstractFactory):
+    """
+    Фабрика репозиториев для буферизации просмотров статей в Redis
+    """
+
+    def __call__(
+        self, session: Pipeline
+    ) -> article_repository.ArticleViewsRedisRepository:
+        """
+        Создать объект репозитория
+        :param session: сессия Redis
+        """
+
+        return article_repository.ArticleViewsRedisRepository(
+            enums.RepositoryName.ARTICLE_VIEWS_REPOSITORY.value, session
+        )
+
+
 class TokenRepositoryFactory(abstract_factory.AbstractFactory):
     """
     Фабрика репозиториев для работы с репозиторием токенов
@@ -5,26 +5,89 @@ import redis.asyncio as redis
 from sqlalchemy.ext import asyncio as alchemy_asyncio
 
 from abstracts import abstract_factory
+from dto import pool_dto
 from tools import app_config
 
 
 class AlchemySessionFactory(abstract_factory.AbstractFactory):
     """
-    Фабрика сессий SQLAlchemy
+    Фабрика сессий SQLAlchemy.
+    Движок и пул соединений создаются один раз на процесс
     """
 
     def __init__(self) -> None:
         """
         Инициализировать переменные
         """
-        dsn = str(app_config.config.postgres_dsn)
-        echo = True if app_config.config.is_dev else False
 
-        engine = alchemy_asyncio.create_async_engine(dsn, echo=echo)
+        self.engine: alchemy_asyncio.AsyncEngine | None = None
+        self.__session_maker: alchemy_asyncio.async_sessionmaker | None = None
 
-        self.session_maker = alchemy_asyncio.async_sessionmaker(
-            autocommit=False, bind=engine
+    def connect(self) -> None:
+        """
+        Создать движок и пул соединений
+        """
+
+        if self.engine is not None:
+            return
+
+        config = app_config.config
+
+        self.engine = alchemy_asyncio.create_async_engine(
+            str(config.postgres_dsn),
+            echo=config.is_dev,
+            pool_size=config.postgres_pool_size,
+            max_overflow=config.postgres_max_overflow,
+            pool_pre_ping=config.postgres_pool_pre_ping,
+            pool_recycle=config.postgres_pool_recycle_in_sec,
+            pool_timeout=config.postgres_pool_timeout_in_sec,
+            connect_args={"timeout": config.postgres_connect_timeout_in_sec},
         )
+        self.__session_maker = alchemy_asyncio.async_sessionmaker(
+            autocommit=False, bind=self.engine
+        )
+
+    async def dispose(self) -> None:
+        """
+        Закрыть все соединения пула и освободить движок
+        """
+
+        if self.engine is None:
+            return
+
+        await self.engine.dispose()
+
+        self.engine = None
+        self.__session_maker = None
+
+    def get_pool_stats(self) -> pool_dto.PoolStatsDTO | None:
+        """
+        Получить статистику пула соединений
+        :return: статистика пула соединений, None - если пул еще не создан
+        """
+
+        if self.engine is None:
+            return
+
+        pool = self.engine.pool
+
+        return pool_dto.PoolStatsDTO(
+            max_size=pool.size() + app_config.config.postgres_max_overflow,
+            opened=pool.checkedin() + pool.checkedout(),
+            in_use=pool.checkedout(),
+        )
+
+    @property
+    def session_maker(self) -> alchemy_asyncio.async_sessionmaker:
+        """
+        Получить фабрику асинхронных сессий
+        :return: фабрика асинхронных сессий
+        """
+
+        if self.__session_maker is None:
+            self.connect()
+
+        return self.__session_maker
 
     async def __call__(self) -> AsyncGenerator[alchemy_asyncio.AsyncSession, None]:
         """
@@ -42,27 +105,136 @@ class AlchemySessionFactory(abstract_factory.AbstractFactory):
                 await session.close()
 
 
+class TrackedConnectionPool(redis.BlockingConnectionPool):
+    """
+    Блокирующий пул соединений Redis, который сам считает созданные и выданные
+    соединения, чтобы не читать внутреннее состояние redis-py
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Инициализировать переменные
+        :param args: позиционные аргументы пула соединений
+        :param kwargs: именованные аргументы пула соединений
+        """
+
+        super().__init__(*args, **kwargs)
+        self.opened_count = 0
+        self.__in_use_connections = set()
+
+    @property
+    def in_use_count(self) -> int:
+        """
+        Получить количество выданных соединений
+        :return: количество выданных соединений
+        """
+
+        return len(self.__in_use_connections)
+
+    def make_connection(self) -> redis.Connection:
+        """
+        Создать новое соединение
+        :return: соединение
+        """
+
+        connection = super().make_connection()
+        self.opened_count += 1
+
+        return connection
+
+    async def get_connection(self, *args, **kwargs) -> redis.Connection:
+        """
+        Получить соединение из пула, дождавшись свободного
+        :param args: позиционные аргументы redis-py
+        :param kwargs: именованные аргументы redis-py
+        :return: соединение
+        """
+
+        connection = await super().get_connection(*args, **kwargs)
+        self.__in_use_connections.add(connection)
+
+        return connection
+
+    async def release(self, connection: redis.Connection) -> None:
+        """
+        Вернуть соединение в пул
+        :param connection: соединение
+        """
+
+        # redis-py возвращает в пул и соединения, не прошедшие проверку до выдачи
+        self.__in_use_connections.discard(connection)
+        await super().release(connection)
+
+
 class BaseRedisSessionFactory(abstract_factory.AbstractFactory):
     """
-    Базовая фабрика сессий Redis
+    Базовая фабрика сессий Redis.
+    Пул соединений создается один раз на каждый Redis DSN, а каждый вызов фабрики
+    возвращает отдельный конвейер, поэтому команды разных корутин не смешиваются
     """
 
+    __connection_pools: dict[str, TrackedConnectionPool] = {}
+
     def __init__(self, redis_dsn: RedisDsn) -> None:
         """
         Инициализировать переменные
         :param redis_dsn: Redis dsn
         """
 
-        self.redis_session = redis.Redis(
-            host=redis_dsn.host, port=redis_dsn.port
-        ).pipeline()
+        self.redis_dsn = str(redis_dsn)
+        self.connection_pool = self.__get_connection_pool(redis_dsn)
+        self.redis_client = redis.Redis(connection_pool=self.connection_pool)
+
+    @classmethod
+    def __get_connection_pool(cls, redis_dsn: RedisDsn) -> TrackedConnectionPool:
+        """
+        Получить пул соединений для Redis DSN
+        :param redis_dsn: Redis dsn
+        :return: пул соединений
+        """
+
+        connection_pool = cls.__connection_pools.get(str(redis_dsn))
+
+        if connection_pool is None:
+            config = app_config.config
+
+            connection_pool = TrackedConnectionPool(
+                host=redis_dsn.host,
+                port=redis_dsn.port,
+                max_connections=config.redis_max_connections,
+                timeout=config.redis_pool_timeout_in_sec,
+                socket_timeout=config.redis_socket_timeout_in_sec,
+                socket_connect_timeout=config.redis_connect_timeout_in_sec,
+            )
+            cls.__connection_pools[str(redis_dsn)] = connection_pool
+
+        return connection_pool
 
     def __call__(self) -> redis.client.Pipeline:
         """
-        Получить сессию Redis
+        Получить новую сессию Redis
         """
 
-        return self.redis_session
+        return self.redis_client.pipeline()
+
+    async def dispose(self) -> None:
+        """
+        Закрыть все соединения пула
+        """
+
+        await self.connection_pool.disconnect()
+
+    def get_pool_stats(self) -> pool_dto.PoolStatsDTO:
+        """
+        Получить статистику пула соединений
+        :return: статистика пула соединений
+        """
+
+        return pool_dto.PoolStatsDTO(
+            max_size=self.connection_pool.max_connections,
+            opened=self.connection_pool.opened_count,
+            in_use=self.connection_pool.in_use_count,
+        )
 
 
 class RedisTokenSessionFactory(BaseRedisSessionFactory):
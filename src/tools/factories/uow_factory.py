@@ -1,6 +1,16 @@
 from abstracts import abstract_factory
+from tools import metrics_helper
 from uow import alchemy_uow, alchemy_redis_uow_composite, redis_uow
 
+for uow_class in (
+    alchemy_uow.AlchemyUOW,
+    redis_uow.RedisUOW,
+    alchemy_redis_uow_composite.AlchemyRedisUOWComposite,
+):
+    metrics_helper.instrument_methods(
+        uow_class, metrics_helper.UOW_OPERATION_DURATION, ("commit", "rollback")
+    )
+
 
 class AlchemyUOWFactory(abstract_factory.AbstractFactory):
     """
@@ -1,13 +1,17 @@
 import datetime
+import hashlib
+import time
 
 import jwt
 from jwt.exceptions import InvalidTokenError
 
 from dto import token_dto, user_dto
-from tools import app_config, enums
+from tools import app_config, cache_helper, enums
 
 config = app_config.config
 
+payload_cache = cache_helper.LRUCache(max_size=config.token_cache_max_size)
+
 
 class JWTHelper:
     """
@@ -69,6 +73,26 @@ class JWTHelper:
 
         return jwt.decode(token, config.secret_key, [config.jwt_algorithm.value])
 
+    def _get_verified_payload(self, token: str) -> dict:
+        """
+        Получить полезную нагрузку проверенного JWT-токена.
+        Повторно подпись токена не проверяется, пока не истек срок его жизни
+        :param token: токен
+        :return: информация из JWT-токена
+        """
+
+        token_digest = hashlib.sha256(token.encode("utf-8")).digest()
+        payload = payload_cache.get(token_digest)
+
+        if payload is None:
+            payload = self._decode_jwt(token=token)
+            ttl_in_sec = payload.get("exp", 0) - time.time()
+
+            if ttl_in_sec > 0:
+                payload_cache.set(token_digest, payload, ttl_in_sec=ttl_in_sec)
+
+        return payload.copy()
+
     def issue_jwt(
         self, user: user_dto.UserDTO, token_params: token_dto.TokenAttrsDTO
     ) -> str:
@@ -115,7 +139,7 @@ class JWTHelper:
         :return: полезная нагрузка
         """
 
-        payload = self._decode_jwt(token=token)
+        payload = self._get_verified_payload(token)
 
         if payload[
             "scope"
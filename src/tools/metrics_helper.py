@@ -0,0 +1,476 @@
+import bisect
+import functools
+import inspect
+import time
+from typing import Awaitable, Callable, Iterable
+
+from dependency_injector import containers
+
+from tools import jwt_helper, password_helper
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+JOB_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class Histogram:
+    """
+    Гистограмма длительностей для одного набора меток.
+    Наблюдение только увеличивает счетчики, накопленные значения корзин
+    считаются при выгрузке метрик
+    """
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """
+        Инициализировать переменные
+        :param buckets: верхние границы корзин по возрастанию
+        """
+
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Учесть наблюдение
+        :param value: значение, например длительность в секундах
+        """
+
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class HistogramFamily:
+    """
+    Семейство гистограмм с одинаковым именем и разными значениями меток
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Инициализировать переменные
+        :param name: имя метрики
+        :param description: описание метрики
+        :param label_names: названия меток
+        :param buckets: верхние границы корзин по возрастанию
+        """
+
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        self.children: dict[tuple[str, ...], Histogram] = {}
+
+    def labels(self, *label_values: str) -> Histogram:
+        """
+        Получить гистограмму для значений меток. Гистограмму стоит получать один раз
+        и сохранять, а не запрашивать на каждое наблюдение
+        :param label_values: значения меток в порядке label_names
+        :return: гистограмма
+        """
+
+        histogram = self.children.get(label_values)
+
+        if histogram is None:
+            histogram = self.children[label_values] = Histogram(self.buckets)
+
+        return histogram
+
+    def render(self) -> Iterable[str]:
+        """
+        Выгрузить гистограммы в текстовом формате Prometheus
+        :return: строки выгрузки
+        """
+
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} histogram"
+
+        for label_values, histogram in list(self.children.items()):
+            labels = format_labels(self.label_names, label_values)
+            separator = "," if labels else ""
+            cumulative_count = 0
+
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative_count += count
+                yield (
+                    f'{self.name}_bucket{{{labels}{separator}le="{bound}"}} '
+                    f"{cumulative_count}"
+                )
+
+            cumulative_count += histogram.counts[-1]
+            yield (
+                f'{self.name}_bucket{{{labels}{separator}le="+Inf"}} '
+                f"{cumulative_count}"
+            )
+            yield f"{self.name}_sum{{{labels}}} {histogram.sum}"
+            yield f"{self.name}_count{{{labels}}} {cumulative_count}"
+
+
+class CollectedFamily:
+    """
+    Семейство метрик, значения которых собираются в момент выгрузки,
+    например размеры пулов соединений и статистика кэшей
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        metric_type: str,
+        label_names: tuple[str, ...],
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+    ) -> None:
+        """
+        Инициализировать переменные
+        :param name: имя метрики
+        :param description: описание метрики
+        :param metric_type: тип метрики Prometheus: gauge или counter
+        :param label_names: названия меток
+        :param collect: функция, возвращающая пары из значений меток и значения
+        """
+
+        self.name = name
+        self.description = description
+        self.metric_type = metric_type
+        self.label_names = label_names
+        self.collect = collect
+
+    def render(self) -> Iterable[str]:
+        """
+        Выгрузить метрики в текстовом формате Prometheus
+        :return: строки выгрузки
+        """
+
+        try:
+            samples = list(self.collect())
+        except Exception as e:
+            print(f"Не удалось собрать метрику {self.name}: {e}")
+
+            return
+
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} {self.metric_type}"
+
+        for label_values, value in samples:
+            yield (
+                f"{self.name}{{{format_labels(self.label_names, label_values)}}} "
+                f"{value}"
+            )
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик процесса
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализировать переменные
+        """
+
+        self.families: dict[str, HistogramFamily | CollectedFamily] = {}
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> HistogramFamily:
+        """
+        Зарегистрировать семейство гистограмм
+        :param name: имя метрики
+        :param description: описание метрики
+        :param label_names: названия меток
+        :param buckets: верхние границы корзин по возрастанию
+        :return: семейство гистограмм
+        """
+
+        family = self.families[name] = HistogramFamily(
+            name, description, label_names, buckets
+        )
+
+        return family
+
+    def collected(
+        self,
+        name: str,
+        description: str,
+        metric_type: str,
+        label_names: tuple[str, ...],
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+    ) -> None:
+        """
+        Зарегистрировать семейство метрик, собираемых в момент выгрузки.
+        Повторная регистрация заменяет прежнюю
+        :param name: имя метрики
+        :param description: описание метрики
+        :param metric_type: тип метрики Prometheus: gauge или counter
+        :param label_names: названия меток
+        :param collect: функция, возвращающая пары из значений меток и значения
+        """
+
+        self.families[name] = CollectedFamily(
+            name, description, metric_type, label_names, collect
+        )
+
+    def render(self) -> str:
+        """
+        Выгрузить все метрики в текстовом формате Prometheus
+        :return: текст выгрузки
+        """
+
+        lines = []
+
+        for family in list(self.families.values()):
+            lines.extend(family.render())
+
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(label_names: tuple[str, ...], label_values: tuple[str, ...]) -> str:
+    """
+    Сформировать метки в текстовом формате Prometheus
+    :param label_names: названия меток
+    :param label_values: значения меток
+    :return: метки через запятую
+    """
+
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in zip(label_names, label_values)
+    )
+
+
+def timed(histogram: Histogram) -> Callable:
+    """
+    Декоратор, учитывающий длительность корутинной функции в гистограмме
+    :param histogram: гистограмма
+    :return: декоратор
+    """
+
+    def decorator(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> any:
+            started_at = time.perf_counter()
+
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started_at)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_methods(
+    cls: type, family: HistogramFamily, method_names: Iterable[str] | None = None
+) -> None:
+    """
+    Учитывать длительность корутинных методов класса в гистограммах.
+    Первая метка - имя класса объекта, для которого вызван метод, поэтому наследники
+    без собственной реализации получают свою метку. Гистограмма создается при
+    первом вызове для класса, а дальше только находится по классу
+    :param cls: класс
+    :param family: семейство гистограмм с метками (класс, метод)
+    :param method_names: имена методов, в том числе унаследованных. По умолчанию -
+    все публичные корутинные методы, объявленные в самом классе
+    """
+
+    if method_names is None:
+        method_names = [
+            name
+            for name, method in vars(cls).items()
+            if not name.startswith("_") and inspect.iscoroutinefunction(method)
+        ]
+
+    for name in method_names:
+        method = getattr(cls, name, None)
+
+        if method is None or getattr(method, "__isabstractmethod__", False):
+            continue
+
+        setattr(cls, name, __timed_method(method, family, name))
+
+
+def __timed_method(
+    method: Callable[..., Awaitable], family: HistogramFamily, method_name: str
+) -> Callable[..., Awaitable]:
+    """
+    Обернуть метод для учета длительности
+    :param method: корутинный метод
+    :param family: семейство гистограмм с метками (класс, метод)
+    :param method_name: имя метода
+    :return: обернутый метод
+    """
+
+    histograms: dict[type, Histogram] = {}
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs) -> any:
+        histogram = histograms.get(type(self))
+
+        if histogram is None:
+            histogram = histograms[type(self)] = family.labels(
+                type(self).__name__, method_name
+            )
+
+        started_at = time.perf_counter()
+
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started_at)
+
+    return wrapper
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "Длительность обработки HTTP-запросов",
+    ("method", "handler"),
+)
+REPOSITORY_METHOD_DURATION = registry.histogram(
+    "repository_method_duration_seconds",
+    "Длительность вызовов методов репозиториев",
+    ("repository", "method"),
+)
+UOW_OPERATION_DURATION = registry.histogram(
+    "uow_operation_duration_seconds",
+    "Длительность коммитов и откатов UOW",
+    ("uow", "operation"),
+)
+SCHEDULER_JOB_DURATION = registry.histogram(
+    "scheduler_job_duration_seconds",
+    "Длительность выполнения задач планировщика",
+    ("job",),
+    JOB_BUCKETS,
+)
+
+
+def register_collectors(
+    session_container: containers.DeclarativeContainer,
+    cache_container: containers.DeclarativeContainer,
+) -> None:
+    """
+    Зарегистрировать метрики, значения которых собираются в момент выгрузки:
+    состояние пулов соединений, статистику кэшей и пула хеширования паролей
+    :param session_container: контейнер фабрик сессий
+    :param cache_container: контейнер кэшей
+    """
+
+    pool_factories = {
+        "postgres": session_container.alchemy_session_factory,
+        "redis_article": session_container.redis_article_session_factory,
+        "redis_token": session_container.redis_token_session_factory,
+    }
+    lru_caches = {
+        "article": cache_container.article_cache,
+        "jwt_payload": lambda: jwt_helper.payload_cache,
+    }
+
+    def collect_pool_stats() -> list[tuple[tuple[str, str], int]]:
+        samples = []
+
+        for pool, factory in pool_factories.items():
+            stats = factory().get_pool_stats()
+
+            if stats is None:
+                continue
+
+            samples.append(((pool, "max_size"), stats.max_size))
+            samples.append(((pool, "opened"), stats.opened))
+            samples.append(((pool, "in_use"), stats.in_use))
+
+        return samples
+
+    def collect_cache_events() -> list[tuple[tuple[str, str], int]]:
+        samples = []
+
+        for cache, get_cache in lru_caches.items():
+            stats = get_cache().stats()
+            samples.append(((cache, "hit"), stats.hits))
+            samples.append(((cache, "miss"), stats.misses))
+            samples.append(((cache, "eviction"), stats.evictions))
+
+        stats = cache_container.popular_articles_cache().stats()
+        samples.append((("popular_articles", "hit"), stats.hits))
+        samples.append((("popular_articles", "stale_hit"), stats.stale_hits))
+        samples.append((("popular_articles", "miss"), stats.misses))
+        samples.append((("popular_articles", "refresh"), stats.refreshes))
+        samples.append((("popular_articles", "refresh_error"), stats.refresh_errors))
+
+        return samples
+
+    def collect_cache_items() -> list[tuple[tuple[str], int]]:
+        samples = [
+            ((cache,), get_cache().stats().items)
+            for cache, get_cache in lru_caches.items()
+        ]
+        popular_articles_stats = cache_container.popular_articles_cache().stats()
+        samples.append((("popular_articles",), popular_articles_stats.items))
+
+        return samples
+
+    def collect_password_hasher_stats() -> list[tuple[tuple[str], int]]:
+        stats = password_helper.PasswordHelper.stats()
+
+        return [
+            (("waiting",), stats.waiting),
+            (("in_progress",), stats.in_progress),
+            (("completed",), stats.completed),
+        ]
+
+    registry.collected(
+        "connection_pool_connections",
+        "Состояние пулов соединений",
+        "gauge",
+        ("pool", "state"),
+        collect_pool_stats,
+    )
+    registry.collected(
+        "cache_events_total",
+        "События кэшей",
+        "counter",
+        ("cache", "event"),
+        collect_cache_events,
+    )
+    registry.collected(
+        "cache_items",
+        "Количество записей в кэшах",
+        "gauge",
+        ("cache",),
+        collect_cache_items,
+    )
+    registry.collected(
+        "password_hasher_operations",
+        "Состояние пула хеширования паролей",
+        "gauge",
+        ("state",),
+        collect_password_hasher_stats,
+    )
@@ -1,6 +1,14 @@
+import asyncio
+from concurrent import futures
+import functools
+from typing import Callable
+
 from passlib import context
 
-from tools import enums
+from dto import password_dto
+from tools import app_config, enums
+
+config = app_config.config
 
 
 class PasswordHelper:
@@ -8,13 +16,87 @@ class PasswordHelper:
     Класс, содержащий вспомогательные функции для работы с паролями
     """
 
+    __hashers: dict[enums.PasswordHasherAlgorithm, context.CryptContext] = {}
+    __executor: futures.ThreadPoolExecutor | None = None
+    __semaphore: asyncio.Semaphore | None = None
+
+    waiting = 0
+    in_progress = 0
+    completed = 0
+
     def __init__(self, hash_algorithm: enums.PasswordHasherAlgorithm) -> None:
         """
         Инициализировать переменные
         :param hash_algorithm: алгоритм хеширования пароля
         """
 
-        self.hasher = context.CryptContext(schemes=[hash_algorithm.value])
+        if hash_algorithm not in self.__hashers:
+            self.__hashers[hash_algorithm] = context.CryptContext(
+                schemes=[hash_algorithm.value]
+            )
+
+        self.hasher = self.__hashers[hash_algorithm]
+
+    @classmethod
+    async def __run_in_executor(cls, func: Callable, *args) -> any:
+        """
+        Выполнить функцию в пуле потоков, ограничив количество одновременных операций
+        :param func: функция
+        :param args: аргументы функции
+        :return: результат выполнения функции
+        """
+
+        if cls.__executor is None:
+            cls.__executor = futures.ThreadPoolExecutor(
+                max_workers=config.password_hasher_max_workers,
+                thread_name_prefix="password_hasher",
+            )
+            cls.__semaphore = asyncio.Semaphore(config.password_hasher_max_workers)
+
+        cls.waiting += 1
+        is_acquired = False
+
+        try:
+            async with cls.__semaphore:
+                cls.waiting -= 1
+                is_acquired = True
+                cls.in_progress += 1
+
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        cls.__executor, functools.partial(func, *args)
+                    )
+                finally:
+                    cls.in_progress -= 1
+                    cls.completed += 1
+        finally:
+            if not is_acquired:
+                cls.waiting -= 1
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Остановить пул потоков хеширования паролей
+        """
+
+        if cls.__executor is not None:
+            cls.__executor.shutdown(wait=False, cancel_futures=True)
+            cls.__executor = None
+            cls.__semaphore = None
+
+    @classmethod
+    def stats(cls) -> password_dto.PasswordHasherStatsDTO:
+        """
+        Получить статистику работы пула хеширования паролей
+        :return: статистика работы пула
+        """
+
+        return password_dto.PasswordHasherStatsDTO(
+            waiting=cls.waiting,
+            in_progress=cls.in_progress,
+            completed=cls.completed,
+            max_concurrency=config.password_hasher_max_workers,
+        )
 
     def encode_password(self, password: str) -> str:
         """
@@ -34,3 +116,26 @@ class PasswordHelper:
         """
 
         return self.hasher.verify(password, encoded_password)
+
+    async def encode_password_async(self, password: str) -> str:
+        """
+        Закодировать пароль в пуле потоков, не блокируя цикл событий
+        :param password: пароль
+        :return: закодированный пароль
+        """
+
+        return await self.__run_in_executor(self.encode_password, password)
+
+    async def is_password_valid_async(
+        self, password: str, encoded_password: str
+    ) -> bool:
+        """
+        Проверить пароль в пуле потоков, не блокируя цикл событий
+        :param password: пароль
+        :param encoded_password: закодированный пароль
+        :return: True, если пароли совпадают, иначе - False
+        """
+
+        return await self.__run_in_executor(
+            self.is_password_valid, password, encoded_password
+        )
@@ -1,24 +1,30 @@
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from dto import user_dto
 from tools import consts
 from web.tools import token_validator
 
 __http_bearer = HTTPBearer()
 
 
-def get_access_token(
-    creds: HTTPAuthorizationCredentials = Depends(__http_bearer),
-) -> str:
+def get_current_user(
+    request: Request,
+    creds: HTTPAuthorizationCredentials = Depends(__http_bearer),  # no qa
+) -> user_dto.PrincipalDTO:
     """
-    Получить access-токен
+    Получить данные пользователя, аутентифицированного по access-токену
+    :param request: запрос
     :param creds: данные авторизации
-    :return: access-токен
+    :return: данные пользователя
     """
 
-    return token_validator.validate_token(
-        creds.credentials, consts.Auth.ACCESS_TOKEN_ATTRS
-    )
+    principal = getattr(request.state, "principal", None)
+
+    if principal is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    return principal
 
 
 def get_refresh_token(
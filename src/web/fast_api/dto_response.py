@@ -0,0 +1,49 @@
+from typing import Any, Mapping
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+class DTOResponse(Response):
+    """
+    JSON-ответ, сериализующий DTO сервисного слоя сразу в байты средствами pydantic-core,
+    без промежуточных моделей ответа и повторной валидации FastAPI.
+    Схема ответа для OpenAPI задается через response_model эндпоинта
+    """
+
+    media_type = "application/json"
+
+    __adapters: dict[Any, TypeAdapter] = {}
+
+    def __init__(
+        self,
+        content: Any,
+        content_type: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """
+        Инициализировать переменные
+        :param content: DTO или список DTO
+        :param content_type: тип содержимого, например list[ArticleDTO]
+        :param status_code: код ответа
+        :param headers: заголовки ответа
+        """
+
+        super().__init__(self.serialize(content, content_type), status_code, headers)
+
+    @classmethod
+    def serialize(cls, content: Any, content_type: Any) -> bytes:
+        """
+        Сериализовать DTO в тело ответа
+        :param content: DTO или список DTO
+        :param content_type: тип содержимого, например list[ArticleDTO]
+        :return: тело ответа
+        """
+
+        adapter = cls.__adapters.get(content_type)
+
+        if adapter is None:
+            adapter = cls.__adapters[content_type] = TypeAdapter(content_type)
+
+        return adapter.dump_json(content)
@@ -1,35 +1,40 @@
+import datetime
+from typing import Optional
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
 
 from dto import article_dto, user_dto
 from services import article_service
-from tools import consts, jwt_helper
+from tools import consts, etag_helper
+from web.fast_api import dto_response
 from web.fast_api.dependencies import token_dependency
 from web.fast_api.models.articles import article_model
 
 router = APIRouter(prefix="/articles")
 
 
-@router.post("/create")
+@router.post("/create", response_model=article_model.ArticleResultModel)
 async def create_article(
     article_schema: article_model.ArticleWriteModel,
-    access_token: str = Depends(token_dependency.get_access_token),
-) -> article_model.ArticleResultModel:
+    user: user_dto.PrincipalDTO = Depends(token_dependency.get_current_user),
+) -> dto_response.DTOResponse:
     """
     Создать статью
     :param article_schema: исходные данные для создания статьи
-    :param access_token: access-токен
+    :param user: данные пользователя
     :return: данные созданной статьи
     """
 
-    jwt_manager = jwt_helper.JWTHelper()
-    payload = jwt_manager.get_payload_by_token(
-        access_token, consts.Auth.ACCESS_TOKEN_ATTRS
-    )
-
-    user = user_dto.UserInfoDTO(id=payload["sub"], name=payload["user_name"])
-
     article = article_dto.ArticleCreateDTO(
         id=uuid.uuid4(),
         user_id=user.id,
@@ -39,83 +44,226 @@ async def create_article(
 
     article_result = await article_service.ArticleService.create_article(user, article)
 
-    return article_model.ArticleResultModel(
-        id=article_result.id,
-        user_id=article_result.user_id,
-        user_name=article_result.user_name,
-        creation_date=article_result.creation_date,
-        topic_id=article_result.topic_id,
-        topic_name=article_result.topic_name,
-        text=article_result.text,
-        views=article_result.views,
+    return dto_response.DTOResponse(article_result, article_dto.ArticleDTO)
+
+
+@router.post(
+    "/bulk", response_model=list[article_model.ArticleBulkCreateResultModel]
+)
+async def create_articles(
+    article_schemas: list[article_model.ArticleWriteModel] = Body(
+        max_length=consts.Articles.MAX_BULK_ARTICLES_COUNT
+    ),
+    user: user_dto.PrincipalDTO = Depends(token_dependency.get_current_user),
+) -> dto_response.DTOResponse:
+    """
+    Создать несколько статей
+    :param article_schemas: исходные данные для создания статей
+    :param user: данные пользователя
+    :return: результаты создания статей в порядке запроса
+    """
+
+    articles = [
+        article_dto.ArticleCreateDTO(
+            id=uuid.uuid4(),
+            user_id=user.id,
+            topic_id=article_schema.topic_id,
+            text=article_schema.text,
+        )
+        for article_schema in article_schemas
+    ]
+
+    results = await article_service.ArticleService.create_articles(user, articles)
+
+    return dto_response.DTOResponse(
+        results, list[article_dto.ArticleBulkCreateResultDTO]
     )
 
 
-@router.get("/popular")
-async def retrieve_popular_articles() -> list[article_model.ArticleResultModel]:
+@router.get("", response_model=article_model.ArticlePageModel)
+async def retrieve_articles(
+    article_ids: Optional[list[uuid.UUID]] = Query(
+        alias="ids",
+        default=None,
+        max_length=consts.Articles.MAX_BATCH_ARTICLES_COUNT,
+    ),
+    topic_id: Optional[uuid.UUID] = None,
+    user_id: Optional[uuid.UUID] = None,
+    created_after: Optional[datetime.datetime] = None,
+    created_before: Optional[datetime.datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(
+        default=consts.Articles.DEFAULT_PAGE_ARTICLES_COUNT,
+        gt=0,
+        le=consts.Articles.MAX_PAGE_ARTICLES_COUNT,
+    ),
+) -> dto_response.DTOResponse:
     """
-    Получить популярные статьи
-    :return: данные полученных статьей
+    Получить статьи по идентификаторам или страницу списка статей, начиная с новых
+    :param article_ids: идентификаторы статей. Если заданы, остальные параметры не учитываются
+    :param topic_id: идентификатор темы статьи
+    :param user_id: идентификатор автора статьи
+    :param created_after: нижняя граница даты написания статьи
+    :param created_before: верхняя граница даты написания статьи
+    :param cursor: курсор, полученный с предыдущей страницей
+    :param limit: количество статей на странице
+    :return: данные найденных статей
     """
 
-    articles_result = await article_service.ArticleService.retrieve_popular_articles()
+    if article_ids:
+        articles_page = article_dto.ArticlePageDTO(
+            articles=await article_service.ArticleService.retrieve_articles(
+                article_ids
+            )
+        )
+    else:
+        try:
+            articles_page = await article_service.ArticleService.list_articles(
+                article_dto.ArticleFilterDTO(
+                    topic_id=topic_id,
+                    user_id=user_id,
+                    created_after=created_after,
+                    created_before=created_before,
+                ),
+                limit,
+                cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return dto_response.DTOResponse(articles_page, article_dto.ArticlePageDTO)
 
-    return [
-        article_model.ArticleResultModel(
-            id=article.id,
-            user_id=article.user_id,
-            user_name=article.user_name,
-            creation_date=article.creation_date,
-            topic_id=article.topic_id,
-            topic_name=article.topic_name,
-            text=article.text,
-            views=article.views,
+
+@router.get("/search", response_model=article_model.ArticlePageModel)
+async def search_articles(
+    search_query: str = Query(
+        alias="q", min_length=1, max_length=consts.Articles.MAX_SEARCH_QUERY_LENGTH
+    ),
+    topic_id: Optional[uuid.UUID] = None,
+    user_id: Optional[uuid.UUID] = None,
+    created_after: Optional[datetime.datetime] = None,
+    created_before: Optional[datetime.datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(
+        default=consts.Articles.DEFAULT_PAGE_ARTICLES_COUNT,
+        gt=0,
+        le=consts.Articles.MAX_PAGE_ARTICLES_COUNT,
+    ),
+) -> dto_response.DTOResponse:
+    """
+    Найти статьи по тексту, начиная с наиболее релевантных
+    :param search_query: поисковый запрос
+    :param topic_id: идентификатор темы статьи
+    :param user_id: идентификатор автора статьи
+    :param created_after: нижняя граница даты написания статьи
+    :param created_before: верхняя граница даты написания статьи
+    :param cursor: курсор, полученный с предыдущей страницей
+    :param limit: количество статей на странице
+    :return: страница найденных статей
+    """
+
+    try:
+        articles_page = await article_service.ArticleService.search_articles(
+            search_query,
+            article_dto.ArticleFilterDTO(
+                topic_id=topic_id,
+                user_id=user_id,
+                created_after=created_after,
+                created_before=created_before,
+            ),
+            limit,
+            cursor,
         )
-        for article in articles_result
-    ]
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return dto_response.DTOResponse(articles_page, article_dto.ArticlePageDTO)
+
+
+def __render_popular_articles(
+    articles: list[article_dto.ArticleDTO], etag: str
+) -> tuple[bytes, dict[str, str]]:
+    """
+    Подготовить тело и заголовки ответа со списком популярных статей
+    :param articles: популярные статьи
+    :param etag: ETag списка
+    :return: тело и заголовки ответа
+    """
+
+    body = dto_response.DTOResponse.serialize(articles, list[article_dto.ArticleDTO])
+    headers = {"ETag": etag, "Cache-Control": consts.Articles.HTTP_CACHE_CONTROL}
+
+    return body, headers
+
+
+@router.get("/popular", response_model=list[article_model.ArticleResultModel])
+async def retrieve_popular_articles(
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
+    """
+    Получить популярные статьи.
+    Ответ берется готовым из кэша и не сериализуется заново
+    :param if_none_match: ETag ранее полученного списка
+    :return: данные полученных статей или 304, если список не изменился
+    """
+
+    (
+        body,
+        headers,
+    ) = await article_service.ArticleService.retrieve_rendered_popular_articles(
+        "rest", __render_popular_articles
+    )
+
+    if etag_helper.is_etag_matched(
+        headers["ETag"], etag_helper.parse_if_none_match(if_none_match)
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        body, media_type=dto_response.DTOResponse.media_type, headers=headers
+    )
 
 
-@router.get("/{article_id}")
-async def retrieve_article(article_id: uuid.UUID) -> article_model.ArticleResultModel:
+@router.get("/{article_id}", response_model=article_model.ArticleResultModel)
+async def retrieve_article(
+    article_id: uuid.UUID,
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
     """
     Получить статью
     :param article_id: идентификатор статьи
-    :return: данные полученной статьи
+    :param if_none_match: ETag ранее полученной статьи
+    :return: данные полученной статьи или 304, если статья не изменилась
     """
 
-    article_result = await article_service.ArticleService.retrieve_article(article_id)
+    (
+        article_result,
+        etag,
+    ) = await article_service.ArticleService.retrieve_article_if_modified(
+        article_id, etag_helper.parse_if_none_match(if_none_match)
+    )
+    headers = {"ETag": etag, "Cache-Control": consts.Articles.HTTP_CACHE_CONTROL}
+
+    if article_result is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    return article_model.ArticleResultModel(
-        id=article_result.id,
-        user_id=article_result.user_id,
-        user_name=article_result.user_name,
-        creation_date=article_result.creation_date,
-        topic_id=article_result.topic_id,
-        topic_name=article_result.topic_name,
-        text=article_result.text,
-        views=article_result.views,
+    return dto_response.DTOResponse(
+        article_result, article_dto.ArticleDTO, headers=headers
     )
 
 
-@router.patch("/update")
+@router.patch("/update", response_model=article_model.ArticleResultModel)
 async def update_article(
     article_schema: article_model.ArticleUpdateModel,
-    access_token: str = Depends(token_dependency.get_access_token),
-) -> article_model.ArticleResultModel:
+    user: user_dto.PrincipalDTO = Depends(token_dependency.get_current_user),
+) -> dto_response.DTOResponse:
     """
     Обновить статью
     :param article_schema: исходные данные для обновления статьи
-    :param access_token: access-токен
+    :param user: данные пользователя
     :return: данные обновленной статьи
     """
 
-    jwt_manager = jwt_helper.JWTHelper()
-    payload = jwt_manager.get_payload_by_token(
-        access_token, consts.Auth.ACCESS_TOKEN_ATTRS
-    )
-
-    user = user_dto.UserInfoDTO(id=payload["sub"], name=payload["user_name"])
-
     article = article_dto.ArticleUpdateDTO(
         id=article_schema.id,
         user_id=user.id,
@@ -125,35 +273,19 @@ async def update_article(
 
     article_result = await article_service.ArticleService.update_article(user, article)
 
-    return article_model.ArticleResultModel(
-        id=article_result.id,
-        user_id=article_result.user_id,
-        user_name=article_result.user_name,
-        creation_date=article_result.creation_date,
-        topic_id=article_result.topic_id,
-        topic_name=article_result.topic_name,
-        text=article_result.text,
-        views=article_result.views,
-    )
+    return dto_response.DTOResponse(article_result, article_dto.ArticleDTO)
 
 
 @router.delete("/delete")
 async def delete_article(
     article_id: uuid.UUID = Query(alias="id"),
-    access_token: str = Depends(token_dependency.get_access_token),
+    user: user_dto.PrincipalDTO = Depends(token_dependency.get_current_user),
 ) -> None:
     """
     Удалить статью
     :param article_id: идентификатор статьи
-    :param access_token: access-токен
+    :param user: данные пользователя
     :return: данные обновленной статьи
     """
 
-    jwt_manager = jwt_helper.JWTHelper()
-    payload = jwt_manager.get_payload_by_token(
-        access_token, consts.Auth.ACCESS_TOKEN_ATTRS
-    )
-
-    user = user_dto.UserInfoDTO(id=payload["sub"], name=payload["user_name"])
-
     await article_service.ArticleService.delete_article(user, article_id)
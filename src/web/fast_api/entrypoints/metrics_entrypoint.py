@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Response
+
+from tools import metrics_helper
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def retrieve_metrics() -> Response:
+    """
+    Получить метрики приложения в текстовом формате Prometheus
+    :return: метрики
+    """
+
+    return Response(
+        metrics_helper.registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
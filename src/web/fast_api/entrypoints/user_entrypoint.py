@@ -2,8 +2,8 @@ import uuid
 
 from fastapi import APIRouter, Depends
 
+from dto import user_dto
 from services import user_service
-from tools import consts, jwt_helper
 from web.fast_api.dependencies import token_dependency
 from web.fast_api.models.user import user_model
 
@@ -12,23 +12,16 @@ router = APIRouter(prefix="/users")
 
 @router.get("/me")
 async def get_my_user_data(
-    access_token: str = Depends(token_dependency.get_access_token),
+    user: user_dto.PrincipalDTO = Depends(token_dependency.get_current_user),
 ) -> user_model.UserModel:
     """
     Получить свои данные
-    :param access_token: access-токен
+    :param user: данные пользователя
     :return: информация о пользователе
     """
 
-    jwt_manager = jwt_helper.JWTHelper()
-    payload = jwt_manager.get_payload_by_token(
-        access_token, consts.Auth.ACCESS_TOKEN_ATTRS
-    )
-
     return user_model.UserModel(
-        id=payload["sub"],
-        name=payload["user_name"],
-        registration_date=payload["registration_date"],
+        id=user.id, name=user.name, registration_date=user.registration_date
     )
 
 
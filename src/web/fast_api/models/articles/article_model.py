@@ -50,3 +50,27 @@ class ArticleResultModel(base_dto.BaseModel):
         description="Текст статьи", max_length=consts.Articles.MAX_ARTICLE_LENGTH
     )
     views: int = Field(description="Количество просмотров")
+
+
+class ArticleBulkCreateResultModel(base_dto.BaseModel):
+    """
+    Модель данных о результате создания одной статьи из пакета
+    """
+
+    article: Optional[ArticleResultModel] = Field(
+        description="Созданная статья", default=None
+    )
+    error: Optional[str] = Field(
+        description="Причина, по которой статья не была создана", default=None
+    )
+
+
+class ArticlePageModel(base_dto.BaseModel):
+    """
+    Модель данных о странице списка статей
+    """
+
+    articles: list[ArticleResultModel] = Field(description="Статьи страницы")
+    next_cursor: Optional[str] = Field(
+        description="Курсор следующей страницы", default=None
+    )
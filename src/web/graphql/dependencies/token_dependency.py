@@ -1,14 +1,72 @@
+import uuid
+
+from strawberry.dataloader import DataLoader
 from strawberry.fastapi import BaseContext
 
+from dto import user_dto
+from services import topic_service, user_service
 from tools import consts
+from web.graphql.models import article_models, user_models
 from web.tools import token_validator
 
 
 class TokenDependency(BaseContext):
     """
-    Класс зависимости для получения токена
+    Класс зависимости для получения токена и загрузчиков данных запроса
     """
 
+    def __init__(self) -> None:
+        """
+        Инициализировать переменные
+        """
+
+        super().__init__()
+
+        self.user_loader = DataLoader(load_fn=self.__load_users)
+        self.topic_loader = DataLoader(load_fn=self.__load_topics)
+
+    @staticmethod
+    async def __load_users(
+        user_ids: list[uuid.UUID],
+    ) -> list[user_models.UserModelBase | ValueError]:
+        """
+        Получить пользователей одним запросом
+        :param user_ids: идентификаторы пользователей
+        :return: пользователи в порядке идентификаторов
+        """
+
+        users = await user_service.UserService.get_users(user_ids)
+
+        return [
+            (
+                user_models.UserModelBase(id=user.id, name=user.name)
+                if user is not None
+                else ValueError("Пользователь не найден")
+            )
+            for user in users
+        ]
+
+    @staticmethod
+    async def __load_topics(
+        topic_ids: list[uuid.UUID],
+    ) -> list[article_models.TopicType | ValueError]:
+        """
+        Получить темы статей из каталога
+        :param topic_ids: идентификаторы тем статей
+        :return: темы статей в порядке идентификаторов
+        """
+
+        topics = []
+
+        for topic_id in topic_ids:
+            try:
+                topic = await topic_service.TopicService.retrieve_topic(topic_id)
+                topics.append(article_models.TopicType(id=topic.id, name=topic.name))
+            except ValueError as error:
+                topics.append(error)
+
+        return topics
+
     def __get_token(self) -> str | None:
         """
         Получить токен из запроса
@@ -20,20 +78,21 @@ class TokenDependency(BaseContext):
 
         return self.request.headers["Authorization"]
 
-    def get_access_token(self) -> str | None:
+    def get_current_user(self) -> user_dto.PrincipalDTO:
         """
-        Получить access-токен
-        :return: access-токен
+        Получить данные пользователя, аутентифицированного по access-токену
+        :return: данные пользователя
         """
 
-        token = self.__get_token()
-
-        return (
-            token_validator.validate_token(token, consts.Auth.ACCESS_TOKEN_ATTRS)
-            if token
-            else None
+        principal = (
+            getattr(self.request.state, "principal", None) if self.request else None
         )
 
+        if principal is None:
+            raise ValueError("Пользователь не авторизован")
+
+        return principal
+
     def get_refresh_token(self) -> str | None:
         """
         Получить refresh-токен
@@ -1,13 +1,25 @@
+import datetime
+from typing import Optional
 import uuid
 
 import strawberry
 from strawberry.fastapi import GraphQLRouter
 
-from dto import article_dto, user_dto
+from dto import article_dto
 from services import article_service
-from tools import consts, jwt_helper
+from tools import consts
+from web.graphql import selection_helper
 from web.graphql.dependencies import token_dependency
-from web.graphql.models import article_models, user_models
+from web.graphql.models import article_models
+
+ARTICLE_FIELD_COLUMNS = {
+    "id": "id",
+    "creationDate": "creation_date",
+    "text": "text",
+    "views": "views",
+    "user": "user_id",
+    "topic": "topic_id",
+}
 
 
 @strawberry.type
@@ -32,44 +44,184 @@ class ArticleQuery:
 
         return article_models.ArticleType(
             id=article_result.id,
-            user=user_models.UserModelBase(
-                id=article_result.user_id, name=article_result.user_name
-            ),
+            user_id=article_result.user_id,
+            user_name=article_result.user_name,
             creation_date=article_result.creation_date,
-            topic=article_models.TopicType(
-                id=article_result.topic_id, name=article_result.topic_name
-            ),
+            topic_id=article_result.topic_id,
+            topic_name=article_result.topic_name,
             text=article_result.text,
             views=article_result.views,
         )
 
     @strawberry.field
-    async def get_popular_articles(self) -> list[article_models.ArticleType]:
+    async def articles_by_ids(
+        self, article_ids: list[uuid.UUID]
+    ) -> list[article_models.ArticleType]:
         """
-        Получить популярные статьи
-        :return: список популярных статей
+        Получить записи статей по их идентификаторам
+        :param article_ids: идентификаторы статей
+        :return: данные найденных статей в порядке запроса
         """
 
-        articles_result = (
-            await article_service.ArticleService.retrieve_popular_articles()
+        if len(article_ids) > consts.Articles.MAX_BATCH_ARTICLES_COUNT:
+            raise ValueError("Превышено максимальное количество статей в запросе")
+
+        articles_result = await article_service.ArticleService.retrieve_articles(
+            article_ids
         )
 
         return [
             article_models.ArticleType(
                 id=article.id,
-                user=user_models.UserModelBase(
-                    id=article.user_id, name=article.user_name
-                ),
+                user_id=article.user_id,
+                user_name=article.user_name,
                 creation_date=article.creation_date,
-                topic=article_models.TopicType(
-                    id=article.topic_id, name=article.topic_name
-                ),
+                topic_id=article.topic_id,
+                topic_name=article.topic_name,
                 text=article.text,
                 views=article.views,
             )
             for article in articles_result
         ]
 
+    @strawberry.field
+    async def articles(
+        self,
+        info: strawberry.Info,
+        topic_id: Optional[uuid.UUID] = None,
+        user_id: Optional[uuid.UUID] = None,
+        created_after: Optional[datetime.datetime] = None,
+        created_before: Optional[datetime.datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = consts.Articles.DEFAULT_PAGE_ARTICLES_COUNT,
+    ) -> article_models.ArticlePageType:
+        """
+        Получить страницу списка статей, начиная с новых
+        :param topic_id: идентификатор темы статьи
+        :param user_id: идентификатор автора статьи
+        :param created_after: нижняя граница даты написания статьи
+        :param created_before: верхняя граница даты написания статьи
+        :param cursor: курсор, полученный с предыдущей страницей
+        :param limit: количество статей на странице
+        :return: страница статей
+        """
+
+        columns = selection_helper.get_page_columns(
+            info, "articles", ARTICLE_FIELD_COLUMNS
+        )
+
+        articles_page = await article_service.ArticleService.list_articles(
+            article_dto.ArticleFilterDTO(
+                topic_id=topic_id,
+                user_id=user_id,
+                created_after=created_after,
+                created_before=created_before,
+            ),
+            limit,
+            cursor,
+            columns,
+        )
+
+        return article_models.ArticlePageType(
+            articles=[
+                article_models.ArticleType(
+                    id=article.id,
+                    user_id=article.user_id,
+                    user_name=article.user_name,
+                    creation_date=article.creation_date,
+                    topic_id=article.topic_id,
+                    topic_name=article.topic_name,
+                    text=article.text,
+                    views=article.views,
+                )
+                for article in articles_page.articles
+            ],
+            next_cursor=articles_page.next_cursor,
+        )
+
+    @strawberry.field
+    async def search_articles(
+        self,
+        info: strawberry.Info,
+        query: str,
+        topic_id: Optional[uuid.UUID] = None,
+        user_id: Optional[uuid.UUID] = None,
+        created_after: Optional[datetime.datetime] = None,
+        created_before: Optional[datetime.datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = consts.Articles.DEFAULT_PAGE_ARTICLES_COUNT,
+    ) -> article_models.ArticlePageType:
+        """
+        Найти статьи по тексту, начиная с наиболее релевантных
+        :param query: поисковый запрос
+        :param topic_id: идентификатор темы статьи
+        :param user_id: идентификатор автора статьи
+        :param created_after: нижняя граница даты написания статьи
+        :param created_before: верхняя граница даты написания статьи
+        :param cursor: курсор, полученный с предыдущей страницей
+        :param limit: количество статей на странице
+        :return: страница найденных статей
+        """
+
+        columns = selection_helper.get_page_columns(
+            info, "articles", ARTICLE_FIELD_COLUMNS
+        )
+
+        articles_page = await article_service.ArticleService.search_articles(
+            query,
+            article_dto.ArticleFilterDTO(
+                topic_id=topic_id,
+                user_id=user_id,
+                created_after=created_after,
+                created_before=created_before,
+            ),
+            limit,
+            cursor,
+            columns,
+        )
+
+        return article_models.ArticlePageType(
+            articles=[
+                article_models.ArticleType(
+                    id=article.id,
+                    user_id=article.user_id,
+                    user_name=article.user_name,
+                    creation_date=article.creation_date,
+                    topic_id=article.topic_id,
+                    topic_name=article.topic_name,
+                    text=article.text,
+                    views=article.views,
+                )
+                for article in articles_page.articles
+            ],
+            next_cursor=articles_page.next_cursor,
+        )
+
+    @strawberry.field
+    async def get_popular_articles(self) -> list[article_models.ArticleType]:
+        """
+        Получить популярные статьи.
+        Объекты ответа берутся готовыми из кэша
+        :return: список популярных статей
+        """
+
+        return await article_service.ArticleService.retrieve_rendered_popular_articles(
+            "graphql",
+            lambda articles, _: [
+                article_models.ArticleType(
+                    id=article.id,
+                    user_id=article.user_id,
+                    user_name=article.user_name,
+                    creation_date=article.creation_date,
+                    topic_id=article.topic_id,
+                    topic_name=article.topic_name,
+                    text=article.text,
+                    views=article.views,
+                )
+                for article in articles
+            ],
+        )
+
 
 @strawberry.type
 class ArticleMutation:
@@ -90,14 +242,7 @@ class ArticleMutation:
         :return: данные полученной статьи
         """
 
-        token = context_info.context.get_access_token()
-
-        jwt_manager = jwt_helper.JWTHelper()
-        payload = jwt_manager.get_payload_by_token(
-            token, consts.Auth.ACCESS_TOKEN_ATTRS
-        )
-
-        user = user_dto.UserInfoDTO(id=payload["sub"], name=payload["user_name"])
+        user = context_info.context.get_current_user()
         article = article_dto.ArticleCreateDTO(
             id=uuid.uuid4(),
             user_id=user.id,
@@ -111,17 +256,65 @@ class ArticleMutation:
 
         return article_models.ArticleType(
             id=article_result.id,
-            user=user_models.UserModelBase(
-                id=article_result.user_id, name=article_result.user_name
-            ),
+            user_id=article_result.user_id,
+            user_name=article_result.user_name,
             creation_date=article_result.creation_date,
-            topic=article_models.TopicType(
-                id=article_result.topic_id, name=article_result.topic_name
-            ),
+            topic_id=article_result.topic_id,
+            topic_name=article_result.topic_name,
             text=article_result.text,
             views=article_result.views,
         )
 
+    @strawberry.field
+    async def create_articles(
+        self,
+        articles_info: list[article_models.ArticleCreateInput],
+        context_info: strawberry.Info[token_dependency.TokenDependency],
+    ) -> list[article_models.ArticleCreateResultType]:
+        """
+        Создать несколько записей статей
+        :param articles_info: исходные данные для создания статей
+        :param context_info: информация из контекста запроса
+        :return: результаты создания статей в порядке запроса
+        """
+
+        if len(articles_info) > consts.Articles.MAX_BULK_ARTICLES_COUNT:
+            raise ValueError("Превышено максимальное количество статей в запросе")
+
+        user = context_info.context.get_current_user()
+        articles = [
+            article_dto.ArticleCreateDTO(
+                id=uuid.uuid4(),
+                user_id=user.id,
+                topic_id=article_info.topic_id,
+                text=article_info.text,
+            )
+            for article_info in articles_info
+        ]
+
+        results = await article_service.ArticleService.create_articles(user, articles)
+
+        return [
+            article_models.ArticleCreateResultType(
+                article=(
+                    article_models.ArticleType(
+                        id=result.article.id,
+                        user_id=result.article.user_id,
+                        user_name=result.article.user_name,
+                        creation_date=result.article.creation_date,
+                        topic_id=result.article.topic_id,
+                        topic_name=result.article.topic_name,
+                        text=result.article.text,
+                        views=result.article.views,
+                    )
+                    if result.article is not None
+                    else None
+                ),
+                error=result.error,
+            )
+            for result in results
+        ]
+
     @strawberry.field
     async def update_article(
         self,
@@ -135,14 +328,7 @@ class ArticleMutation:
         :return: данные полученной статьи
         """
 
-        token = context_info.context.get_access_token()
-
-        jwt_manager = jwt_helper.JWTHelper()
-        payload = jwt_manager.get_payload_by_token(
-            token, consts.Auth.ACCESS_TOKEN_ATTRS
-        )
-
-        user = user_dto.UserInfoDTO(id=payload["sub"], name=payload["user_name"])
+        user = context_info.context.get_current_user()
         article = article_dto.ArticleUpdateDTO(
             id=article_info.id,
             user_id=user.id,
@@ -156,13 +342,11 @@ class ArticleMutation:
 
         return article_models.ArticleType(
             id=article_result.id,
-            user=user_models.UserModelBase(
-                id=article_result.user_id, name=article_result.user_name
-            ),
+            user_id=article_result.user_id,
+            user_name=article_result.user_name,
             creation_date=article_result.creation_date,
-            topic=article_models.TopicType(
-                id=article_result.topic_id, name=article_result.topic_name
-            ),
+            topic_id=article_result.topic_id,
+            topic_name=article_result.topic_name,
             text=article_result.text,
             views=article_result.views,
         )
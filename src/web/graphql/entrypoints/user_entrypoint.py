@@ -4,7 +4,6 @@ import strawberry
 from strawberry.fastapi import GraphQLRouter
 
 from services import user_service
-from tools import consts, jwt_helper
 from web.graphql.dependencies import token_dependency
 from web.graphql.models import user_models
 
@@ -25,16 +24,10 @@ class UserQuery:
         :return: информация о пользователе
         """
 
-        jwt_manager = jwt_helper.JWTHelper()
-        access_token = context_info.context.get_access_token()
-        payload = jwt_manager.get_payload_by_token(
-            access_token, consts.Auth.ACCESS_TOKEN_ATTRS
-        )
+        user = context_info.context.get_current_user()
 
         return user_models.UserModel(
-            id=payload["sub"],
-            name=payload["user_name"],
-            registration_date=payload["registration_date"],
+            id=user.id, name=user.name, registration_date=user.registration_date
         )
 
     @strawberry.field
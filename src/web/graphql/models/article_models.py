@@ -20,16 +20,67 @@ class TopicType:
 @strawberry.type
 class ArticleType:
     """
-    Тип данных для статьи
+    Тип данных для статьи.
+    Автор и тема статьи получаются лениво: из уже известных данных,
+    либо через загрузчики из контекста запроса
     """
 
     id: uuid.UUID
-    user: user_models.UserModelBase
     creation_date: datetime.datetime = strawberry.field()
-    topic: TopicType
     text: str
     views: int
 
+    user_id: strawberry.Private[uuid.UUID]
+    topic_id: strawberry.Private[uuid.UUID]
+    user_name: strawberry.Private[Optional[str]] = None
+    topic_name: strawberry.Private[Optional[str]] = None
+
+    @strawberry.field
+    async def user(self, info: strawberry.Info) -> user_models.UserModelBase:
+        """
+        Получить автора статьи
+        :param info: информация о запросе
+        :return: автор статьи
+        """
+
+        if self.user_name is not None:
+            return user_models.UserModelBase(id=self.user_id, name=self.user_name)
+
+        return await info.context.user_loader.load(self.user_id)
+
+    @strawberry.field
+    async def topic(self, info: strawberry.Info) -> TopicType:
+        """
+        Получить тему статьи
+        :param info: информация о запросе
+        :return: тема статьи
+        """
+
+        if self.topic_name is not None:
+            return TopicType(id=self.topic_id, name=self.topic_name)
+
+        return await info.context.topic_loader.load(self.topic_id)
+
+
+@strawberry.type
+class ArticlePageType:
+    """
+    Тип данных для страницы списка статей
+    """
+
+    articles: list[ArticleType]
+    next_cursor: Optional[str] = None
+
+
+@strawberry.type
+class ArticleCreateResultType:
+    """
+    Тип данных для результата создания одной статьи из пакета
+    """
+
+    article: Optional[ArticleType] = None
+    error: Optional[str] = None
+
 
 @strawberry.input
 class ArticleCreateInput:
@@ -0,0 +1,43 @@
+import strawberry
+from strawberry.types.nodes import FragmentSpread, InlineFragment, Selection, SelectedField
+
+
+def get_selected_fields(selections: list[Selection]) -> dict[str, SelectedField]:
+    """
+    Получить поля, запрошенные клиентом, раскрыв фрагменты
+    :param selections: выборка полей из информации о запросе
+    :return: запрошенные поля по их именам
+    """
+
+    fields = {}
+
+    for selection in selections:
+        if isinstance(selection, (FragmentSpread, InlineFragment)):
+            fields.update(get_selected_fields(selection.selections))
+        else:
+            fields[selection.name] = selection
+
+    return fields
+
+
+def get_page_columns(
+    info: strawberry.Info, items_field: str, field_columns: dict[str, str]
+) -> set[str]:
+    """
+    Получить колонки записей страницы, поля которых запросил клиент
+    :param info: информация о запросе, возвращающем страницу
+    :param items_field: имя поля страницы со списком записей
+    :param field_columns: колонки записи по именам полей GraphQL
+    :return: колонки записи
+    """
+
+    page_fields = get_selected_fields(info.selected_fields[0].selections)
+    item_fields = get_selected_fields(
+        page_fields[items_field].selections if items_field in page_fields else []
+    )
+
+    return {
+        column
+        for field_name, column in field_columns.items()
+        if field_name in item_fields
+    }
@@ -0,0 +1,67 @@
+from jwt.exceptions import InvalidTokenError
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from dto import user_dto
+from tools import consts, jwt_helper
+
+
+class AuthMiddleware:
+    """
+    ASGI-middleware, один раз на запрос проверяющий access-токен
+    и сохраняющий данные пользователя в request.state.principal
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Инициализировать переменные
+        :param app: ASGI-приложение
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обработать запрос
+        :param scope: данные запроса
+        :param receive: функция получения сообщений
+        :param send: функция отправки сообщений
+        """
+
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["principal"] = self.__get_principal(
+                Headers(scope=scope).get("Authorization")
+            )
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def __get_principal(authorization: str | None) -> user_dto.PrincipalDTO | None:
+        """
+        Получить данные пользователя из заголовка авторизации
+        :param authorization: значение заголовка Authorization
+        :return: данные пользователя, если access-токен валиден, иначе - None
+        """
+
+        if not authorization:
+            return
+
+        scheme, _, token = authorization.partition(" ")
+
+        if not token:
+            token = scheme
+        elif scheme.lower() != "bearer":
+            return
+
+        try:
+            payload = jwt_helper.JWTHelper().get_payload_by_token(
+                token, consts.Auth.ACCESS_TOKEN_ATTRS
+            )
+
+            return user_dto.PrincipalDTO(
+                id=payload["sub"],
+                name=payload["user_name"],
+                registration_date=payload["registration_date"],
+            )
+        except (InvalidTokenError, KeyError):
+            return
@@ -0,0 +1,94 @@
+import time
+from typing import Callable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from tools import metrics_helper
+
+UNMATCHED_HANDLER = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI-middleware, учитывающий длительность обработки запросов по эндпоинтам.
+    Эндпоинт определяется по шаблону пути маршрута, а не по самому пути, чтобы
+    идентификаторы в путях не порождали новые метрики
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Инициализировать переменные
+        :param app: ASGI-приложение
+        """
+
+        self.app = app
+
+        self.__handlers: dict[Callable, str] = {}
+        self.__histograms: dict[str, dict[str, metrics_helper.Histogram]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обработать запрос
+        :param scope: данные запроса
+        :param receive: функция получения сообщений
+        :param send: функция отправки сообщений
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+
+            return
+
+        started_at = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.__get_histogram(scope).observe(time.perf_counter() - started_at)
+
+    def __get_histogram(self, scope: Scope) -> metrics_helper.Histogram:
+        """
+        Получить гистограмму эндпоинта, обработавшего запрос
+        :param scope: данные запроса
+        :return: гистограмма
+        """
+
+        handler = self.__get_handler(scope)
+        method = scope["method"]
+        histograms = self.__histograms.get(handler)
+
+        if histograms is None:
+            histograms = self.__histograms[handler] = {}
+
+        histogram = histograms.get(method)
+
+        if histogram is None:
+            histogram = histograms[method] = (
+                metrics_helper.HTTP_REQUEST_DURATION.labels(method, handler)
+            )
+
+        return histogram
+
+    def __get_handler(self, scope: Scope) -> str:
+        """
+        Получить шаблон пути маршрута, обработавшего запрос
+        :param scope: данные запроса
+        :return: шаблон пути или UNMATCHED_HANDLER, если маршрут не найден
+        """
+
+        endpoint = scope.get("endpoint")
+
+        if endpoint is None:
+            return UNMATCHED_HANDLER
+
+        handler = self.__handlers.get(endpoint)
+
+        if handler is None:
+            self.__handlers.update(
+                (route.endpoint, route.path)
+                for route in scope["app"].routes
+                if hasattr(route, "endpoint")
+            )
+            handler = self.__handlers.setdefault(endpoint, UNMATCHED_HANDLER)
+
+        return handler
@@ -4,6 +4,7 @@ from tools import enums
 from web.fast_api.entrypoints import (
     article_entrypoint as article_entrypoint_rest,
     auth_entrypoint as auth_entrypoint_rest,
+    metrics_entrypoint,
     user_entrypoint as user_entrypoint_rest,
 )
 from web.graphql.entrypoints import (
@@ -20,6 +21,8 @@ def register_routers(app: FastAPI, app_mode: enums.AppWorkingMode) -> None:
     :param app_mode: режим работы приложения
     """
 
+    app.include_router(metrics_entrypoint.router)
+
     match app_mode:
         case enums.AppWorkingMode.REST:
             app.include_router(article_entrypoint_rest.router)